@@ -1,7 +1,8 @@
 import asyncio
+import os
 from logging.config import fileConfig
 
-from sqlalchemy import pool
+from sqlalchemy import event, pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import create_async_engine
 from alembic import context
@@ -18,6 +19,32 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# deferred_migrations 는 migration 관리용 테이블(ORM 모델 없음) — autogenerate 가 drop 하지 않도록 제외
+_UNMANAGED_TABLES = {"deferred_migrations"}
+
+
+# migration 세션 타임아웃 — DB role/서버에 걸린 앱용 statement_timeout 이 긴 DDL 을 중간에 끊지 않도록 해제하고,
+# ACCESS EXCLUSIVE 를 기다리는 ALTER 가 긴 read 뒤에 줄 서서 뒤따르는 쓰기를 전부 막지 않도록 lock 대기를 제한.
+# lock_timeout 에 걸리면 해당 revision 만 롤백되므로 (transaction_per_migration) 다시 실행하면 된다.
+MIGRATION_SESSION_SETTINGS = {
+    "statement_timeout": "0",
+    "lock_timeout": os.environ.get("MIGRATION_LOCK_TIMEOUT", "5s"),
+    "idle_in_transaction_session_timeout": "60s",
+}
+
+
+def _apply_session_settings(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for name, value in MIGRATION_SESSION_SETTINGS.items():
+        cursor.execute(f"SET {name} = '{value}'")
+    cursor.close()
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == "table" and name in _UNMANAGED_TABLES:
+        return False
+    return True
+
 
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
@@ -26,13 +53,22 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
+        transaction_per_migration=True,
     )
     with context.begin_transaction():
         context.run_migrations()
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    # revision 단위 트랜잭션 — autocommit_block(CONCURRENTLY 인덱스 등)이
+    # 앞선 revision 들까지 한꺼번에 커밋하지 않도록 경계를 revision 마다 둔다.
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        transaction_per_migration=True,
+    )
     with context.begin_transaction():
         context.run_migrations()
 
@@ -48,6 +84,7 @@ async def run_async_migrations() -> None:
             "statement_cache_size": 0,
         },
     )
+    event.listen(connectable.sync_engine, "connect", _apply_session_settings)
     async with connectable.connect() as connection:
         await connection.run_sync(do_run_migrations)
     await connectable.dispose()
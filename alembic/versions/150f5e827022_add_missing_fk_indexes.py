@@ -0,0 +1,56 @@
+"""add missing FK indexes
+
+Revision ID: 150f5e827022
+Revises: 9c4e1b7d2a60
+Create Date: 2026-10-17 14:00:00.000000
+
+FK 컬럼은 PostgreSQL 이 자동으로 인덱스를 만들지 않아 CASCADE/SET NULL 삭제와
+역참조 조회가 seq scan 이 된다. 모델에 선언된 인덱스를 운영 DB 에 반영.
+- cl_instances: e1f2a3b4c5d6 의 인덱스가 be43ef1afc44(autogenerate)에서 빠졌던 것을 복구
+  + org 목록 조회용 (organization_id, work_date), template_id
+- evaluations: evaluator_id / store_id / template_id
+- notice_reads: user_id (uq_notice_read 는 notice_id 선두)
+- shift_presets, labor_law_settings: organization_id / store_id (/ shift_id)
+
+CONCURRENTLY 로 만들어 쓰기를 막지 않음. SKIP_HEAVY_MIGRATIONS=1 이면 deferred_migrations 에 기록.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils.deferred_migrations import discard_deferred, run_or_defer
+
+# revision identifiers, used by Alembic.
+revision: str = '150f5e827022'
+down_revision: Union[str, None] = '9c4e1b7d2a60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns)
+_INDEXES = (
+    ("ix_cl_instances_org_date", "cl_instances", "organization_id, work_date"),
+    ("ix_cl_instances_store_date", "cl_instances", "store_id, work_date"),
+    ("ix_cl_instances_user_date", "cl_instances", "user_id, work_date"),
+    ("ix_cl_instances_template_id", "cl_instances", "template_id"),
+    ("ix_evaluations_evaluator_id", "evaluations", "evaluator_id"),
+    ("ix_evaluations_store_id", "evaluations", "store_id"),
+    ("ix_evaluations_template_id", "evaluations", "template_id"),
+    ("ix_notice_reads_user_id", "notice_reads", "user_id"),
+    ("ix_shift_presets_organization_id", "shift_presets", "organization_id"),
+    ("ix_shift_presets_store_id", "shift_presets", "store_id"),
+    ("ix_shift_presets_shift_id", "shift_presets", "shift_id"),
+    ("ix_labor_law_settings_org_store", "labor_law_settings", "organization_id, store_id"),
+    ("ix_labor_law_settings_store_id", "labor_law_settings", "store_id"),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in _INDEXES:
+        run_or_defer(revision, f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
+
+
+def downgrade() -> None:
+    discard_deferred(revision)
+    with op.get_context().autocommit_block():
+        for name, _table, _columns in reversed(_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
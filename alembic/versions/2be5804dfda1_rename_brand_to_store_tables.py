@@ -0,0 +1,48 @@
+"""rename brand to store (1/4): tables
+
+Revision ID: 2be5804dfda1
+Revises: a1b2c3d4e5f6
+Create Date: 2026-02-19 00:00:00.000000
+
+brand → store rename 을 테이블 / 컬럼 / 인덱스 / 제약 단계별 revision 으로 분리.
+revision 마다 트랜잭션이 짧아 실패 시 해당 단계만 롤백된다.
+마지막 단계는 기존 revision ID(b1c2d3e4f5g6)를 유지 — 이미 적용된 DB 는 영향 없음.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2be5804dfda1"
+down_revision: Union[str, None] = "a1b2c3d4e5f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # --- 1. Rename tables ---
+    # DO 블록 하나로 한 번의 round-trip (asyncpg 는 ';' 로 이은 여러 statement 불가)
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            ALTER TABLE brands RENAME TO stores;
+            ALTER TABLE user_brands RENAME TO user_stores;
+        END
+        $$
+        """
+    )
+
+
+def downgrade() -> None:
+    # --- 1. Rename tables back ---
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            ALTER TABLE user_stores RENAME TO user_brands;
+            ALTER TABLE stores RENAME TO brands;
+        END
+        $$
+        """
+    )
@@ -18,24 +18,37 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    op.create_table('cl_item_reviews',
-        sa.Column('id', sa.Uuid(), nullable=False),
-        sa.Column('instance_id', sa.Uuid(), nullable=False),
-        sa.Column('item_index', sa.Integer(), nullable=False),
-        sa.Column('reviewer_id', sa.Uuid(), nullable=False),
-        sa.Column('result', sa.String(length=10), nullable=False),
-        sa.Column('comment', sa.Text(), nullable=True),
-        sa.Column('photo_url', sa.String(length=500), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
-        sa.ForeignKeyConstraint(['instance_id'], ['cl_instances.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['reviewer_id'], ['users.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('instance_id', 'item_index', name='uq_cl_item_review_instance_item'),
-    )
-    op.create_index('ix_cl_item_reviews_instance', 'cl_item_reviews', ['instance_id'])
+    # 인덱스 빌드 실패 후 재실행 시 테이블이 이미 커밋돼 있을 수 있음 — 있으면 건너뜀
+    existing_tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if 'cl_item_reviews' not in existing_tables:
+        op.create_table('cl_item_reviews',
+            sa.Column('id', sa.Uuid(), nullable=False),
+            sa.Column('instance_id', sa.Uuid(), nullable=False),
+            sa.Column('item_index', sa.Integer(), nullable=False),
+            sa.Column('reviewer_id', sa.Uuid(), nullable=False),
+            sa.Column('result', sa.String(length=10), nullable=False),
+            sa.Column('comment', sa.Text(), nullable=True),
+            sa.Column('photo_url', sa.String(length=500), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+            sa.ForeignKeyConstraint(['instance_id'], ['cl_instances.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['reviewer_id'], ['users.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('instance_id', 'item_index', name='uq_cl_item_review_instance_item'),
+        )
+    # 인덱스는 트랜잭션 밖에서 CONCURRENTLY 로 빌드 — 빌드 중에도 쓰기가 막히지 않음
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_cl_item_reviews_instance', 'cl_item_reviews', ['instance_id'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
-    op.drop_index('ix_cl_item_reviews_instance', table_name='cl_item_reviews')
-    op.drop_table('cl_item_reviews')
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_cl_item_reviews_instance', table_name='cl_item_reviews',
+            postgresql_concurrently=True, if_exists=True,
+        )
+    op.execute("DROP TABLE IF EXISTS cl_item_reviews")
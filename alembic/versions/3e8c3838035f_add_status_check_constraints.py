@@ -0,0 +1,47 @@
+"""add status check constraints
+
+Revision ID: 3e8c3838035f
+Revises: 63d3806aa858
+Create Date: 2026-10-17 17:00:00.000000
+
+고정 어휘 status 컬럼에 CHECK 제약 추가 (String + CHECK — staff_availability 와 같은 방식).
+NOT VALID 로 추가해 짧은 잠금만 잡고 커밋한 뒤, 기존 row 검증은 autocommit_block 안의
+VALIDATE 로 따로 (SHARE UPDATE EXCLUSIVE — 검증 스캔 중에도 쓰기 차단 없음).
+- evaluations.status: draft/submitted (스키마 Literal 로 이미 강제)
+- eval_templates.status: published/draft
+- cl_instances.status: pending/in_progress/completed — 구 work_assignments 에서 이전된
+  row 에 다른 값이 있을 수 있어 VALIDATE 하지 않음 (새 row/수정만 검사)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3e8c3838035f'
+down_revision: Union[str, None] = '63d3806aa858'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, constraint, condition, validate)
+_CHECKS = (
+    ("evaluations", "ck_evaluations_status", "status IN ('draft', 'submitted')", True),
+    ("eval_templates", "ck_eval_templates_status", "status IN ('published', 'draft')", True),
+    ("cl_instances", "ck_cl_instances_status", "status IN ('pending', 'in_progress', 'completed')", False),
+)
+
+
+def upgrade() -> None:
+    for table, name, condition, _validate in _CHECKS:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {name}")
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} CHECK ({condition}) NOT VALID")
+    # ADD 의 ACCESS EXCLUSIVE 잠금을 먼저 커밋으로 풀고, VALIDATE 는 별도 트랜잭션에서
+    # (SHARE UPDATE EXCLUSIVE — 검증 스캔 동안 읽기/쓰기 허용)
+    with op.get_context().autocommit_block():
+        for table, name, _condition, validate in _CHECKS:
+            if validate:
+                op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+
+def downgrade() -> None:
+    for table, name, _condition, _validate in reversed(_CHECKS):
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {name}")
@@ -0,0 +1,39 @@
+"""evaluations (org, evaluatee, created_at DESC) covering index
+
+Revision ID: 3f9a61c0d2e8
+Revises: 8273ad0a6deb
+Create Date: 2026-10-17 20:00:00.000000
+
+피평가자별 평가 목록(list_active evaluatee_id 필터)은 created_at DESC 정렬이라
+c2d3e4f5a6b7 의 ix_evaluations_org_evaluatee (organization_id, evaluatee_id) 로는 sort 가 필요했다.
+그 인덱스는 be43ef1afc44 에서 제거되어 현재 피평가자 목록은 ix_evaluations_evaluatee_id 에만 의존.
+(organization_id, evaluatee_id, created_at DESC) INCLUDE (status, submitted_at) 로
+정렬 없이 LIMIT 만큼만 읽고, status/submitted_at 만 보는 조회는 index-only scan 가능.
+ix_evaluations_evaluatee_id 는 users 삭제 시 SET NULL 역참조용으로 유지.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils.deferred_migrations import discard_deferred, run_or_defer
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a61c0d2e8'
+down_revision: Union[str, None] = '8273ad0a6deb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    run_or_defer(
+        revision,
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_evaluations_org_evaluatee_created "
+        "ON evaluations (organization_id, evaluatee_id, created_at DESC) "
+        "INCLUDE (status, submitted_at)",
+    )
+
+
+def downgrade() -> None:
+    discard_deferred(revision)
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_evaluations_org_evaluatee_created")
@@ -0,0 +1,62 @@
+"""recurrence_days jsonb → smallint bitmap
+
+Revision ID: 5d0c8e7a3f21
+Revises: 66760e5e6178
+Create Date: 2026-10-17 10:00:00.000000
+
+checklist_template_items / cl_instance_items 의 recurrence_days 를 JSONB 배열
+([0=Mon..6=Sun]) 에서 smallint 비트맵(bit n = 요일 n)으로 변경.
+row 당 2바이트, inline 저장, 읽을 때 JSON 파싱 없음. 모델은 WeekdayBitmap 으로 list[int] 유지.
+
+USING 절에는 서브쿼리를 쓸 수 없어서 새 컬럼 추가 → 백필 → 기존 컬럼 삭제 → rename 순서로 진행.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '5d0c8e7a3f21'
+down_revision: Union[str, None] = '66760e5e6178'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ("checklist_template_items", "cl_instance_items")
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.add_column(table, sa.Column('recurrence_days_bits', sa.SmallInteger(), nullable=True))
+        # 배열 → 비트맵. 0~6 범위 밖 값은 무시, 빈 배열은 0 (NULL 은 NULL 유지)
+        op.execute(
+            f"""
+            UPDATE {table}
+            SET recurrence_days_bits = (
+                SELECT COALESCE(bit_or(1 << d.v::int), 0)::smallint
+                FROM jsonb_array_elements_text(recurrence_days) AS d(v)
+                WHERE d.v ~ '^[0-6]$'
+            )
+            WHERE jsonb_typeof(recurrence_days) = 'array'
+            """
+        )
+        op.drop_column(table, 'recurrence_days')
+        op.alter_column(table, 'recurrence_days_bits', new_column_name='recurrence_days')
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.add_column(table, sa.Column('recurrence_days_json', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+        op.execute(
+            f"""
+            UPDATE {table}
+            SET recurrence_days_json = COALESCE(
+                (SELECT jsonb_agg(d ORDER BY d) FROM generate_series(0, 6) AS d
+                 WHERE recurrence_days & (1 << d) <> 0),
+                '[]'::jsonb
+            )
+            WHERE recurrence_days IS NOT NULL
+            """
+        )
+        op.drop_column(table, 'recurrence_days')
+        op.alter_column(table, 'recurrence_days_json', new_column_name='recurrence_days')
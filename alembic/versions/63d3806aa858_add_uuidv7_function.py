@@ -0,0 +1,36 @@
+"""add uuidv7() function
+
+Revision ID: 63d3806aa858
+Revises: bac601dfc2ee
+Create Date: 2026-10-17 16:00:00.000000
+
+시간 순 UUIDv7 을 만드는 uuidv7() SQL 함수 추가 (app/utils/uuid7.py).
+gen_random_uuid() server default 를 쓰던 PK(voices, permissions, role_permissions)를 uuidv7() 로 변경.
+모델 PK default 는 Python 쪽 uuid7() — raw SQL INSERT 만 이 함수를 쓴다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.uuid7 import UUIDV7_FUNCTION_SQL
+
+# revision identifiers, used by Alembic.
+revision: str = '63d3806aa858'
+down_revision: Union[str, None] = 'bac601dfc2ee'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_SERVER_DEFAULT_TABLES = ("voices", "permissions", "role_permissions")
+
+
+def upgrade() -> None:
+    op.execute(UUIDV7_FUNCTION_SQL.format(schema="public"))
+    for table in _SERVER_DEFAULT_TABLES:
+        op.alter_column(table, "id", server_default=sa.text("uuidv7()"))
+
+
+def downgrade() -> None:
+    for table in _SERVER_DEFAULT_TABLES:
+        op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
+    op.execute("DROP FUNCTION IF EXISTS public.uuidv7()")
@@ -0,0 +1,54 @@
+"""rename brand to store (3/4): indexes
+
+Revision ID: 64e2fc83a941
+Revises: c710cfe67bbd
+Create Date: 2026-02-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "64e2fc83a941"
+down_revision: Union[str, None] = "c710cfe67bbd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # --- 3. Rename indexes ---
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            ALTER INDEX IF EXISTS idx_brands_org RENAME TO idx_stores_org;
+            ALTER INDEX IF EXISTS idx_user_brands_user RENAME TO idx_user_stores_user;
+            ALTER INDEX IF EXISTS idx_user_brands_brand RENAME TO idx_user_stores_store;
+            ALTER INDEX IF EXISTS idx_shifts_brand RENAME TO idx_shifts_store;
+            ALTER INDEX IF EXISTS idx_positions_brand RENAME TO idx_positions_store;
+            ALTER INDEX IF EXISTS idx_work_assignments_brand_date RENAME TO idx_work_assignments_store_date;
+            ALTER INDEX IF EXISTS idx_announcements_brand RENAME TO idx_announcements_store;
+        END
+        $$
+        """
+    )
+
+
+def downgrade() -> None:
+    # --- 3. Rename indexes back ---
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            ALTER INDEX IF EXISTS idx_announcements_store RENAME TO idx_announcements_brand;
+            ALTER INDEX IF EXISTS idx_work_assignments_store_date RENAME TO idx_work_assignments_brand_date;
+            ALTER INDEX IF EXISTS idx_positions_store RENAME TO idx_positions_brand;
+            ALTER INDEX IF EXISTS idx_shifts_store RENAME TO idx_shifts_brand;
+            ALTER INDEX IF EXISTS idx_user_stores_store RENAME TO idx_user_brands_brand;
+            ALTER INDEX IF EXISTS idx_user_stores_user RENAME TO idx_user_brands_user;
+            ALTER INDEX IF EXISTS idx_stores_org RENAME TO idx_brands_org;
+        END
+        $$
+        """
+    )
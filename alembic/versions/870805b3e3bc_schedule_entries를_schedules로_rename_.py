@@ -16,6 +16,8 @@ from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 
+from app.utils.deferred_migrations import discard_deferred
+
 
 # revision identifiers, used by Alembic.
 revision: str = '870805b3e3bc'
@@ -36,6 +38,8 @@ def upgrade() -> None:
     # 먼저 FK constraint 제거
     op.drop_constraint("schedules_work_assignment_id_fkey", "schedules", type_="foreignkey")
     op.drop_table("schedules")
+    # 구 schedules 인덱스 중 아직 적용되지 않은 deferred 작업은 무의미 → 정리
+    discard_deferred("a2b3c4d5e6f7")
 
     # ─── Step 2: schedule_entries → schedules rename ─────────────────
 
@@ -0,0 +1,29 @@
+"""add deferred_migrations
+
+Revision ID: 9c4e1b7d2a60
+Revises: 5d0c8e7a3f21
+Create Date: 2026-10-17 12:00:00.000000
+
+SKIP_HEAVY_MIGRATIONS=1 로 미룬 무거운 statement 를 기록하는 관리용 테이블.
+앞선 revision 에서 defer() 가 이미 만들었을 수 있으므로 IF NOT EXISTS.
+적용은 scripts/apply_deferred_migrations.py (app/utils/deferred_migrations.py 참고).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils.deferred_migrations import CREATE_TABLE_SQL
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4e1b7d2a60'
+down_revision: Union[str, None] = '5d0c8e7a3f21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(CREATE_TABLE_SQL)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS deferred_migrations")
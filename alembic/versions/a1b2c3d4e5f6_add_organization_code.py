@@ -7,9 +7,6 @@ Create Date: 2026-02-18 00:00:00.000000
 """
 from typing import Sequence, Union
 
-import random
-import string
-
 from alembic import op
 import sqlalchemy as sa
 
@@ -21,34 +18,61 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def _generate_code() -> str:
-    chars = string.ascii_uppercase + string.digits
-    return "".join(random.choices(chars, k=6))
+# 6자리 대문자 코드 (hex → 0-9A-F, 회사 코드 문자셋의 부분집합).
+# gen_random_uuid() 는 서버의 암호학적 난수(CSPRNG)를 쓰고 row 마다 새로 평가됨.
+_CODE_EXPR = "upper(substr(md5(gen_random_uuid()::text), 1, 6))"
 
 
 def upgrade() -> None:
     # 1) Add column as nullable first
-    op.add_column("organizations", sa.Column("code", sa.String(6), nullable=True))
+    #    IF NOT EXISTS — VALIDATE 단계의 autocommit 이후 실패해도 그대로 재실행 가능
+    op.execute("ALTER TABLE organizations ADD COLUMN IF NOT EXISTS code VARCHAR(6)")
 
-    # 2) Assign unique codes to existing rows
+    # 2) Assign codes to existing rows — 한 번의 UPDATE 로 서버에서 생성 (row 별 round-trip 없음)
     conn = op.get_bind()
-    rows = conn.execute(sa.text("SELECT id FROM organizations")).fetchall()
-    used_codes: set[str] = set()
-    for row in rows:
-        code = _generate_code()
-        while code in used_codes:
-            code = _generate_code()
-        used_codes.add(code)
-        conn.execute(
-            sa.text("UPDATE organizations SET code = :code WHERE id = :id"),
-            {"code": code, "id": row[0]},
+    conn.execute(sa.text(f"UPDATE organizations SET code = {_CODE_EXPR} WHERE code IS NULL"))
+
+    # 충돌 해소 — 같은 code 중 첫 row 는 두고 나머지만 재생성.
+    # 탐지와 재생성을 한 statement 로 서버에서 처리, 갱신 row 가 0 이 될 때까지 반복
+    # (소규모 N 에서는 보통 0~1회).
+    reroll_duplicates = sa.text(
+        f"""
+        UPDATE organizations SET code = {_CODE_EXPR}
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (PARTITION BY code ORDER BY id) AS rn
+                FROM organizations
+            ) ranked
+            WHERE ranked.rn > 1
         )
+        """
+    )
+    while conn.execute(reroll_duplicates).rowcount:
+        pass
 
-    # 3) Make column NOT NULL and add unique constraint
+    # 3) Make column NOT NULL and add unique constraint without blocking writers
+    #    CHECK NOT VALID → VALIDATE (SHARE UPDATE EXCLUSIVE) → SET NOT NULL.
+    #    검증된 CHECK 가 있으면 SET NOT NULL 은 풀스캔 없이 끝남 (PG12+).
+    op.execute("ALTER TABLE organizations DROP CONSTRAINT IF EXISTS organizations_code_not_null")
+    op.execute(
+        "ALTER TABLE organizations ADD CONSTRAINT organizations_code_not_null "
+        "CHECK (code IS NOT NULL) NOT VALID"
+    )
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE organizations VALIDATE CONSTRAINT organizations_code_not_null")
+        op.create_index(
+            "uq_organizations_code", "organizations", ["code"],
+            unique=True, postgresql_concurrently=True, if_not_exists=True,
+        )
     op.alter_column("organizations", "code", nullable=False)
-    op.create_unique_constraint("uq_organizations_code", "organizations", ["code"])
+    op.drop_constraint("organizations_code_not_null", "organizations", type_="check")
+    # 미리 만든 인덱스를 제약으로 승격 — 카탈로그만 변경
+    op.execute(
+        "ALTER TABLE organizations ADD CONSTRAINT uq_organizations_code "
+        "UNIQUE USING INDEX uq_organizations_code"
+    )
 
 
 def downgrade() -> None:
-    op.drop_constraint("uq_organizations_code", "organizations", type_="unique")
-    op.drop_column("organizations", "code")
+    op.execute("ALTER TABLE organizations DROP CONSTRAINT IF EXISTS uq_organizations_code")
+    op.execute("ALTER TABLE organizations DROP COLUMN IF EXISTS code")
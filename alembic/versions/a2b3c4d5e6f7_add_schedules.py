@@ -15,6 +15,8 @@ from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import UUID
 
+from app.utils.deferred_migrations import defer, skip_heavy_migrations
+
 
 # revision identifiers, used by Alembic.
 revision: str = 'a2b3c4d5e6f7'
@@ -22,69 +24,108 @@ down_revision: Union[str, None] = 'f1a2b3c4d5e6'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# 인덱스를 제약으로 승격 — 이미 승격된 경우 건너뜀 (재실행 안전)
+# Attach the unique index as a constraint; a no-op when it is already attached
+_ATTACH_UNIQUE_SQL = (
+    "DO $$ BEGIN "
+    "IF NOT EXISTS (SELECT 1 FROM pg_constraint "
+    "WHERE conname = 'uq_schedule_user_store_date_shift') THEN "
+    "ALTER TABLE schedules ADD CONSTRAINT uq_schedule_user_store_date_shift "
+    "UNIQUE USING INDEX uq_schedule_user_store_date_shift; "
+    "END IF; END $$"
+)
+
+# SKIP_HEAVY_MIGRATIONS=1 이면 deferred_migrations 에 기록되어 배포 후 적용되는 SQL
+# Follow-up statements recorded for scripts/apply_deferred_migrations.py
+_DEFERRED_SQL = (
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_schedules_org_store_date "
+    "ON schedules (organization_id, store_id, work_date)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_schedules_user_date "
+    "ON schedules (user_id, work_date)",
+    "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_schedule_user_store_date_shift "
+    "ON schedules (user_id, store_id, work_date, shift_id)",
+    _ATTACH_UNIQUE_SQL,
+)
+
 
 def upgrade() -> None:
+    # 재실행 가능하도록 (autocommit_block 이후 실패 시) 이미 있는 객체는 건너뜀
+    # Idempotent DDL — skip objects left behind by a partially-committed run
+    existing_tables = set(sa.inspect(op.get_bind()).get_table_names())
+
     # schedules — 스케줄 초안 (SV가 작성, GM이 승인)
     # Schedule drafts (created by SV, approved by GM)
-    op.create_table(
-        'schedules',
-        sa.Column('id', UUID(as_uuid=True), primary_key=True),
-        sa.Column('organization_id', UUID(as_uuid=True), sa.ForeignKey('organizations.id', ondelete='CASCADE'), nullable=False),
-        sa.Column('store_id', UUID(as_uuid=True), sa.ForeignKey('stores.id', ondelete='CASCADE'), nullable=False),
-        sa.Column('user_id', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
-        sa.Column('shift_id', UUID(as_uuid=True), sa.ForeignKey('shifts.id', ondelete='SET NULL'), nullable=True),
-        sa.Column('position_id', UUID(as_uuid=True), sa.ForeignKey('positions.id', ondelete='SET NULL'), nullable=True),
-        sa.Column('work_date', sa.Date(), nullable=False),
-        sa.Column('start_time', sa.Time(), nullable=True),
-        sa.Column('end_time', sa.Time(), nullable=True),
-        sa.Column('status', sa.String(20), server_default='draft', nullable=False),
-        sa.Column('note', sa.Text(), nullable=True),
-        sa.Column('created_by', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
-        sa.Column('approved_by', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
-        sa.Column('approved_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('work_assignment_id', UUID(as_uuid=True), sa.ForeignKey('work_assignments.id', ondelete='SET NULL'), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
-    )
-
-    # 인덱스 — Indexes
-    op.create_index('ix_schedules_org_store_date', 'schedules', ['organization_id', 'store_id', 'work_date'])
-    op.create_index('ix_schedules_user_date', 'schedules', ['user_id', 'work_date'])
-
-    # 유니크 제약 — Unique constraint: 동일 사용자+매장+날짜+시프트 중복 방지
-    # Prevent duplicate scheduling for user+store+date+shift
-    op.create_unique_constraint(
-        'uq_schedule_user_store_date_shift',
-        'schedules',
-        ['user_id', 'store_id', 'work_date', 'shift_id'],
-    )
+    if 'schedules' not in existing_tables:
+        op.create_table(
+            'schedules',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column('organization_id', UUID(as_uuid=True), sa.ForeignKey('organizations.id', ondelete='CASCADE'), nullable=False),
+            sa.Column('store_id', UUID(as_uuid=True), sa.ForeignKey('stores.id', ondelete='CASCADE'), nullable=False),
+            sa.Column('user_id', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+            sa.Column('shift_id', UUID(as_uuid=True), sa.ForeignKey('shifts.id', ondelete='SET NULL'), nullable=True),
+            sa.Column('position_id', UUID(as_uuid=True), sa.ForeignKey('positions.id', ondelete='SET NULL'), nullable=True),
+            sa.Column('work_date', sa.Date(), nullable=False),
+            sa.Column('start_time', sa.Time(), nullable=True),
+            sa.Column('end_time', sa.Time(), nullable=True),
+            sa.Column('status', sa.String(20), server_default='draft', nullable=False),
+            sa.Column('note', sa.Text(), nullable=True),
+            sa.Column('created_by', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
+            sa.Column('approved_by', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
+            sa.Column('approved_at', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('work_assignment_id', UUID(as_uuid=True), sa.ForeignKey('work_assignments.id', ondelete='SET NULL'), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+
+    # 대량 데이터가 있는 DB 에서는 SKIP_HEAVY_MIGRATIONS=1 로 인덱스 빌드를 건너뛰고
+    # 배포 후 CONCURRENTLY 로 따로 만든다 (쓰기 차단 없음).
+    # Brownfield DBs defer the heavy builds to scripts/apply_deferred_migrations.py.
+    if skip_heavy_migrations():
+        for statement in _DEFERRED_SQL:
+            defer(revision, statement)
+    else:
+        # 인덱스 — Indexes
+        op.create_index('ix_schedules_org_store_date', 'schedules', ['organization_id', 'store_id', 'work_date'], if_not_exists=True)
+        op.create_index('ix_schedules_user_date', 'schedules', ['user_id', 'work_date'], if_not_exists=True)
+
+        # 유니크 제약 — Unique constraint: 동일 사용자+매장+날짜+시프트 중복 방지
+        # Prevent duplicate scheduling for user+store+date+shift.
+        # 인덱스는 CONCURRENTLY 로 먼저 만들고 제약으로 승격 (카탈로그만 변경)
+        with op.get_context().autocommit_block():
+            op.create_index(
+                'uq_schedule_user_store_date_shift', 'schedules',
+                ['user_id', 'store_id', 'work_date', 'shift_id'],
+                unique=True, postgresql_concurrently=True, if_not_exists=True,
+            )
+        op.execute(_ATTACH_UNIQUE_SQL)
 
     # schedule_approvals — 승인 이력 (audit trail)
     # Schedule approval records for audit trail
-    op.create_table(
-        'schedule_approvals',
-        sa.Column('id', UUID(as_uuid=True), primary_key=True),
-        sa.Column('schedule_id', UUID(as_uuid=True), sa.ForeignKey('schedules.id', ondelete='CASCADE'), nullable=False),
-        sa.Column('action', sa.String(20), nullable=False),
-        sa.Column('user_id', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
-        sa.Column('reason', sa.Text(), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
-    )
+    if 'schedule_approvals' not in existing_tables:
+        op.create_table(
+            'schedule_approvals',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column('schedule_id', UUID(as_uuid=True), sa.ForeignKey('schedules.id', ondelete='CASCADE'), nullable=False),
+            sa.Column('action', sa.String(20), nullable=False),
+            sa.Column('user_id', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
+            sa.Column('reason', sa.Text(), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
 
     # stores 테이블에 승인 필요 여부 컬럼 추가
     # Add require_approval column to stores table
-    op.add_column('stores', sa.Column('require_approval', sa.Boolean(), server_default=sa.text('true'), nullable=False))
+    op.execute("ALTER TABLE stores ADD COLUMN IF NOT EXISTS require_approval BOOLEAN DEFAULT true NOT NULL")
 
 
 def downgrade() -> None:
     # stores에서 require_approval 컬럼 제거
     # Remove require_approval column from stores
-    op.drop_column('stores', 'require_approval')
+    op.execute("ALTER TABLE stores DROP COLUMN IF EXISTS require_approval")
 
     # schedule_approvals 테이블 삭제
     # Drop schedule_approvals table
-    op.drop_table('schedule_approvals')
+    op.execute("DROP TABLE IF EXISTS schedule_approvals")
 
     # schedules 테이블 삭제 (인덱스, 유니크 제약은 테이블과 함께 삭제됨)
     # Drop schedules table (indexes and constraints are dropped with the table)
-    op.drop_table('schedules')
+    op.execute("DROP TABLE IF EXISTS schedules")
@@ -22,81 +22,114 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
+    # 아래 인덱스 단계가 autocommit 으로 테이블을 먼저 커밋하므로, 중간 실패 후
+    # 재실행 시 이미 만들어진 테이블은 건너뛴다. (Idempotent re-run)
+    existing_tables = set(sa.inspect(op.get_bind()).get_table_names())
+
     # qr_codes — 매장별 QR 코드 (one active per store)
     # QR codes per store for attendance scanning
-    op.create_table(
-        'qr_codes',
-        sa.Column('id', UUID(as_uuid=True), primary_key=True),
-        sa.Column('store_id', UUID(as_uuid=True), sa.ForeignKey('stores.id', ondelete='CASCADE'), nullable=False),
-        sa.Column('code', sa.String(64), nullable=False, unique=True),
-        sa.Column('is_active', sa.Boolean(), server_default=sa.text('true'), nullable=False),
-        sa.Column('created_by', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=True),
-    )
-
-    # QR 코드 인덱스 — QR code indexes
-    op.create_index('ix_qr_codes_store', 'qr_codes', ['store_id'])
+    if 'qr_codes' not in existing_tables:
+        op.create_table(
+            'qr_codes',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column('store_id', UUID(as_uuid=True), sa.ForeignKey('stores.id', ondelete='CASCADE'), nullable=False),
+            sa.Column('code', sa.String(64), nullable=False),
+            sa.Column('is_active', sa.Boolean(), server_default=sa.text('true'), nullable=False),
+            sa.Column('created_by', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column('expires_at', sa.DateTime(timezone=True), nullable=True),
+        )
 
     # attendances — 근태 기록 (one record per user per work date)
     # Attendance records for daily clock-in/out tracking
-    op.create_table(
-        'attendances',
-        sa.Column('id', UUID(as_uuid=True), primary_key=True),
-        sa.Column('organization_id', UUID(as_uuid=True), sa.ForeignKey('organizations.id', ondelete='CASCADE'), nullable=False),
-        sa.Column('store_id', UUID(as_uuid=True), sa.ForeignKey('stores.id', ondelete='CASCADE'), nullable=False),
-        sa.Column('user_id', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
-        sa.Column('work_date', sa.Date(), nullable=False),
-        sa.Column('clock_in', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('clock_in_timezone', sa.String(50), nullable=True),
-        sa.Column('break_start', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('break_end', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('clock_out', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('clock_out_timezone', sa.String(50), nullable=True),
-        sa.Column('status', sa.String(20), server_default='clocked_in', nullable=False),
-        sa.Column('total_work_minutes', sa.Integer(), nullable=True),
-        sa.Column('total_break_minutes', sa.Integer(), nullable=True),
-        sa.Column('note', sa.Text(), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
-    )
-
-    # 근태 인덱스 — Attendance indexes
-    op.create_index('ix_attendances_org_store_date', 'attendances', ['organization_id', 'store_id', 'work_date'])
-    op.create_index('ix_attendances_user_date', 'attendances', ['user_id', 'work_date'])
-
-    # 유니크 제약 — Unique constraint: 동일 사용자+날짜 중복 방지
-    # Prevent duplicate attendance for same user on same day
-    op.create_unique_constraint(
-        'uq_attendance_user_date',
-        'attendances',
-        ['user_id', 'work_date'],
-    )
+    if 'attendances' not in existing_tables:
+        op.create_table(
+            'attendances',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column('organization_id', UUID(as_uuid=True), sa.ForeignKey('organizations.id', ondelete='CASCADE'), nullable=False),
+            sa.Column('store_id', UUID(as_uuid=True), sa.ForeignKey('stores.id', ondelete='CASCADE'), nullable=False),
+            sa.Column('user_id', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+            sa.Column('work_date', sa.Date(), nullable=False),
+            sa.Column('clock_in', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('clock_in_timezone', sa.String(50), nullable=True),
+            sa.Column('break_start', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('break_end', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('clock_out', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('clock_out_timezone', sa.String(50), nullable=True),
+            sa.Column('status', sa.String(20), server_default='clocked_in', nullable=False),
+            sa.Column('total_work_minutes', sa.Integer(), nullable=True),
+            sa.Column('total_break_minutes', sa.Integer(), nullable=True),
+            sa.Column('note', sa.Text(), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
 
     # attendance_corrections — 근태 수정 이력
     # Attendance correction audit trail
-    op.create_table(
-        'attendance_corrections',
-        sa.Column('id', UUID(as_uuid=True), primary_key=True),
-        sa.Column('attendance_id', UUID(as_uuid=True), sa.ForeignKey('attendances.id', ondelete='CASCADE'), nullable=False),
-        sa.Column('field_name', sa.String(50), nullable=False),
-        sa.Column('original_value', sa.Text(), nullable=True),
-        sa.Column('corrected_value', sa.Text(), nullable=False),
-        sa.Column('reason', sa.Text(), nullable=False),
-        sa.Column('corrected_by', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=False),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    if 'attendance_corrections' not in existing_tables:
+        op.create_table(
+            'attendance_corrections',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column('attendance_id', UUID(as_uuid=True), sa.ForeignKey('attendances.id', ondelete='CASCADE'), nullable=False),
+            sa.Column('field_name', sa.String(50), nullable=False),
+            sa.Column('original_value', sa.Text(), nullable=True),
+            sa.Column('corrected_value', sa.Text(), nullable=False),
+            sa.Column('reason', sa.Text(), nullable=False),
+            sa.Column('corrected_by', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=False),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+
+    # 보조 인덱스 / 유니크 제약 — 테이블 DDL 이후 트랜잭션 밖에서 CONCURRENTLY 빌드
+    # Secondary indexes are deferred until after table DDL and built CONCURRENTLY
+    # so populated tables keep accepting writes during the build.
+    with op.get_context().autocommit_block():
+        # QR 코드 인덱스 — QR code indexes
+        op.create_index(
+            'ix_qr_codes_store', 'qr_codes', ['store_id'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        # QR 코드 유니크 — 모델의 unique=True 와 같은 이름(qr_codes_code_key)으로 만든 뒤 승격
+        op.create_index(
+            'qr_codes_code_key', 'qr_codes', ['code'],
+            unique=True, postgresql_concurrently=True, if_not_exists=True,
+        )
+        # 근태 인덱스 — Attendance indexes
+        op.create_index(
+            'ix_attendances_org_store_date', 'attendances', ['organization_id', 'store_id', 'work_date'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_attendances_user_date', 'attendances', ['user_id', 'work_date'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        # 유니크 제약용 인덱스 — 동일 사용자+날짜 중복 방지
+        # Backing index for the unique constraint (same user on same day)
+        op.create_index(
+            'uq_attendance_user_date', 'attendances', ['user_id', 'work_date'],
+            unique=True, postgresql_concurrently=True, if_not_exists=True,
+        )
+
+    # 이미 만들어진 인덱스를 제약으로 승격 — 메타데이터만 변경 (즉시 완료)
+    # Promote the prebuilt indexes to constraints (catalog-only, instant)
+    op.execute(
+        "ALTER TABLE qr_codes ADD CONSTRAINT qr_codes_code_key "
+        "UNIQUE USING INDEX qr_codes_code_key"
+    )
+    op.execute(
+        "ALTER TABLE attendances ADD CONSTRAINT uq_attendance_user_date "
+        "UNIQUE USING INDEX uq_attendance_user_date"
     )
 
 
 def downgrade() -> None:
     # attendance_corrections 테이블 삭제
     # Drop attendance_corrections table
-    op.drop_table('attendance_corrections')
+    op.execute("DROP TABLE IF EXISTS attendance_corrections")
 
     # attendances 테이블 삭제 (인덱스, 유니크 제약은 테이블과 함께 삭제됨)
     # Drop attendances table (indexes and constraints are dropped with the table)
-    op.drop_table('attendances')
+    op.execute("DROP TABLE IF EXISTS attendances")
 
     # qr_codes 테이블 삭제
     # Drop qr_codes table
-    op.drop_table('qr_codes')
+    op.execute("DROP TABLE IF EXISTS qr_codes")
@@ -0,0 +1,49 @@
+"""add partial status indexes
+
+Revision ID: bac601dfc2ee
+Revises: 150f5e827022
+Create Date: 2026-10-17 15:00:00.000000
+
+상태가 끝난(resolved/completed) row 가 대부분을 차지하는 테이블에 미처리 row 만 담는
+partial index 추가. 전체 status btree 보다 작고, 처리 완료 row 갱신 시 쓰기 비용도 없음.
+- voices (구 issue_reports): open/in_progress, org 별 최신순 목록
+- cl_instances: pending/in_progress, 매장+날짜
+
+CONCURRENTLY 로 만들어 쓰기를 막지 않음. SKIP_HEAVY_MIGRATIONS=1 이면 deferred_migrations 에 기록.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils.deferred_migrations import discard_deferred, run_or_defer
+
+# revision identifiers, used by Alembic.
+revision: str = 'bac601dfc2ee'
+down_revision: Union[str, None] = '150f5e827022'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = (
+    (
+        "ix_voices_org_active",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_voices_org_active "
+        "ON voices (organization_id, created_at) WHERE status IN ('open', 'in_progress')",
+    ),
+    (
+        "ix_cl_instances_active",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_cl_instances_active "
+        "ON cl_instances (store_id, work_date) WHERE status IN ('pending', 'in_progress')",
+    ),
+)
+
+
+def upgrade() -> None:
+    for _name, statement in _INDEXES:
+        run_or_defer(revision, statement)
+
+
+def downgrade() -> None:
+    discard_deferred(revision)
+    with op.get_context().autocommit_block():
+        for name, _statement in reversed(_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -18,10 +18,15 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    op.execute("UPDATE roles SET name = 'owner' WHERE level = 1")
-    op.execute("UPDATE roles SET name = 'general_manager' WHERE level = 2")
+    # 한 번의 UPDATE 로 두 레벨을 함께 처리 (테이블 1회 스캔)
+    op.execute(
+        "UPDATE roles SET name = CASE level WHEN 1 THEN 'owner' WHEN 2 THEN 'general_manager' END "
+        "WHERE level IN (1, 2)"
+    )
 
 
 def downgrade() -> None:
-    op.execute("UPDATE roles SET name = 'admin' WHERE level = 1")
-    op.execute("UPDATE roles SET name = 'manager' WHERE level = 2")
+    op.execute(
+        "UPDATE roles SET name = CASE level WHEN 1 THEN 'admin' WHEN 2 THEN 'manager' END "
+        "WHERE level IN (1, 2)"
+    )
@@ -0,0 +1,36 @@
+"""add attendances work_date BRIN
+
+Revision ID: c5d6aebac8a1
+Revises: 3e8c3838035f
+Create Date: 2026-10-17 18:00:00.000000
+
+attendances 는 출근 시점에 insert 되는 append-only 테이블이라 work_date 가 물리 순서와
+거의 일치한다. 대시보드/목록의 work_date 기간 조회용으로 BRIN 인덱스 추가
+(be43ef1afc44 에서 ix_attendances_org_store_date 가 빠진 뒤 날짜 인덱스가 없었음).
+BRIN 은 64 page 당 요약 1개라 크기가 KB 단위.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils.deferred_migrations import discard_deferred, run_or_defer
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d6aebac8a1'
+down_revision: Union[str, None] = '3e8c3838035f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    run_or_defer(
+        revision,
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_attendances_work_date_brin "
+        "ON attendances USING brin (work_date) WITH (pages_per_range = 64)",
+    )
+
+
+def downgrade() -> None:
+    discard_deferred(revision)
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_attendances_work_date_brin")
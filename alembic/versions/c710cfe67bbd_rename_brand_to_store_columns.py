@@ -0,0 +1,54 @@
+"""rename brand to store (2/4): brand_id columns
+
+Revision ID: c710cfe67bbd
+Revises: 2be5804dfda1
+Create Date: 2026-02-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c710cfe67bbd"
+down_revision: Union[str, None] = "2be5804dfda1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # --- 2. Rename brand_id columns to store_id ---
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            ALTER TABLE user_stores RENAME COLUMN brand_id TO store_id;
+            ALTER TABLE shifts RENAME COLUMN brand_id TO store_id;
+            ALTER TABLE positions RENAME COLUMN brand_id TO store_id;
+            ALTER TABLE checklist_templates RENAME COLUMN brand_id TO store_id;
+            ALTER TABLE work_assignments RENAME COLUMN brand_id TO store_id;
+            ALTER TABLE additional_tasks RENAME COLUMN brand_id TO store_id;
+            ALTER TABLE announcements RENAME COLUMN brand_id TO store_id;
+        END
+        $$
+        """
+    )
+
+
+def downgrade() -> None:
+    # --- 2. Rename store_id columns back to brand_id ---
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            ALTER TABLE announcements RENAME COLUMN store_id TO brand_id;
+            ALTER TABLE additional_tasks RENAME COLUMN store_id TO brand_id;
+            ALTER TABLE work_assignments RENAME COLUMN store_id TO brand_id;
+            ALTER TABLE checklist_templates RENAME COLUMN store_id TO brand_id;
+            ALTER TABLE positions RENAME COLUMN store_id TO brand_id;
+            ALTER TABLE shifts RENAME COLUMN store_id TO brand_id;
+            ALTER TABLE user_stores RENAME COLUMN store_id TO brand_id;
+        END
+        $$
+        """
+    )
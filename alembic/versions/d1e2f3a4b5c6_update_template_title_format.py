@@ -20,6 +20,7 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     # title을 '{store.name} - {shift.name} - {position.name}'으로 일괄 업데이트
+    # 이미 같은 title 인 row 는 건드리지 않음 (dead tuple/updated_at 변경 없음, 재실행 무비용)
     op.execute("""
         UPDATE checklist_templates AS ct
         SET title = s.name || ' - ' || sh.name || ' - ' || p.name,
@@ -30,6 +31,7 @@ def upgrade() -> None:
         WHERE ct.store_id = s.id
           AND ct.shift_id = sh.id
           AND ct.position_id = p.id
+          AND ct.title IS DISTINCT FROM s.name || ' - ' || sh.name || ' - ' || p.name
     """)
 
 
@@ -43,4 +45,5 @@ def downgrade() -> None:
              positions AS p
         WHERE ct.shift_id = sh.id
           AND ct.position_id = p.id
+          AND ct.title IS DISTINCT FROM sh.name || ' - ' || p.name
     """)
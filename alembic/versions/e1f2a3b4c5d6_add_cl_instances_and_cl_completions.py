@@ -8,15 +8,14 @@ Create Date: 2026-02-24 12:00:00.000000
 JSONB 스냅샷 기반에서 정규화된 테이블로 체크리스트 데이터를 분리 저장.
 기존 work_assignments.checklist_snapshot 데이터를 새 테이블로 이전.
 """
-import json
-import uuid
-from datetime import datetime, timezone
 from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 
+from app.utils.uuid7 import UUIDV7_FUNCTION_SQL
+
 
 # revision identifiers, used by Alembic.
 revision: str = 'e1f2a3b4c5d6'
@@ -24,17 +23,103 @@ down_revision: Union[str, None] = 'd1e2f3a4b5c6'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# (table, column, referent table, ondelete) — 데이터 이전 후 추가
+_FOREIGN_KEYS = (
+    ('cl_instances', 'organization_id', 'organizations', 'CASCADE'),
+    ('cl_instances', 'template_id', 'checklist_templates', 'SET NULL'),
+    ('cl_instances', 'work_assignment_id', 'work_assignments', 'CASCADE'),
+    ('cl_instances', 'store_id', 'stores', 'CASCADE'),
+    ('cl_instances', 'user_id', 'users', 'CASCADE'),
+    ('cl_completions', 'instance_id', 'cl_instances', 'CASCADE'),
+    ('cl_completions', 'user_id', 'users', 'CASCADE'),
+)
+
+# completed_at 문자열 → timestamptz. Python fromisoformat 처럼 offset 은 무시하고
+# 로컬 시간 그대로 UTC 로 저장, 파싱 실패 시 NULL (호출부에서 now() 로 대체).
+_CREATE_TRY_TS_SQL = """
+CREATE FUNCTION pg_temp.cl_try_ts(value text) RETURNS timestamptz AS $$
+BEGIN
+    RETURN value::timestamp AT TIME ZONE 'UTC';
+EXCEPTION WHEN others THEN
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE
+"""
+
+# 1) work_assignments → cl_instances
+# cl_instance status 매핑: work_assignment의 "assigned" → cl_instance의 "pending"
+_INSERT_INSTANCES_SQL = """
+INSERT INTO cl_instances
+    (id, organization_id, template_id, work_assignment_id, store_id,
+     user_id, work_date, snapshot, total_items, completed_items, status, created_at, updated_at)
+SELECT pg_temp.uuidv7(), wa.organization_id,
+       NULLIF(wa.checklist_snapshot->>'template_id', '')::uuid,
+       wa.id, wa.store_id, wa.user_id, wa.work_date, wa.checklist_snapshot,
+       COALESCE(wa.total_items, 0), COALESCE(wa.completed_items, 0),
+       CASE WHEN COALESCE(NULLIF(wa.status, ''), 'assigned') = 'assigned' THEN 'pending'
+            ELSE wa.status END,
+       COALESCE(wa.created_at, now()), COALESCE(wa.created_at, now())
+FROM work_assignments wa
+WHERE wa.checklist_snapshot ? 'items'
+"""
+
+# 2) 완료된 항목만 cl_completions로 이전
+# 기존 완료 시간: 로컬 시간 문자열 "2026-02-20T14:05" + 타임존 약어 "PST"
+# → 로컬 시간 그대로 UTC로 저장하고, completed_timezone에 IANA 타임존 기록
+#   (모르는 약어는 America/Los_Angeles, 약어가 없으면 NULL)
+# is_completed 는 JSON truthy 판정 (false/null/0/""/[]/{} 가 아니면 완료)
+_INSERT_COMPLETIONS_SQL = """
+WITH tz_map (abbrev, iana) AS (
+    VALUES ('PST', 'America/Los_Angeles'), ('PDT', 'America/Los_Angeles'),
+           ('MST', 'America/Denver'), ('MDT', 'America/Denver'),
+           ('CST', 'America/Chicago'), ('CDT', 'America/Chicago'),
+           ('EST', 'America/New_York'), ('EDT', 'America/New_York'),
+           ('KST', 'Asia/Seoul'), ('JST', 'Asia/Tokyo'),
+           ('UTC', 'UTC'), ('GMT', 'UTC')
+),
+items AS (
+    SELECT ci.id AS instance_id, ci.user_id,
+           COALESCE((item->>'item_index')::int, 0) AS item_index,
+           COALESCE(pg_temp.cl_try_ts(item->>'completed_at'), now()) AS completed_at,
+           NULLIF(item->>'completed_tz', '') AS completed_tz
+    FROM cl_instances ci
+    CROSS JOIN LATERAL jsonb_array_elements(ci.snapshot->'items') AS item
+    WHERE jsonb_typeof(ci.snapshot->'items') = 'array'
+      AND item->'is_completed' NOT IN (
+          'false'::jsonb, 'null'::jsonb, '0'::jsonb, '""'::jsonb, '[]'::jsonb, '{}'::jsonb
+      )
+)
+INSERT INTO cl_completions
+    (id, instance_id, item_index, user_id, completed_at, completed_timezone, created_at)
+SELECT pg_temp.uuidv7(), i.instance_id, i.item_index, i.user_id, i.completed_at,
+       CASE WHEN i.completed_tz IS NULL THEN NULL
+            ELSE COALESCE(m.iana, 'America/Los_Angeles') END,
+       i.completed_at
+FROM items i
+LEFT JOIN tz_map m ON m.abbrev = i.completed_tz
+"""
+
 
 def upgrade() -> None:
+    # 대량 이전 전용 세션 설정 (이 revision 트랜잭션 안에서만 유효)
+    # - 커밋은 마지막 1번뿐이라 WAL fsync 대기 불필요
+    # - 이전 후 인덱스/제약 빌드 정렬에 쓸 메모리
+    op.execute("SET LOCAL synchronous_commit = off")
+    op.execute("SET LOCAL maintenance_work_mem = '256MB'")
+
+    # 테이블은 PK 만 두고 먼저 만든다. FK/UNIQUE/인덱스는 데이터 이전 후 한 번에 생성
+    # (pg_dump 복원 순서) — row 마다 FK 트리거 검사·btree 갱신을 하지 않는다.
+    # DISABLE TRIGGER ALL 은 superuser 전용이라(관리형 DB 불가) 이 방식을 쓴다.
+
     # cl_instances — 체크리스트 인스턴스 (배정 1건당 1개)
     op.create_table(
         'cl_instances',
         sa.Column('id', UUID(as_uuid=True), primary_key=True),
-        sa.Column('organization_id', UUID(as_uuid=True), sa.ForeignKey('organizations.id', ondelete='CASCADE'), nullable=False),
-        sa.Column('template_id', UUID(as_uuid=True), sa.ForeignKey('checklist_templates.id', ondelete='SET NULL'), nullable=True),
-        sa.Column('work_assignment_id', UUID(as_uuid=True), sa.ForeignKey('work_assignments.id', ondelete='CASCADE'), nullable=False, unique=True),
-        sa.Column('store_id', UUID(as_uuid=True), sa.ForeignKey('stores.id', ondelete='CASCADE'), nullable=False),
-        sa.Column('user_id', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('organization_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('template_id', UUID(as_uuid=True), nullable=True),
+        sa.Column('work_assignment_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('store_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', UUID(as_uuid=True), nullable=False),
         sa.Column('work_date', sa.Date(), nullable=False),
         sa.Column('snapshot', JSONB, nullable=False),
         sa.Column('total_items', sa.Integer(), server_default='0'),
@@ -48,126 +133,42 @@ def upgrade() -> None:
     op.create_table(
         'cl_completions',
         sa.Column('id', UUID(as_uuid=True), primary_key=True),
-        sa.Column('instance_id', UUID(as_uuid=True), sa.ForeignKey('cl_instances.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('instance_id', UUID(as_uuid=True), nullable=False),
         sa.Column('item_index', sa.Integer(), nullable=False),
-        sa.Column('user_id', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('user_id', UUID(as_uuid=True), nullable=False),
         sa.Column('completed_at', sa.DateTime(timezone=True), nullable=False),
         sa.Column('completed_timezone', sa.String(50), nullable=True),
         sa.Column('photo_url', sa.String(500), nullable=True),
         sa.Column('note', sa.Text(), nullable=True),
         sa.Column('location', JSONB, nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.UniqueConstraint('instance_id', 'item_index', name='uq_cl_completion_instance_item'),
     )
 
-    # 인덱스 — cl_instances 검색 최적화
-    op.create_index('ix_cl_instances_org_id', 'cl_instances', ['organization_id'])
-    op.create_index('ix_cl_instances_store_date', 'cl_instances', ['store_id', 'work_date'])
-    op.create_index('ix_cl_instances_user_date', 'cl_instances', ['user_id', 'work_date'])
-
     # ─── 기존 JSONB 데이터 이전 ────────────────────────────────────────────────
     # work_assignments에서 checklist_snapshot이 있는 모든 row를 cl_instances로 이전
     # 완료된 항목(is_completed=true)만 cl_completions로 이전
 
-    conn = op.get_bind()
-
-    # 1) work_assignments → cl_instances
-    assignments = conn.execute(
-        sa.text("""
-            SELECT id, organization_id, store_id, user_id, work_date,
-                   checklist_snapshot, total_items, completed_items, status, created_at
-            FROM work_assignments
-            WHERE checklist_snapshot IS NOT NULL
-        """)
-    ).fetchall()
-
-    for wa in assignments:
-        snapshot = wa.checklist_snapshot
-        if not snapshot or "items" not in snapshot:
-            continue
-
-        instance_id = uuid.uuid4()
-
-        # template_id 추출 (snapshot에 template_id가 있으면 사용)
-        template_id_str = snapshot.get("template_id")
-
-        # cl_instance status 매핑: work_assignment의 "assigned" → cl_instance의 "pending"
-        wa_status = wa.status or "assigned"
-        cl_status = "pending" if wa_status == "assigned" else wa_status
-
-        conn.execute(
-            sa.text("""
-                INSERT INTO cl_instances
-                    (id, organization_id, template_id, work_assignment_id, store_id,
-                     user_id, work_date, snapshot, total_items, completed_items, status, created_at, updated_at)
-                VALUES
-                    (:id, :org_id, :template_id, :wa_id, :store_id,
-                     :user_id, :work_date, :snapshot, :total_items, :completed_items, :status, :created_at, :created_at)
-            """),
-            {
-                "id": instance_id,
-                "org_id": wa.organization_id,
-                "template_id": uuid.UUID(template_id_str) if template_id_str else None,
-                "wa_id": wa.id,
-                "store_id": wa.store_id,
-                "user_id": wa.user_id,
-                "work_date": wa.work_date,
-                "snapshot": json.dumps(snapshot),
-                "total_items": wa.total_items or 0,
-                "completed_items": wa.completed_items or 0,
-                "status": cl_status,
-                "created_at": wa.created_at or datetime.now(timezone.utc),
-            },
+    # JSONB 파싱/필터링을 DB 안에서 set-based 로 처리 — Python 으로 row 를 가져오지 않음
+    # id 는 시간 순 UUIDv7 — PK btree 오른쪽 끝에만 삽입
+    op.execute(_CREATE_TRY_TS_SQL)
+    op.execute(UUIDV7_FUNCTION_SQL.format(schema="pg_temp"))
+    op.execute(_INSERT_INSTANCES_SQL)
+    op.execute(_INSERT_COMPLETIONS_SQL)
+    op.execute("DROP FUNCTION pg_temp.uuidv7()")
+    op.execute("DROP FUNCTION pg_temp.cl_try_ts(text)")
+
+    # ─── 이전 후 제약/인덱스 생성 (이름은 PostgreSQL 기본 명명과 동일) ─────────
+    op.create_unique_constraint('cl_instances_work_assignment_id_key', 'cl_instances', ['work_assignment_id'])
+    op.create_unique_constraint('uq_cl_completion_instance_item', 'cl_completions', ['instance_id', 'item_index'])
+    for table, column, referent, ondelete in _FOREIGN_KEYS:
+        op.create_foreign_key(
+            f'{table}_{column}_fkey', table, referent, [column], ['id'], ondelete=ondelete,
         )
 
-        # 2) 완료된 항목만 cl_completions로 이전
-        items = snapshot.get("items", [])
-        for item in items:
-            if not item.get("is_completed"):
-                continue
-
-            # 기존 완료 시간: 로컬 시간 문자열 "2026-02-20T14:05" + 타임존 "PST"
-            completed_at_str = item.get("completed_at")
-            completed_tz = item.get("completed_tz")
-
-            # completed_at을 UTC TIMESTAMPTZ로 변환
-            # 기존 데이터는 로컬 시간 문자열이므로 정확한 UTC 변환은 어려움
-            # → 로컬 시간 그대로 UTC로 저장하고, completed_timezone에 타임존 기록
-            if completed_at_str:
-                try:
-                    completed_at = datetime.fromisoformat(completed_at_str).replace(tzinfo=timezone.utc)
-                except (ValueError, TypeError):
-                    completed_at = datetime.now(timezone.utc)
-            else:
-                completed_at = datetime.now(timezone.utc)
-
-            # IANA 타임존으로 변환 (약어 → IANA 매핑)
-            tz_abbrev_to_iana = {
-                "PST": "America/Los_Angeles", "PDT": "America/Los_Angeles",
-                "MST": "America/Denver", "MDT": "America/Denver",
-                "CST": "America/Chicago", "CDT": "America/Chicago",
-                "EST": "America/New_York", "EDT": "America/New_York",
-                "KST": "Asia/Seoul", "JST": "Asia/Tokyo",
-                "UTC": "UTC", "GMT": "UTC",
-            }
-            iana_tz = tz_abbrev_to_iana.get(completed_tz, "America/Los_Angeles") if completed_tz else None
-
-            conn.execute(
-                sa.text("""
-                    INSERT INTO cl_completions
-                        (id, instance_id, item_index, user_id, completed_at, completed_timezone, created_at)
-                    VALUES
-                        (:id, :instance_id, :item_index, :user_id, :completed_at, :completed_timezone, :completed_at)
-                """),
-                {
-                    "id": uuid.uuid4(),
-                    "instance_id": instance_id,
-                    "item_index": item.get("item_index", 0),
-                    "user_id": wa.user_id,
-                    "completed_at": completed_at,
-                    "completed_timezone": iana_tz,
-                },
-            )
+    # 인덱스 — cl_instances 검색 최적화
+    op.create_index('ix_cl_instances_org_id', 'cl_instances', ['organization_id'])
+    op.create_index('ix_cl_instances_store_date', 'cl_instances', ['store_id', 'work_date'])
+    op.create_index('ix_cl_instances_user_date', 'cl_instances', ['user_id', 'work_date'])
 
 
 def downgrade() -> None:
@@ -0,0 +1,45 @@
+"""attendances list indexes (org / store / user + work_date DESC)
+
+Revision ID: ea6b4a74b22d
+Revises: 3f9a61c0d2e8
+Create Date: 2026-10-17 22:00:00.000000
+
+근태 목록(console list_attendances, app 본인 목록, 주간 요약)은 organization_id 에
+store_id / user_id 필터를 더해 work_date DESC, created_at DESC 로 페이지네이션하는데,
+attendances 에는 schedule_id 와 work_date BRIN 인덱스만 있어 org 전체를 읽고 정렬했다.
+cl_instances 와 같은 구성으로 org / store / user 별 (…, work_date DESC) 인덱스를 추가.
+store_id / user_id 인덱스는 매장·사용자 삭제 시 CASCADE 역참조 seq scan 도 없앤다.
+uq_attendance_walkin (user_id, work_date) 은 schedule_id IS NULL partial 이라 대체 불가.
+
+CONCURRENTLY 로 만들어 쓰기를 막지 않음. SKIP_HEAVY_MIGRATIONS=1 이면 deferred_migrations 에 기록.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils.deferred_migrations import discard_deferred, run_or_defer
+
+# revision identifiers, used by Alembic.
+revision: str = 'ea6b4a74b22d'
+down_revision: Union[str, None] = '3f9a61c0d2e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, columns)
+_INDEXES = (
+    ("ix_attendances_org_date", "organization_id, work_date DESC, created_at DESC"),
+    ("ix_attendances_store_date", "store_id, work_date DESC"),
+    ("ix_attendances_user_date", "user_id, work_date DESC, created_at DESC"),
+)
+
+
+def upgrade() -> None:
+    for name, columns in _INDEXES:
+        run_or_defer(revision, f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON attendances ({columns})")
+
+
+def downgrade() -> None:
+    discard_deferred(revision)
+    with op.get_context().autocommit_block():
+        for name, _columns in reversed(_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -22,7 +22,7 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 # 34개 permission 정의
-PERMISSIONS = [
+PERMISSIONS = (
     ("stores:create", "stores", "create", "매장 생성", False),
     ("stores:read", "stores", "read", "매장 조회", False),
     ("stores:update", "stores", "update", "매장 수정", False),
@@ -57,20 +57,20 @@ PERMISSIONS = [
     ("tasks:delete", "tasks", "delete", "업무 삭제", False),
     ("dashboard:read", "dashboard", "read", "대시보드 조회", False),
     ("audit_log:read", "audit_log", "read", "감사 로그 조회", False),
-]
+)
 
 # 역할별 기본 permission (priority 기반)
 # Owner(10): 전체 34개
 # GM(20): stores:create, stores:delete, roles:create, roles:delete 제외 = 30개
 # SV(30): read 위주 + schedules:create = 10개
 # Staff(40): 0개
-GM_EXCLUDED = {"stores:create", "stores:delete", "roles:create", "roles:delete"}
-SV_ALLOWED = {
+GM_EXCLUDED = frozenset({"stores:create", "stores:delete", "roles:create", "roles:delete"})
+SV_ALLOWED = frozenset({
     "stores:read", "users:read", "roles:read",
     "schedules:read", "schedules:create",
     "announcements:read", "checklists:read", "tasks:read",
     "evaluations:read", "dashboard:read",
-}
+})
 
 
 def upgrade() -> None:
@@ -92,7 +92,6 @@ def upgrade() -> None:
         sa.Column("require_priority_check", sa.Boolean, nullable=False, server_default=sa.text("false")),
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
     )
-    op.create_index("idx_permissions_resource_action", "permissions", ["resource", "action"], unique=True)
 
     # 3. role_permissions 테이블 생성
     op.create_table(
@@ -103,52 +102,35 @@ def upgrade() -> None:
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
         sa.UniqueConstraint("role_id", "permission_id", name="uq_role_permission"),
     )
-    op.create_index("idx_role_permissions_role_id", "role_permissions", ["role_id"])
 
-    # 4. Permission seed 데이터 삽입
+    # 4. Permission seed 데이터 삽입 — 컬럼별 배열을 unnest 해 한 문장으로
     conn = op.get_bind()
+    codes, resources, actions, descriptions, rpcs = (list(column) for column in zip(*PERMISSIONS))
+    conn.execute(
+        sa.text(
+            "INSERT INTO permissions (code, resource, action, description, require_priority_check) "
+            "SELECT * FROM unnest(CAST(:codes AS text[]), CAST(:resources AS text[]), "
+            "CAST(:actions AS text[]), CAST(:descriptions AS text[]), CAST(:rpcs AS boolean[]))"
+        ),
+        {"codes": codes, "resources": resources, "actions": actions, "descriptions": descriptions, "rpcs": rpcs},
+    )
 
-    # permissions INSERT
-    for code, resource, action, description, require_priority_check in PERMISSIONS:
-        conn.execute(
-            sa.text(
-                "INSERT INTO permissions (code, resource, action, description, require_priority_check) "
-                "VALUES (:code, :resource, :action, :description, :rpc)"
-            ),
-            {"code": code, "resource": resource, "action": action, "description": description, "rpc": require_priority_check},
-        )
-
-    # 5. 기존 역할에 기본 permission 할당
-    # 모든 permission id를 code 기준으로 조회
-    perm_rows = conn.execute(sa.text("SELECT id, code FROM permissions")).fetchall()
-    perm_map = {row[1]: row[0] for row in perm_rows}  # code -> id
-
-    # 모든 기존 roles 조회
-    role_rows = conn.execute(sa.text("SELECT id, priority FROM roles")).fetchall()
-
-    for role_id, priority in role_rows:
-        if priority <= 10:
-            # Owner: 전체
-            codes = [p[0] for p in PERMISSIONS]
-        elif priority <= 20:
-            # GM: 4개 제외
-            codes = [p[0] for p in PERMISSIONS if p[0] not in GM_EXCLUDED]
-        elif priority <= 30:
-            # SV: 10개만
-            codes = [p[0] for p in PERMISSIONS if p[0] in SV_ALLOWED]
-        else:
-            # Staff: 없음
-            codes = []
-
-        for code in codes:
-            perm_id = perm_map[code]
-            conn.execute(
-                sa.text(
-                    "INSERT INTO role_permissions (role_id, permission_id) "
-                    "VALUES (:role_id, :perm_id)"
-                ),
-                {"role_id": role_id, "perm_id": perm_id},
-            )
+    # 5. 기존 역할에 기본 permission 할당 — roles × permissions 를 DB 안에서 priority 구간별로 필터
+    # Owner(<=10): 전체 / GM(11~20): GM_EXCLUDED 제외 / SV(21~30): SV_ALLOWED 만 / Staff: 없음
+    conn.execute(
+        sa.text(
+            "INSERT INTO role_permissions (role_id, permission_id) "
+            "SELECT r.id, p.id FROM roles r CROSS JOIN permissions p "
+            "WHERE r.priority <= 10 "
+            "OR (r.priority > 10 AND r.priority <= 20 AND p.code <> ALL(CAST(:gm_excluded AS text[]))) "
+            "OR (r.priority > 20 AND r.priority <= 30 AND p.code = ANY(CAST(:sv_allowed AS text[])))"
+        ),
+        {"gm_excluded": sorted(GM_EXCLUDED), "sv_allowed": sorted(SV_ALLOWED)},
+    )
+
+    # 6. 인덱스는 seed 적재 후 생성 (행마다 btree 갱신 대신 정렬 1회로 빌드)
+    op.create_index("idx_permissions_resource_action", "permissions", ["resource", "action"], unique=True)
+    op.create_index("idx_role_permissions_role_id", "role_permissions", ["role_id"])
 
 
 def downgrade() -> None:
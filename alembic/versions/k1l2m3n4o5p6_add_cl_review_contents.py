@@ -35,32 +35,17 @@ def upgrade() -> None:
     op.create_index('ix_cl_review_contents_review', 'cl_review_contents', ['review_id'])
 
     # 2. 기존 comment/photo_url 데이터를 cl_review_contents로 마이그레이션
-    conn = op.get_bind()
-    rows = conn.execute(
-        sa.text(
-            "SELECT id, reviewer_id, comment, photo_url FROM cl_item_reviews "
-            "WHERE comment IS NOT NULL OR photo_url IS NOT NULL"
-        )
-    ).fetchall()
-
-    for row in rows:
-        review_id, reviewer_id, comment, photo_url = row
-        if comment:
-            conn.execute(
-                sa.text(
-                    "INSERT INTO cl_review_contents (id, review_id, author_id, type, content) "
-                    "VALUES (gen_random_uuid(), :review_id, :author_id, 'text', :content)"
-                ),
-                {"review_id": review_id, "author_id": reviewer_id, "content": comment},
-            )
-        if photo_url:
-            conn.execute(
-                sa.text(
-                    "INSERT INTO cl_review_contents (id, review_id, author_id, type, content) "
-                    "VALUES (gen_random_uuid(), :review_id, :author_id, 'photo', :content)"
-                ),
-                {"review_id": review_id, "author_id": reviewer_id, "content": photo_url},
-            )
+    # DB 안에서 INSERT ... SELECT 로 옮긴다 (빈 문자열은 기존과 같이 제외)
+    op.execute(
+        "INSERT INTO cl_review_contents (id, review_id, author_id, type, content) "
+        "SELECT gen_random_uuid(), id, reviewer_id, 'text', comment FROM cl_item_reviews "
+        "WHERE comment <> ''"
+    )
+    op.execute(
+        "INSERT INTO cl_review_contents (id, review_id, author_id, type, content) "
+        "SELECT gen_random_uuid(), id, reviewer_id, 'photo', photo_url FROM cl_item_reviews "
+        "WHERE photo_url <> ''"
+    )
 
     # 3. cl_item_reviews에서 comment, photo_url 컬럼 제거
     op.drop_column('cl_item_reviews', 'comment')
@@ -20,55 +20,26 @@ SV_NEW_PERMS = ["checklists:create", "checklists:update"]
 
 
 def upgrade() -> None:
-    conn = op.get_bind()
-
-    sv_rows = conn.execute(
-        sa.text("SELECT id FROM roles WHERE priority = 30")
-    ).fetchall()
-
-    perm_rows = conn.execute(
-        sa.text("SELECT id, code FROM permissions WHERE code = ANY(:codes)"),
+    # SV 역할 × 신규 permission 을 DB 안에서 한 문장으로 부여
+    op.get_bind().execute(
+        sa.text(
+            "INSERT INTO role_permissions (role_id, permission_id) "
+            "SELECT r.id, p.id FROM roles r "
+            "JOIN permissions p ON p.code = ANY(CAST(:codes AS text[])) "
+            "WHERE r.priority = 30 "
+            "ON CONFLICT ON CONSTRAINT uq_role_permission DO NOTHING"
+        ),
         {"codes": SV_NEW_PERMS},
-    ).fetchall()
-    perm_map = {row[1]: row[0] for row in perm_rows}
-
-    for sv_id, in sv_rows:
-        for code in SV_NEW_PERMS:
-            perm_id = perm_map.get(code)
-            if not perm_id:
-                continue
-            conn.execute(
-                sa.text(
-                    "INSERT INTO role_permissions (role_id, permission_id) "
-                    "VALUES (:role_id, :perm_id) "
-                    "ON CONFLICT ON CONSTRAINT uq_role_permission DO NOTHING"
-                ),
-                {"role_id": sv_id, "perm_id": perm_id},
-            )
+    )
 
 
 def downgrade() -> None:
-    conn = op.get_bind()
-
-    sv_rows = conn.execute(
-        sa.text("SELECT id FROM roles WHERE priority = 30")
-    ).fetchall()
-
-    perm_rows = conn.execute(
-        sa.text("SELECT id, code FROM permissions WHERE code = ANY(:codes)"),
+    op.get_bind().execute(
+        sa.text(
+            "DELETE FROM role_permissions rp "
+            "USING roles r, permissions p "
+            "WHERE rp.role_id = r.id AND rp.permission_id = p.id "
+            "AND r.priority = 30 AND p.code = ANY(CAST(:codes AS text[]))"
+        ),
         {"codes": SV_NEW_PERMS},
-    ).fetchall()
-    perm_map = {row[1]: row[0] for row in perm_rows}
-
-    for sv_id, in sv_rows:
-        for code in SV_NEW_PERMS:
-            perm_id = perm_map.get(code)
-            if not perm_id:
-                continue
-            conn.execute(
-                sa.text(
-                    "DELETE FROM role_permissions "
-                    "WHERE role_id = :role_id AND permission_id = :perm_id"
-                ),
-                {"role_id": sv_id, "perm_id": perm_id},
-            )
+    )
@@ -15,6 +15,7 @@ from app.database import get_db
 from app.models.user import User
 from app.schemas.common import MessageResponse, AlertResponse, PaginatedResponse
 from app.services.alert_service import alert_service
+from app.utils.pagination import clamp_page_params
 
 router: APIRouter = APIRouter()
 
@@ -39,6 +40,7 @@ async def list_my_alerts(
     Returns:
         dict: 페이지네이션된 알림 목록 (Paginated alert list)
     """
+    page, per_page = clamp_page_params(page, per_page)
     alerts, total = await alert_service.list_alerts(
         db,
         user_id=current_user.id,
@@ -36,7 +36,7 @@ from app.models.hiring import (
 from app.models.organization import Organization, Store
 from app.services.email_verification_service import email_verification_service
 from app.services.storage_service import storage_service
-from app.utils.password import hash_password
+from app.utils.password import hash_password_async
 
 router = APIRouter(prefix="/applications", tags=["App Applications"])
 
@@ -86,8 +86,8 @@ async def candidate_login(
         raise HTTPException(
             status_code=401, detail={"code": "invalid_credentials"}
         )
-    from app.utils.password import verify_password as _vp
-    if not _vp(body.password, candidate.password_hash):
+    from app.utils.password import verify_password_async as _vp
+    if not await _vp(body.password, candidate.password_hash):
         raise HTTPException(
             status_code=401, detail={"code": "invalid_credentials"}
         )
@@ -473,7 +473,7 @@ async def start_application(
             username=body.username,
             email=body.email,
             email_normalized=email_norm,
-            password_hash=hash_password(body.password),
+            password_hash=await hash_password_async(body.password),
             email_verified=True,
             full_name=body.full_name,
             phone=body.phone,
@@ -485,8 +485,8 @@ async def start_application(
     elif len(matches) == 1:
         m = matches[0]
         if m.username == body.username and m.email_normalized == email_norm:
-            from app.utils.password import verify_password as _vp
-            if not _vp(body.password, m.password_hash):
+            from app.utils.password import verify_password_async as _vp
+            if not await _vp(body.password, m.password_hash):
                 raise HTTPException(
                     status_code=409,
                     detail={
@@ -692,8 +692,8 @@ async def withdraw_application(
     if candidate is None or candidate.username != body.username:
         raise HTTPException(status_code=403, detail={"code": "forbidden"})
 
-    from app.utils.password import verify_password as _vp
-    if not _vp(body.password, candidate.password_hash):
+    from app.utils.password import verify_password_async as _vp
+    if not await _vp(body.password, candidate.password_hash):
         raise HTTPException(status_code=403, detail={"code": "forbidden"})
 
     if application.stage in ("hired", "rejected", "withdrawn"):
@@ -784,7 +784,7 @@ async def submit_application(
             username=body.username,
             email=body.email,
             email_normalized=email_norm,
-            password_hash=hash_password(body.password),
+            password_hash=await hash_password_async(body.password),
             email_verified=True,
             full_name=body.full_name,
             phone=body.phone,
@@ -797,8 +797,8 @@ async def submit_application(
         m = matches[0]
         if m.username == body.username and m.email_normalized == email_norm:
             # 같은 사람 재이용 — 비번 검증
-            from app.utils.password import verify_password as _vp
-            if not _vp(body.password, m.password_hash):
+            from app.utils.password import verify_password_async as _vp
+            if not await _vp(body.password, m.password_hash):
                 raise HTTPException(
                     status_code=409,
                     detail={
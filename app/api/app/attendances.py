@@ -19,6 +19,7 @@ from app.schemas.common import (
     PaginatedResponse,
 )
 from app.services.attendance_service import attendance_service
+from app.utils.pagination import clamp_page_params
 
 router: APIRouter = APIRouter()
 
@@ -116,6 +117,7 @@ async def list_my_attendances(
     Returns:
         dict: 페이지네이션된 내 근태 목록 (Paginated my attendance list)
     """
+    page, per_page = clamp_page_params(page, per_page)
     from app.repositories.attendance_repository import attendance_repository
 
     attendances, total = await attendance_repository.get_user_attendances(
@@ -126,10 +128,7 @@ async def list_my_attendances(
         per_page=per_page,
     )
 
-    items: list[dict] = []
-    for a in attendances:
-        response: dict = await attendance_service.build_response(db, a)
-        items.append(response)
+    items: list[dict] = await attendance_service.build_responses_batch(db, attendances)
 
     return {
         "items": items,
@@ -44,10 +44,7 @@ async def list_my_checklist_instances(
         work_date=work_date,
     )
 
-    items: list[dict] = []
-    for inst in instances:
-        response: dict = await checklist_instance_service.build_response(db, inst)
-        items.append(response)
+    items: list[dict] = await checklist_instance_service.build_responses_batch(db, instances)
 
     return items
 
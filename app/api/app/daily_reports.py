@@ -23,6 +23,8 @@ from app.utils.email import send_email
 from app.utils.email_templates import build_daily_report_email
 from app.utils.pdf import build_daily_report_pdf
 from app.utils.timezone import get_store_timezone
+from app.utils.pagination import clamp_page_params
+from app.utils.query_params import OptionalUUIDQuery
 
 logger = logging.getLogger(__name__)
 
@@ -33,12 +35,12 @@ router: APIRouter = APIRouter()
 async def get_template(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("daily_reports:read"))],
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
 ) -> dict:
     template = await daily_report_service.get_template(
         db,
         organization_id=current_user.organization_id,
-        store_id=UUID(store_id) if store_id else None,
+        store_id=store_id,
     )
     return await daily_report_service.build_template_response(template)
 
@@ -47,16 +49,17 @@ async def get_template(
 async def list_my_reports(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("daily_reports:read"))],
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
     status: Annotated[str | None, Query()] = None,
     page: int = 1,
     per_page: int = 20,
 ) -> dict:
+    page, per_page = clamp_page_params(page, per_page)
     reports, total = await daily_report_service.list_reports(
         db,
         organization_id=current_user.organization_id,
         author_id=current_user.id,
-        store_id=UUID(store_id) if store_id else None,
+        store_id=store_id,
         status=status,
         exclude_draft=False,
         page=page,
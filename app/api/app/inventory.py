@@ -23,6 +23,7 @@ from app.services.inventory_service import (
     category_service, sub_unit_service, product_service,
     store_inventory_service, transaction_service, audit_service,
 )
+from app.utils.pagination import clamp_page_params
 
 router = APIRouter()
 
@@ -131,6 +132,7 @@ async def list_store_inventory(
     page: int = 1,
     per_page: int = 50,
 ) -> dict:
+    page, per_page = clamp_page_params(page, per_page)
     await check_store_access(db, current_user, store_id)
     items, total = await store_inventory_service.list_inventory(
         db, store_id, current_user.organization_id,
@@ -174,6 +176,7 @@ async def search_products(
     page: int = 1,
     per_page: int = 20,
 ) -> dict:
+    page, per_page = clamp_page_params(page, per_page)
     items, total = await product_service.list_products(
         db, current_user.organization_id, keyword, page=page, per_page=per_page
     )
@@ -16,19 +16,21 @@ from app.database import get_db
 from app.models.communication import NoticeRead
 from app.models.user import User
 from app.models.user_store import UserStore
-from app.schemas.common import NoticeResponse, MessageResponse, PaginatedResponse
+from app.schemas.common import CursorPaginatedResponse, NoticeResponse, MessageResponse
 from app.services.notice_service import notice_service
 from app.utils.exceptions import ForbiddenError
+from app.utils.pagination import clamp_page_params
 
 router: APIRouter = APIRouter()
 
 
-@router.get("", response_model=PaginatedResponse)
+@router.get("", response_model=CursorPaginatedResponse)
 async def list_my_notices(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
     page: int = 1,
     per_page: int = 20,
+    cursor: str | None = None,
 ) -> dict:
     """내가 볼 수 있는 공지사항 목록을 조회합니다.
 
@@ -39,28 +41,30 @@ async def list_my_notices(
         current_user: 인증된 사용자 (Authenticated user)
         page: 페이지 번호 (Page number)
         per_page: 페이지당 항목 수 (Items per page)
+        cursor: keyset cursor — 첫 페이지는 빈 값, 이후 응답의 next_cursor
+                (Keyset cursor; empty for the first page, then next_cursor. total is omitted)
 
     Returns:
         dict: 페이지네이션된 공지 목록 (Paginated notice list)
     """
-    notices, total = await notice_service.list_for_user(
+    page, per_page = clamp_page_params(page, per_page)
+    notices, total, next_cursor = await notice_service.list_for_user(
         db,
         organization_id=current_user.organization_id,
         user_id=current_user.id,
         page=page,
         per_page=per_page,
+        cursor=cursor,
     )
 
-    items: list[dict] = []
-    for a in notices:
-        response: dict = await notice_service.build_response(db, a)
-        items.append(response)
+    items: list[dict] = await notice_service.build_responses_batch(db, notices)
 
     return {
         "items": items,
         "total": total,
         "page": page,
         "per_page": per_page,
+        "next_cursor": next_cursor,
     }
 
 
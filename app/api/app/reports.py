@@ -33,6 +33,8 @@ class IssueStatusTransition(BaseModel):
 from app.utils.email_templates import build_daily_report_email
 from app.utils.pdf import build_daily_report_pdf
 from app.utils.timezone import get_store_timezone
+from app.utils.pagination import clamp_page_params
+from app.utils.query_params import OptionalUUIDQuery
 
 logger = logging.getLogger(__name__)
 router: APIRouter = APIRouter()
@@ -43,13 +45,13 @@ async def get_template(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("reports:read"))],
     type: Annotated[str, Query()] = "daily",
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
 ) -> dict:
     t = await report_service.get_template_for_use(
         db,
         type=type,
         organization_id=current_user.organization_id,
-        store_id=UUID(store_id) if store_id else None,
+        store_id=store_id,
     )
     return report_service.build_template_response(t)
 
@@ -58,7 +60,7 @@ async def get_template(
 async def list_effective_report_types(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("reports:read"))],
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
     active_only: Annotated[bool, Query()] = True,
 ) -> dict:
     """매장에 enabled 된 report type(period) 목록 — type selector 채우기용.
@@ -69,7 +71,7 @@ async def list_effective_report_types(
     items = await report_service.resolve_effective_types(
         db,
         organization_id=current_user.organization_id,
-        store_id=UUID(store_id) if store_id else None,
+        store_id=store_id,
     )
     if active_only:
         items = [i for i in items if i["is_active"]]
@@ -81,7 +83,7 @@ async def list_my_reports(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("reports:read"))],
     type: Annotated[str | None, Query()] = None,
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
     status: Annotated[str | None, Query()] = None,
     date_from: Annotated[str | None, Query()] = None,
     date_to: Annotated[str | None, Query()] = None,
@@ -91,6 +93,7 @@ async def list_my_reports(
     page: int = 1,
     per_page: int = 20,
 ) -> dict:
+    page, per_page = clamp_page_params(page, per_page)
     # daily는 작성자 본인 것만(only_mine 기본 True), issue는 visibility 기반(only_mine False)
     author_filter = current_user.id if (only_mine and type != "issue") else None
     reports, total = await report_service.list_reports(
@@ -98,7 +101,7 @@ async def list_my_reports(
         organization_id=current_user.organization_id,
         type=type,
         author_id=author_filter,
-        store_id=UUID(store_id) if store_id else None,
+        store_id=store_id,
         status=status,
         date_from=date.fromisoformat(date_from) if date_from else None,
         date_to=date.fromisoformat(date_to) if date_to else None,
@@ -235,7 +238,8 @@ async def review_report(
 ) -> dict:
     """리포트 검토 완료 (SV+). submitted → reviewed + 선택 feedback 코멘트."""
     r = await report_service.review_report(
-        db, report_id, current_user.organization_id, current_user.id, data.feedback
+        db, report_id, current_user.organization_id, current_user.id, data.feedback,
+        reviewer_name=current_user.full_name,
     )
     r = await report_service.get_report(db, r.id, current_user.organization_id)
     return await report_service.build_response(db, r, include_comments=True)
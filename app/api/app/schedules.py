@@ -20,6 +20,7 @@ from app.services.checklist_instance_service import checklist_instance_service
 from app.services.schedule_service import schedule_service
 from app.utils.exceptions import ForbiddenError, NotFoundError
 from app.utils.timezone import get_store_timezone, get_work_date, resolve_timezone
+from app.utils.pagination import clamp_page_params
 
 router: APIRouter = APIRouter()
 
@@ -45,6 +46,7 @@ async def list_my_schedules(
 
     Special: work_date=today → 사용자 소속 매장별 timezone+day_start_time 기준으로 "오늘" 판단.
     """
+    page, per_page = clamp_page_params(page, per_page)
     effective_status = status or "confirmed"
 
     # 날짜 필터 결정
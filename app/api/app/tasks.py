@@ -17,6 +17,7 @@ from app.schemas.task import (
 )
 from app.services.task_service import task_service
 from app.core.permissions import is_gm_plus
+from app.utils.pagination import clamp_page_params
 
 router: APIRouter = APIRouter()
 
@@ -29,6 +30,7 @@ async def list_my_tasks(
     page: int = 1,
     per_page: int = 50,
 ) -> dict:
+    page, per_page = clamp_page_params(page, per_page)
     tasks, total = await task_service.list_tasks(
         db,
         organization_id=current_user.organization_id,
@@ -16,6 +16,7 @@ from app.models.user import User
 from app.schemas.common import PaginatedResponse
 from app.schemas.voice import VoiceCreate
 from app.services.voice_service import voice_service
+from app.utils.pagination import clamp_page_params
 
 router: APIRouter = APIRouter()
 
@@ -28,6 +29,7 @@ async def list_my_voices(
     per_page: int = 20,
 ) -> dict:
     """내 Voice 목록 조회."""
+    page, per_page = clamp_page_params(page, per_page)
     voices, total = await voice_service.list_for_user(
         db, current_user.organization_id, current_user.id, page, per_page
     )
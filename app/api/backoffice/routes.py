@@ -12,7 +12,7 @@ from app.api.backoffice import pages, ratelimit
 from app.api.backoffice import session as cp_session
 from app.api.backoffice.deps import COOKIE_NAME, get_current_admin
 from app.config import settings
-from app.utils.password import verify_password
+from app.utils.password import verify_password_async
 
 router: APIRouter = APIRouter(include_in_schema=False)
 
@@ -53,7 +53,7 @@ async def login_submit(
     if ratelimit.is_locked(ip):
         return pages.login_html(base, "Too many attempts. Try again later.", status_code=429)
 
-    valid = username == settings.BACKOFFICE_ADMIN_USERNAME and verify_password(
+    valid = username == settings.BACKOFFICE_ADMIN_USERNAME and await verify_password_async(
         password, settings.BACKOFFICE_ADMIN_PASSWORD_HASH
     )
     if not valid:
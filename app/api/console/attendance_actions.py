@@ -31,9 +31,9 @@ async def _build(db: AsyncSession, attendance) -> dict:
     """공통 응답 빌드 — Attendance + corrections + correction_count."""
     response: dict = await attendance_service.build_response(db, attendance)
     corrections = await attendance_service.get_corrections(db, attendance.id)
-    response["corrections"] = [
-        await attendance_service.build_correction_response(db, c) for c in corrections
-    ]
+    response["corrections"] = await attendance_service.build_correction_responses_batch(
+        db, corrections
+    )
     response["correction_count"] = len(response["corrections"])
     return response
 
@@ -8,7 +8,7 @@ from datetime import date
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import check_store_access, get_accessible_store_ids, require_permission
@@ -25,6 +25,9 @@ from app.schemas.common import (
     PaginatedResponse,
 )
 from app.services.attendance_service import attendance_service
+from app.utils.json_response import json_response
+from app.utils.pagination import clamp_page_params
+from app.utils.query_params import OptionalUUIDQuery
 
 router: APIRouter = APIRouter()
 
@@ -33,15 +36,15 @@ router: APIRouter = APIRouter()
 async def list_attendances(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("schedules:read"))],
-    store_id: Annotated[str | None, Query()] = None,
-    user_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
+    user_id: OptionalUUIDQuery = None,
     work_date: Annotated[date | None, Query()] = None,
     date_from: Annotated[date | None, Query()] = None,
     date_to: Annotated[date | None, Query()] = None,
     status: Annotated[str | None, Query()] = None,
     page: int = 1,
     per_page: int = 20,
-) -> dict:
+) -> Response:
     """근태 기록 목록을 필터링하여 조회합니다.
 
     List attendance records with optional filters.
@@ -61,19 +64,17 @@ async def list_attendances(
     Returns:
         dict: 페이지네이션된 근태 목록 (Paginated attendance list)
     """
-    store_uuid: UUID | None = UUID(store_id) if store_id else None
-    user_uuid: UUID | None = UUID(user_id) if user_id else None
-
+    page, per_page = clamp_page_params(page, per_page)
     # 접근 가능 매장으로 스코프 제한 (owner=None=전체). 특정 store_id 요청 시 접근 검증.
     accessible = await get_accessible_store_ids(db, current_user)
-    if store_uuid is not None:
-        await check_store_access(db, current_user, store_uuid)
+    if store_id is not None:
+        await check_store_access(db, current_user, store_id)
 
     attendances, total = await attendance_service.get_attendances(
         db,
         organization_id=current_user.organization_id,
-        store_id=store_uuid,
-        user_id=user_uuid,
+        store_id=store_id,
+        user_id=user_id,
         work_date=work_date,
         date_from=date_from,
         date_to=date_to,
@@ -91,20 +92,19 @@ async def list_attendances(
         db, attendance_ids
     )
 
-    items: list[dict] = []
-    for a in attendances:
-        response: dict = await attendance_service.build_response(
-            db, a, breaks=breaks_map.get(a.id, [])
-        )
+    items: list[dict] = await attendance_service.build_responses_batch(
+        db, attendances, breaks_map=breaks_map
+    )
+    for a, response in zip(attendances, items):
         response["correction_count"] = correction_counts.get(a.id, 0)
-        items.append(response)
 
-    return {
+    # 응답 모양 그대로의 dict → response_model 재검증/jsonable_encoder 순회 없이 바로 직렬화
+    return json_response({
         "items": items,
         "total": total,
         "page": page,
         "per_page": per_page,
-    }
+    })
 
 
 @router.get("/{attendance_id}", response_model=AttendanceResponse)
@@ -135,9 +135,9 @@ async def get_attendance(
 
     # 수정 이력 추가 — Append correction history
     corrections = await attendance_service.get_corrections(db, attendance_id)
-    correction_items: list[dict] = []
-    for c in corrections:
-        correction_items.append(await attendance_service.build_correction_response(db, c))
+    correction_items: list[dict] = await attendance_service.build_correction_responses_batch(
+        db, corrections
+    )
     response["corrections"] = correction_items
     response["correction_count"] = len(correction_items)
 
@@ -207,23 +207,22 @@ async def update_correction_reason(
 async def get_weekly_summary(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("schedules:read"))],
-    user_id: Annotated[str | None, Query()] = None,
-    store_id: Annotated[str | None, Query()] = None,
+    user_id: OptionalUUIDQuery = None,
+    store_id: OptionalUUIDQuery = None,
     week_date: Annotated[date | None, Query()] = None,
 ) -> list[dict]:
     """주간 근무시간 요약 — 사용자별 주간 실 근무시간 (총시간 - 휴식).
 
     Weekly work time summary — net work hours per user.
     """
-    store_uuid = UUID(store_id) if store_id else None
     accessible = await get_accessible_store_ids(db, current_user)
-    if store_uuid is not None:
-        await check_store_access(db, current_user, store_uuid)
+    if store_id is not None:
+        await check_store_access(db, current_user, store_id)
     return await attendance_service.get_weekly_summary(
         db,
         organization_id=current_user.organization_id,
-        user_id=UUID(user_id) if user_id else None,
-        store_id=store_uuid,
+        user_id=user_id,
+        store_id=store_id,
         week_date=week_date,
         store_ids=accessible,
     )
@@ -233,7 +232,7 @@ async def get_weekly_summary(
 async def get_overtime_alerts(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("schedules:read"))],
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
     week_date: Annotated[date | None, Query()] = None,
 ) -> list[dict]:
     """초과근무 경고 목록 조회 — 주간 근무시간 초과 직원 목록.
@@ -241,14 +240,13 @@ async def get_overtime_alerts(
     Get overtime alerts — List employees exceeding weekly work hour limits.
     Returns users whose total weekly hours exceed the configured threshold.
     """
-    store_uuid = UUID(store_id) if store_id else None
     accessible = await get_accessible_store_ids(db, current_user)
-    if store_uuid is not None:
-        await check_store_access(db, current_user, store_uuid)
+    if store_id is not None:
+        await check_store_access(db, current_user, store_id)
     return await attendance_service.get_overtime_alerts(
         db,
         organization_id=current_user.organization_id,
-        store_id=store_uuid,
+        store_id=store_id,
         week_date=week_date,
         store_ids=accessible,
     )
@@ -6,8 +6,9 @@ Common endpoints (refresh, logout, me) are in app.api.auth.
 """
 
 from typing import Annotated
+from uuid import UUID
 
-from sqlalchemy import select, func
+from sqlalchemy import insert, select
 from fastapi import APIRouter, Depends, Form, Request
 from fastapi.responses import HTMLResponse
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,8 +18,9 @@ from app.models.organization import Organization
 from app.models.user import Role, User
 from app.schemas.auth import LoginRequest, TokenResponse
 from app.services.auth_service import auth_service
+from app.core import permissions_cache
 from app.core.permissions import OWNER_PRIORITY, GM_PRIORITY, SV_PRIORITY, STAFF_PRIORITY
-from app.utils.password import hash_password
+from app.utils.password import hash_password_async
 
 router: APIRouter = APIRouter()
 
@@ -58,8 +60,9 @@ async def admin_setup(
     """
     from app.api.console.setup import _render
 
-    count = (await db.execute(select(func.count()).select_from(Organization))).scalar() or 0
-    if count > 0:
+    # 존재 여부만 확인 — 전체 COUNT 대신 1행만 조회
+    has_org = (await db.execute(select(Organization.id).limit(1))).first() is not None
+    if has_org:
         return _render('<div class="msg err">Setup already completed.</div>')
 
     # 조직 생성 — Create organization
@@ -67,30 +70,26 @@ async def admin_setup(
     db.add(org)
     await db.flush()
 
-    # 기본 역할 5개 생성 (super_owner 포함)
+    # 기본 역할 5개 생성 (super_owner 포함) — 한 번의 INSERT ... RETURNING 으로 id 회수
     from app.core.permissions import SUPER_OWNER_PRIORITY
-    super_owner_role: Role | None = None
-    roles_created: list[Role] = []
-    for name, priority in [
-        ("super_owner", SUPER_OWNER_PRIORITY),
-        ("owner", OWNER_PRIORITY),
-        ("general_manager", GM_PRIORITY),
-        ("supervisor", SV_PRIORITY),
-        ("staff", STAFF_PRIORITY),
-    ]:
-        role = Role(organization_id=org.id, name=name, priority=priority)
-        db.add(role)
-        roles_created.append(role)
-        if priority == SUPER_OWNER_PRIORITY:
-            super_owner_role = role
-    await db.flush()
-
-    assert super_owner_role is not None
+    role_rows: list[dict] = [
+        {"organization_id": org.id, "name": name, "priority": priority}
+        for name, priority in [
+            ("super_owner", SUPER_OWNER_PRIORITY),
+            ("owner", OWNER_PRIORITY),
+            ("general_manager", GM_PRIORITY),
+            ("supervisor", SV_PRIORITY),
+            ("staff", STAFF_PRIORITY),
+        ]
+    ]
+    role_result = await db.execute(insert(Role).returning(Role.id, Role.priority), role_rows)
+    # priority → role id (조직 내 priority 는 uq_role_org_priority 로 고유)
+    role_ids: dict[int, UUID] = {row.priority: row.id for row in role_result}
+    super_owner_role_id = role_ids[SUPER_OWNER_PRIORITY]
 
     # Permission seed — 기본 permission 할당
-    from app.models.permission import Permission, RolePermission
-    perm_result = await db.execute(select(Permission))
-    all_perms = {p.code: p.id for p in perm_result.scalars().all()}
+    from app.models.permission import RolePermission
+    all_perms = await permissions_cache.get_codes(db)
 
     gm_excluded = {"stores:create", "stores:delete", "roles:create", "roles:delete"}
     sv_allowed = {
@@ -101,20 +100,29 @@ async def admin_setup(
     }
 
     super_owner_only = {"org:delete", "owner:assign", "super_owner:transfer"}
-    for r in roles_created:
-        if r.priority <= SUPER_OWNER_PRIORITY:
-            codes = list(all_perms.keys())  # super_owner: 전부
-        elif r.priority <= OWNER_PRIORITY:
-            codes = [c for c in all_perms if c not in super_owner_only]
-        elif r.priority <= GM_PRIORITY:
-            codes = [c for c in all_perms if c not in gm_excluded and c not in super_owner_only]
-        elif r.priority <= SV_PRIORITY:
-            codes = [c for c in all_perms if c in sv_allowed]
+    # 역할 구간별 코드 집합을 한 번만 계산 (역할마다 all_perms 재스캔하지 않음)
+    all_codes = frozenset(all_perms)
+    owner_codes = all_codes - super_owner_only
+    gm_codes = owner_codes - gm_excluded
+    sv_codes = all_codes & sv_allowed
+    role_permission_rows: list[dict] = []
+    for priority, role_id in role_ids.items():
+        if priority <= SUPER_OWNER_PRIORITY:
+            codes = all_codes  # super_owner: 전부
+        elif priority <= OWNER_PRIORITY:
+            codes = owner_codes
+        elif priority <= GM_PRIORITY:
+            codes = gm_codes
+        elif priority <= SV_PRIORITY:
+            codes = sv_codes
         else:
-            codes = []
-        for code in codes:
-            db.add(RolePermission(role_id=r.id, permission_id=all_perms[code]))
-    await db.flush()
+            codes = frozenset()
+        role_permission_rows.extend(
+            {"role_id": role_id, "permission_id": all_perms[code]} for code in codes
+        )
+    # 역할 × permission 을 한 번의 INSERT 로 (ORM 객체/identity map 생성 없이)
+    if role_permission_rows:
+        await db.execute(insert(RolePermission), role_permission_rows)
 
     # 기본 일일 리포트 템플릿 생성
     from app.services.daily_report_service import daily_report_service
@@ -132,10 +140,10 @@ async def admin_setup(
     # 다수 super_owner 는 추후 super_owner 가 직접 추가 가능.
     user = User(
         organization_id=org.id,
-        role_id=super_owner_role.id,
+        role_id=super_owner_role_id,
         username=username,
         full_name=username,
-        password_hash=hash_password(password),
+        password_hash=await hash_password_async(password),
     )
     db.add(user)
     await db.flush()
@@ -147,7 +155,7 @@ async def admin_setup(
         OrgMember(
             user_id=user.id,
             organization_id=org.id,
-            role_id=super_owner_role.id,
+            role_id=super_owner_role_id,
             status="active",
         )
     )
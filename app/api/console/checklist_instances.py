@@ -22,6 +22,8 @@ from app.schemas.common import (
 )
 from app.schemas.checklist_review import BulkReviewRequest, ItemReviewResponse, ItemReviewUpsert, ReviewContentCreate, ReviewContentResponse, ScoreUpdate
 from app.services.checklist_instance_service import checklist_instance_service
+from app.utils.pagination import clamp_page_params
+from app.utils.query_params import OptionalUUIDQuery
 
 router: APIRouter = APIRouter()
 
@@ -30,8 +32,8 @@ router: APIRouter = APIRouter()
 async def list_checklist_instances(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("checklist_review:read"))],
-    store_id: Annotated[str | None, Query()] = None,
-    user_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
+    user_id: OptionalUUIDQuery = None,
     work_date: Annotated[date | None, Query()] = None,
     status: Annotated[str | None, Query()] = None,
     page: int = 1,
@@ -54,18 +56,16 @@ async def list_checklist_instances(
     Returns:
         dict: 페이지네이션된 인스턴스 목록 (Paginated instance list)
     """
-    store_uuid: UUID | None = UUID(store_id) if store_id else None
-    user_uuid: UUID | None = UUID(user_id) if user_id else None
-
+    page, per_page = clamp_page_params(page, per_page)
     accessible_ids = await get_accessible_store_ids(db, current_user)
-    if store_uuid is not None and accessible_ids is not None and store_uuid not in accessible_ids:
+    if store_id is not None and accessible_ids is not None and store_id not in accessible_ids:
         raise HTTPException(status_code=403, detail="No access to this store")
 
     instances, total = await checklist_instance_service.get_instances(
         db,
         organization_id=current_user.organization_id,
-        store_id=store_uuid,
-        user_id=user_uuid,
+        store_id=store_id,
+        user_id=user_id,
         work_date=work_date,
         status=status,
         page=page,
@@ -73,10 +73,9 @@ async def list_checklist_instances(
         store_ids=accessible_ids,
     )
 
-    items: list[dict] = []
-    for inst in instances:
-        response: dict = await checklist_instance_service.build_response(db, inst)
-        items.append(response)
+    items: list[dict] = await checklist_instance_service.build_responses_batch(db, instances)
+    # 응답은 plain dict — 직렬화 동안 풀 연결을 잡고 있지 않도록 세션을 먼저 반납
+    await db.close()
 
     return {
         "items": items,
@@ -108,8 +107,8 @@ async def get_instance_by_schedule(
 async def get_completion_log(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("checklist_review:read"))],
-    store_id: Annotated[str | None, Query()] = None,
-    user_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
+    user_id: OptionalUUIDQuery = None,
     date_from: Annotated[date | None, Query()] = None,
     date_to: Annotated[date | None, Query()] = None,
     page: int = 1,
@@ -119,24 +118,24 @@ async def get_completion_log(
 
     Requires checklists:read permission (GM+).
     """
-    store_uuid: UUID | None = UUID(store_id) if store_id else None
-    user_uuid: UUID | None = UUID(user_id) if user_id else None
-
+    page, per_page = clamp_page_params(page, per_page)
     accessible_ids = await get_accessible_store_ids(db, current_user)
-    if store_uuid is not None and accessible_ids is not None and store_uuid not in accessible_ids:
+    if store_id is not None and accessible_ids is not None and store_id not in accessible_ids:
         raise HTTPException(status_code=403, detail="No access to this store")
 
     items, total = await checklist_instance_service.get_completion_log(
         db,
         organization_id=current_user.organization_id,
-        store_id=store_uuid,
-        user_id=user_uuid,
+        store_id=store_id,
+        user_id=user_id,
         date_from=date_from,
         date_to=date_to,
         page=page,
         per_page=per_page,
         store_ids=accessible_ids,
     )
+    # 응답은 plain dict — 직렬화 동안 풀 연결을 잡고 있지 않도록 세션을 먼저 반납
+    await db.close()
 
     return {
         "items": items,
@@ -150,7 +149,7 @@ async def get_completion_log(
 async def get_review_summary(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("checklist_review:read"))],
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
     date_from: Annotated[date | None, Query()] = None,
     date_to: Annotated[date | None, Query()] = None,
 ) -> dict:
@@ -168,16 +167,14 @@ async def get_review_summary(
     Returns:
         dict: 리뷰 요약 통계 (Review summary counts)
     """
-    store_uuid: UUID | None = UUID(store_id) if store_id else None
-
     accessible_ids = await get_accessible_store_ids(db, current_user)
-    if store_uuid is not None and accessible_ids is not None and store_uuid not in accessible_ids:
+    if store_id is not None and accessible_ids is not None and store_id not in accessible_ids:
         raise HTTPException(status_code=403, detail="No access to this store")
 
     return await checklist_instance_service.get_review_summary(
         db,
         organization_id=current_user.organization_id,
-        store_id=store_uuid,
+        store_id=store_id,
         date_from=date_from,
         date_to=date_to,
         store_ids=accessible_ids,
@@ -35,6 +35,7 @@ from app.schemas.common import (
 )
 from app.services.checklist_service import checklist_service
 from app.utils.exceptions import BadRequestError
+from app.utils.query_params import OptionalUUIDQuery
 
 router: APIRouter = APIRouter()
 
@@ -51,31 +52,27 @@ _DEFAULT_SAMPLE_PATH = Path(__file__).resolve().parents[3] / "static" / "checkli
 async def list_all_templates(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("checklists:read"))],
-    store_id: Annotated[str | None, Query()] = None,
-    shift_id: Annotated[str | None, Query()] = None,
-    position_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
+    shift_id: OptionalUUIDQuery = None,
+    position_id: OptionalUUIDQuery = None,
 ) -> list[dict]:
     """조직 전체의 체크리스트 템플릿 목록을 조회합니다. 접근 가능한 매장만 필터링.
 
     List all checklist templates for the organization with optional filters.
     Results are filtered to only include templates from accessible stores.
     """
-    store_uuid: UUID | None = UUID(store_id) if store_id else None
-    shift_uuid: UUID | None = UUID(shift_id) if shift_id else None
-    position_uuid: UUID | None = UUID(position_id) if position_id else None
-
     accessible = await get_accessible_store_ids(db, current_user)
 
     # 특정 매장 필터가 있으면 접근 권한 확인 — Validate store filter against access scope
-    if store_uuid is not None and accessible is not None and store_uuid not in accessible:
+    if store_id is not None and accessible is not None and store_id not in accessible:
         return []
 
     templates = await checklist_service.list_all_templates(
         db,
         organization_id=current_user.organization_id,
-        store_id=store_uuid,
-        shift_id=shift_uuid,
-        position_id=position_uuid,
+        store_id=store_id,
+        shift_id=shift_id,
+        position_id=position_id,
     )
 
     # 접근 가능한 매장 템플릿만 필터링 — Filter to accessible stores
@@ -106,8 +103,8 @@ async def list_templates(
     store_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("checklists:read"))],
-    shift_id: Annotated[str | None, Query()] = None,
-    position_id: Annotated[str | None, Query()] = None,
+    shift_id: OptionalUUIDQuery = None,
+    position_id: OptionalUUIDQuery = None,
 ) -> list[dict]:
     """매장별 체크리스트 템플릿 목록을 조회합니다. 담당/소속 매장만 접근 가능.
 
@@ -115,15 +112,13 @@ async def list_templates(
     """
     await check_store_access(db, current_user, store_id)
 
-    shift_uuid: UUID | None = UUID(shift_id) if shift_id else None
-    position_uuid: UUID | None = UUID(position_id) if position_id else None
 
     templates = await checklist_service.list_templates(
         db,
         store_id=store_id,
         organization_id=current_user.organization_id,
-        shift_id=shift_uuid,
-        position_id=position_uuid,
+        shift_id=shift_id,
+        position_id=position_id,
     )
 
     return [
@@ -17,6 +17,7 @@ from app.schemas.daily_report import (
 )
 from app.services.daily_report_service import daily_report_service
 from app.utils.exceptions import BadRequestError
+from app.utils.query_params import OptionalUUIDQuery
 
 router: APIRouter = APIRouter()
 
@@ -47,13 +48,13 @@ def _build_template_response(template) -> dict:
 async def list_templates(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("daily_reports:read"))],
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
     is_active: Annotated[bool | None, Query()] = None,
 ) -> list[dict]:
     templates = await daily_report_service.list_templates(
         db,
         organization_id=current_user.organization_id,
-        store_id=UUID(store_id) if store_id else None,
+        store_id=store_id,
         is_active=is_active,
     )
     return [_build_template_response(t) for t in templates]
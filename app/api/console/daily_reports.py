@@ -3,7 +3,6 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select as sa_select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import check_store_access, get_accessible_store_ids, require_permission
@@ -11,6 +10,8 @@ from app.database import get_db
 from app.models.user import User
 from app.schemas.daily_report import DailyReportCommentCreate, DailyReportResponse
 from app.services.daily_report_service import daily_report_service
+from app.utils.pagination import clamp_page_params
+from app.utils.query_params import OptionalUUIDQuery
 
 router: APIRouter = APIRouter()
 
@@ -19,7 +20,7 @@ router: APIRouter = APIRouter()
 async def list_reports(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("daily_reports:read"))],
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
     date_from: Annotated[str | None, Query()] = None,
     date_to: Annotated[str | None, Query()] = None,
     period: Annotated[str | None, Query()] = None,
@@ -27,14 +28,14 @@ async def list_reports(
     page: int = 1,
     per_page: int = 20,
 ) -> dict:
+    page, per_page = clamp_page_params(page, per_page)
     accessible = await get_accessible_store_ids(db, current_user)
-    parsed_store_id = UUID(store_id) if store_id else None
-    if parsed_store_id is not None:
-        await check_store_access(db, current_user, parsed_store_id)
+    if store_id is not None:
+        await check_store_access(db, current_user, store_id)
     reports, total = await daily_report_service.list_reports(
         db,
         organization_id=current_user.organization_id,
-        store_id=parsed_store_id,
+        store_id=store_id,
         date_from=date.fromisoformat(date_from) if date_from else None,
         date_to=date.fromisoformat(date_to) if date_to else None,
         period=period,
@@ -77,9 +78,8 @@ async def add_comment(
     comment = await daily_report_service.add_comment(
         db, report_id, current_user.organization_id, current_user.id, data
     )
-    # Resolve user name for response
-    user_result = await db.execute(sa_select(User.full_name).where(User.id == comment.user_id))
-    user_name = user_result.scalar() or "Unknown"
+    # 작성자 = current_user — 이름 재조회 없음
+    user_name = current_user.full_name or "Unknown"
     return {
         "id": str(comment.id),
         "report_id": str(comment.report_id),
@@ -10,7 +10,6 @@ Permission: SV+ (all admin roles)
 from datetime import date
 from io import BytesIO
 from typing import Annotated
-from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import StreamingResponse
@@ -20,6 +19,7 @@ from app.api.deps import require_permission
 from app.database import get_db
 from app.models.user import User
 from app.services.dashboard_service import dashboard_service
+from app.utils.query_params import OptionalUUIDQuery
 
 router: APIRouter = APIRouter()
 
@@ -30,7 +30,7 @@ async def get_checklist_completion(
     current_user: Annotated[User, Depends(require_permission("dashboard:read"))],
     date_from: Annotated[date | None, Query()] = None,
     date_to: Annotated[date | None, Query()] = None,
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
 ) -> dict:
     """체크리스트 완료율 조회 — 기간별 배정 완료 통계."""
     return await dashboard_service.get_checklist_completion(
@@ -38,7 +38,7 @@ async def get_checklist_completion(
         organization_id=current_user.organization_id,
         date_from=date_from,
         date_to=date_to,
-        store_id=UUID(store_id) if store_id else None,
+        store_id=store_id,
     )
 
 
@@ -48,7 +48,7 @@ async def get_attendance_summary(
     current_user: Annotated[User, Depends(require_permission("dashboard:read"))],
     date_from: Annotated[date | None, Query()] = None,
     date_to: Annotated[date | None, Query()] = None,
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
 ) -> dict:
     """근태 요약 조회 — 기간별 근태 통계."""
     return await dashboard_service.get_attendance_summary(
@@ -56,7 +56,7 @@ async def get_attendance_summary(
         organization_id=current_user.organization_id,
         date_from=date_from,
         date_to=date_to,
-        store_id=UUID(store_id) if store_id else None,
+        store_id=store_id,
     )
 
 
@@ -65,14 +65,14 @@ async def get_overtime_summary(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("dashboard:read"))],
     week_date: Annotated[date | None, Query()] = None,
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
 ) -> dict:
     """초과근무 현황 요약 조회 — 주간 초과근무 통계."""
     return await dashboard_service.get_overtime_summary(
         db,
         organization_id=current_user.organization_id,
         week_date=week_date,
-        store_id=UUID(store_id) if store_id else None,
+        store_id=store_id,
     )
 
 
@@ -82,7 +82,7 @@ async def export_dashboard(
     current_user: Annotated[User, Depends(require_permission("dashboard:read"))],
     date_from: Annotated[date | None, Query()] = None,
     date_to: Annotated[date | None, Query()] = None,
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
 ) -> StreamingResponse:
     """대시보드 데이터를 Excel 파일로 내보냅니다. Owner + GM."""
     excel_bytes: bytes = await dashboard_service.export_excel(
@@ -90,7 +90,7 @@ async def export_dashboard(
         organization_id=current_user.organization_id,
         date_from=date_from,
         date_to=date_to,
-        store_id=UUID(store_id) if store_id else None,
+        store_id=store_id,
     )
     return StreamingResponse(
         BytesIO(excel_bytes),
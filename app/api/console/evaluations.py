@@ -40,6 +40,7 @@ from app.schemas.evaluation import (
     EvaluationUpdate,
 )
 from app.services.evaluation_service import evaluation_service
+from app.utils.query_params import OptionalUUIDQuery
 
 router: APIRouter = APIRouter()
 
@@ -78,7 +79,7 @@ async def get_template(
 async def list_evaluatable_users(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("evaluations:create"))],
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
     q: Annotated[str | None, Query()] = None,
     page: int = 1,
     limit: int = 30,
@@ -91,11 +92,10 @@ async def list_evaluatable_users(
     """
     page = max(1, page)
     limit = max(1, min(limit, 100))
-    store_uuid: UUID | None = UUID(store_id) if store_id else None
-    if store_uuid is not None:
-        await check_store_access(db, current_user, store_uuid)
+    if store_id is not None:
+        await check_store_access(db, current_user, store_id)
     return await evaluation_service.list_evaluatable_users(
-        db, current_user, store_id=store_uuid, q=q, page=page, limit=limit
+        db, current_user, store_id=store_id, q=q, page=page, limit=limit
     )
 
 
@@ -108,9 +108,9 @@ async def list_evaluatable_users(
 async def list_evaluations(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("evaluations:read"))],
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
     status: Annotated[str | None, Query()] = None,
-    evaluatee_id: Annotated[str | None, Query()] = None,
+    evaluatee_id: OptionalUUIDQuery = None,
     page: int = 1,
     per_page: int = 20,
 ) -> dict:
@@ -122,12 +122,11 @@ async def list_evaluations(
     page = max(1, page)
 
     accessible = await get_accessible_store_ids(db, current_user)
-    store_uuid: UUID | None = UUID(store_id) if store_id else None
 
-    if store_uuid is not None:
-        if accessible is not None and store_uuid not in accessible:
+    if store_id is not None:
+        if accessible is not None and store_id not in accessible:
             return {"items": [], "total": 0, "page": page, "per_page": per_page}
-        store_ids: list[UUID] | None = [store_uuid]
+        store_ids: list[UUID] | None = [store_id]
     else:
         store_ids = list(accessible) if accessible is not None else None
 
@@ -136,7 +135,7 @@ async def list_evaluations(
         organization_id=current_user.organization_id,
         store_ids=store_ids,
         status=status,
-        evaluatee_id=UUID(evaluatee_id) if evaluatee_id else None,
+        evaluatee_id=evaluatee_id,
         page=page,
         per_page=per_page,
     )
@@ -132,6 +132,7 @@ async def list_products(
     sort_by: str | None = None,
     sort_dir: str | None = None,
 ) -> dict:
+    page, per_page = clamp_page_params(page, per_page)
     items, total = await product_service.list_products(
         db, current_user.organization_id, keyword, search_field, category_id, is_active, page, per_page,
         sort_by=sort_by, sort_dir=sort_dir,
@@ -161,6 +162,7 @@ async def preview_product_code(
 from pathlib import Path
 from fastapi.responses import FileResponse as _FileResponse
 from app.config import settings
+from app.utils.pagination import clamp_page_params
 
 _STATIC_DIR = Path(__file__).resolve().parents[3] / "static"
 
@@ -531,6 +533,7 @@ async def list_store_inventory(
     sort_by: str | None = None,
     sort_dir: str | None = None,
 ) -> dict:
+    page, per_page = clamp_page_params(page, per_page)
     await check_store_access(db, current_user, store_id)
     items, total = await store_inventory_service.list_inventory(
         db, store_id, current_user.organization_id,
@@ -564,6 +567,7 @@ async def list_addable_products(
     Sorted addable-first (is_in_store ASC), then by name. Paginated for
     infinite scroll.
     """
+    page, per_page = clamp_page_params(page, per_page)
     await check_store_access(db, current_user, store_id)
     items, total = await store_inventory_service.list_addable_products(
         db, store_id, current_user.organization_id,
@@ -624,6 +628,7 @@ async def list_store_transactions(
     page: int = 1,
     per_page: int = 20,
 ) -> dict:
+    page, per_page = clamp_page_params(page, per_page)
     await check_store_access(db, current_user, store_id)
     items, total = await transaction_service.list_transactions(
         db, store_id, current_user.organization_id, product_id, type, page, per_page
@@ -684,6 +689,7 @@ async def list_audits(
     page: int = 1,
     per_page: int = 20,
 ) -> dict:
+    page, per_page = clamp_page_params(page, per_page)
     await check_store_access(db, current_user, store_id)
     items, total = await audit_service.list_audits(
         db, store_id, current_user.organization_id, page, per_page
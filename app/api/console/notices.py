@@ -8,10 +8,11 @@ Permission Matrix (역할별 권한 설계):
     - 공지사항 조회: Owner + GM + SV (전 관리 역할)
 """
 
+import hashlib
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response, status as http_status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -24,43 +25,56 @@ from app.schemas.common import (
     NoticeResponse,
     NoticeUpdate,
     MessageResponse,
-    PaginatedResponse,
+    CursorPaginatedResponse,
 )
 from app.schemas.notice_read import NoticeReadResponse
 from app.services.notice_service import notice_service
+from app.utils.json_response import dump_json
+from app.utils.pagination import clamp_page_params
 
 router: APIRouter = APIRouter()
 
 
-@router.get("", response_model=PaginatedResponse)
+@router.get("", response_model=CursorPaginatedResponse)
 async def list_notices(
+    request: Request,
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("notices:read"))],
     page: int = 1,
     per_page: int = 20,
-) -> dict:
+    cursor: str | None = None,
+) -> Response:
     """공지사항 목록을 조회합니다. 전 관리 역할 조회 가능.
 
     List notices for the organization. All admin roles can read.
+    cursor 를 보내면 (첫 페이지는 빈 값) keyset 방식 — total 없이 next_cursor 로 다음 페이지 조회.
+    응답 해시를 ETag 로 내려주고, If-None-Match 가 같으면 304(빈 바디).
     """
-    notices, total = await notice_service.list_notices(
+    page, per_page = clamp_page_params(page, per_page)
+    notices, total, next_cursor = await notice_service.list_notices(
         db,
         organization_id=current_user.organization_id,
         page=page,
         per_page=per_page,
+        cursor=cursor,
     )
 
-    items: list[dict] = []
-    for a in notices:
-        response: dict = await notice_service.build_response(db, a)
-        items.append(response)
+    items: list[dict] = await notice_service.build_responses_batch(db, notices)
 
-    return {
+    result = {
         "items": items,
         "total": total,
         "page": page,
         "per_page": per_page,
+        "next_cursor": next_cursor,
     }
+    # ── 한 번만 직렬화해서 ETag 해시와 응답 바디에 같이 쓴다 (response_model 재검증 생략).
+    # ETag/304: 공지 목록은 작성/수정/삭제 때만 바뀐다 → 변화 없는 재조회는 304 로 전송 생략.
+    body = dump_json(result)
+    etag = 'W/"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=http_status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get("/{notice_id}", response_model=NoticeResponse)
@@ -148,21 +162,20 @@ async def get_notice_reads(
     current_user: Annotated[User, Depends(require_permission("notices:read"))],
 ) -> list[NoticeReadResponse]:
     """공지사항 읽음 현황을 조회합니다. Owner + GM만 가능."""
+    # 읽은 사용자 이름을 JOIN 으로 함께 조회 (행마다 users 조회하지 않음)
     query = (
-        select(NoticeRead)
+        select(NoticeRead.user_id, NoticeRead.read_at, User.full_name)
+        .outerjoin(User, User.id == NoticeRead.user_id)
         .where(NoticeRead.notice_id == notice_id)
         .order_by(NoticeRead.read_at)
     )
     result = await db.execute(query)
-    reads = list(result.scalars().all())
-
-    responses: list[NoticeReadResponse] = []
-    for r in reads:
-        user_result = await db.execute(select(User).where(User.id == r.user_id))
-        user = user_result.scalar_one_or_none()
-        responses.append(NoticeReadResponse(
-            user_id=str(r.user_id),
-            user_name=user.full_name if user else None,
-            read_at=r.read_at,
-        ))
-    return responses
+
+    return [
+        NoticeReadResponse(
+            user_id=str(row.user_id),
+            user_name=row.full_name,
+            read_at=row.read_at,
+        )
+        for row in result
+    ]
@@ -14,6 +14,7 @@ from app.schemas.report import (
     ReportTemplateUpdate,
 )
 from app.services.report_service import report_service
+from app.utils.query_params import OptionalUUIDQuery
 
 router: APIRouter = APIRouter()
 
@@ -23,14 +24,14 @@ async def lookup_template(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("reports:read"))],
     type: Annotated[str, Query()] = "issue",
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
 ) -> dict:
     """매장에 적용될 effective template (store → org → system default fallback)."""
     t = await report_service.get_template_for_use(
         db,
         type=type,
         organization_id=current_user.organization_id,
-        store_id=UUID(store_id) if store_id else None,
+        store_id=store_id,
     )
     return report_service.build_template_response(t)
 
@@ -40,14 +41,14 @@ async def list_templates(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("reports:read"))],
     type: Annotated[str | None, Query()] = None,
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
     is_active: Annotated[bool | None, Query()] = None,
 ) -> dict:
     templates = await report_service.list_templates(
         db,
         organization_id=current_user.organization_id,
         type=type,
-        store_id=UUID(store_id) if store_id else None,
+        store_id=store_id,
         is_active=is_active,
     )
     return {"items": [report_service.build_template_response(t) for t in templates]}
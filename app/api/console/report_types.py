@@ -24,6 +24,7 @@ from app.schemas.report import (
     ReportTypeUpdate,
 )
 from app.services.report_service import report_service
+from app.utils.query_params import OptionalUUIDQuery
 
 router: APIRouter = APIRouter()
 
@@ -32,7 +33,7 @@ router: APIRouter = APIRouter()
 async def list_report_types(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("reports:read"))],
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
     effective: Annotated[bool, Query()] = False,
 ) -> dict:
     """report_types 목록.
@@ -40,13 +41,12 @@ async def list_report_types(
     - effective=False (default): scope 의 raw 관리 목록. store_id 없으면 org-default 행.
     - effective=True: store 에 실제 적용되는 resolved 목록 (org+store 병합).
     """
-    parsed_store_id = UUID(store_id) if store_id else None
-    if parsed_store_id is not None:
-        await check_store_access(db, current_user, parsed_store_id)
+    if store_id is not None:
+        await check_store_access(db, current_user, store_id)
     items = await report_service.list_report_types(
         db,
         organization_id=current_user.organization_id,
-        store_id=parsed_store_id,
+        store_id=store_id,
         effective=effective,
     )
     return {"items": items}
@@ -12,7 +12,6 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select as sa_select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import check_store_access, get_accessible_store_ids, require_permission
@@ -26,6 +25,8 @@ from app.schemas.report import (
     ReportUpdate,
 )
 from app.services.report_service import report_service
+from app.utils.pagination import clamp_page_params
+from app.utils.query_params import OptionalUUIDQuery
 from pydantic import BaseModel
 
 router: APIRouter = APIRouter()
@@ -40,7 +41,7 @@ async def list_reports(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("reports:read"))],
     type: Annotated[str | None, Query()] = None,
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
     date_from: Annotated[str | None, Query()] = None,
     date_to: Annotated[str | None, Query()] = None,
     period: Annotated[str | None, Query()] = None,
@@ -49,15 +50,15 @@ async def list_reports(
     page: int = 1,
     per_page: int = 20,
 ) -> dict:
+    page, per_page = clamp_page_params(page, per_page)
     accessible = await get_accessible_store_ids(db, current_user)
-    parsed_store_id = UUID(store_id) if store_id else None
-    if parsed_store_id is not None:
-        await check_store_access(db, current_user, parsed_store_id)
+    if store_id is not None:
+        await check_store_access(db, current_user, store_id)
     reports, total = await report_service.list_reports(
         db,
         organization_id=current_user.organization_id,
         type=type,
-        store_id=parsed_store_id,
+        store_id=store_id,
         date_from=date.fromisoformat(date_from) if date_from else None,
         date_to=date.fromisoformat(date_to) if date_to else None,
         period=period,
@@ -142,7 +143,8 @@ async def review_report(
     if r.store_id:
         await check_store_access(db, current_user, r.store_id)
     r = await report_service.review_report(
-        db, report_id, current_user.organization_id, current_user.id, data.feedback
+        db, report_id, current_user.organization_id, current_user.id, data.feedback,
+        reviewer_name=current_user.full_name,
     )
     r = await report_service.get_report(db, r.id, current_user.organization_id)
     return await report_service.build_response(db, r, include_comments=True)
@@ -183,12 +185,12 @@ async def add_comment(
     c = await report_service.add_comment(
         db, report_id, current_user.organization_id, current_user.id, data
     )
-    u = await db.execute(sa_select(User.full_name).where(User.id == c.user_id))
     return {
         "id": str(c.id),
         "report_id": str(c.report_id),
         "user_id": str(c.user_id) if c.user_id else None,
-        "user_name": u.scalar() or "Unknown",
+        # 작성자 = current_user — 이름 재조회 없음
+        "user_name": current_user.full_name or "Unknown",
         "content": c.content,
         "created_at": c.created_at,
     }
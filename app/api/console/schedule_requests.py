@@ -20,6 +20,8 @@ from app.schemas.schedule import (
     ScheduleRequestStatusUpdate,
 )
 from app.services.schedule_request_service import schedule_request_service
+from app.utils.pagination import clamp_page_params
+from app.utils.query_params import OptionalUUIDQuery
 
 router: APIRouter = APIRouter()
 
@@ -28,17 +30,18 @@ router: APIRouter = APIRouter()
 async def list_requests(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("schedules:read"))],
-    store_id: str | None = None,
+    store_id: OptionalUUIDQuery = None,
     date_from: Annotated[date | None, Query()] = None,
     date_to: Annotated[date | None, Query()] = None,
     page: int = 1,
     per_page: int = 50,
 ) -> dict:
     """직원 스케줄 신청 목록 조회."""
+    page, per_page = clamp_page_params(page, per_page)
     items, total = await schedule_request_service.list_requests_admin(
         db,
         organization_id=current_user.organization_id,
-        store_id=UUID(store_id) if store_id else None,
+        store_id=store_id,
         date_from=date_from,
         date_to=date_to,
         page=page, per_page=per_page,
@@ -30,6 +30,8 @@ from app.schemas.schedule import (
     RosterResponse,
 )
 from app.services.schedule_service import schedule_service
+from app.utils.pagination import clamp_page_params
+from app.utils.query_params import OptionalUUIDQuery
 
 
 def _csv_uuids(raw: str | None) -> list[UUID] | None:
@@ -57,8 +59,8 @@ def _scrub(resp, user: User):
 async def list_entries(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("schedules:read"))],
-    store_id: str | None = None,
-    user_id: str | None = None,
+    store_id: OptionalUUIDQuery = None,
+    user_id: OptionalUUIDQuery = None,
     user_ids: str | None = None,  # CSV — 여러 user 동시 조회 (calendar에서 다른 매장 schedule 까지 가져오기 위함)
     date_from: date | None = None,
     date_to: date | None = None,
@@ -70,17 +72,17 @@ async def list_entries(
 
     SV/GM은 본인이 접근 가능한 매장의 스케줄만 반환된다 (Owner는 전체).
     """
+    page, per_page = clamp_page_params(page, per_page)
     parsed_user_ids: list[UUID] | None = None
     if user_ids:
         parsed_user_ids = [UUID(x) for x in user_ids.split(",") if x.strip()]
     accessible = await get_accessible_store_ids(db, current_user)
-    parsed_store_id = UUID(store_id) if store_id else None
-    if parsed_store_id is not None:
-        await check_store_access(db, current_user, parsed_store_id)
+    if store_id is not None:
+        await check_store_access(db, current_user, store_id)
     items, total = await schedule_service.list_entries(
         db, current_user.organization_id,
-        store_id=parsed_store_id,
-        user_id=UUID(user_id) if user_id else None,
+        store_id=store_id,
+        user_id=user_id,
         user_ids=parsed_user_ids,
         date_from=date_from, date_to=date_to,
         status=status, page=page, per_page=per_page,
@@ -236,9 +238,9 @@ async def bulk_confirm(
 async def list_history(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("schedule_history:read"))],
-    store_id: str | None = None,
-    user_id: str | None = None,
-    actor_id: str | None = None,
+    store_id: OptionalUUIDQuery = None,
+    user_id: OptionalUUIDQuery = None,
+    actor_id: OptionalUUIDQuery = None,
     event_type: str | None = None,
     date_from: date | None = None,
     date_to: date | None = None,
@@ -246,12 +248,13 @@ async def list_history(
     per_page: int = 50,
 ) -> ScheduleHistoryListResponse:
     """집계 schedule history. GM+ only. SV/Staff은 cost diff 항목 redact."""
+    page, per_page = clamp_page_params(page, per_page)
     return await schedule_service.list_history(
         db, current_user.organization_id,
         actor=current_user,
-        store_id=UUID(store_id) if store_id else None,
-        user_id=UUID(user_id) if user_id else None,
-        actor_id=UUID(actor_id) if actor_id else None,
+        store_id=store_id,
+        user_id=user_id,
+        actor_id=actor_id,
         event_type=event_type,
         date_from=date_from, date_to=date_to,
         page=page, per_page=per_page,
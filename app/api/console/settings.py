@@ -23,6 +23,7 @@ from app.schemas.settings import (
 )
 from app.utils.exceptions import BadRequestError, ForbiddenError, NotFoundError
 from app.utils.settings_resolver import SettingNotRegisteredError, resolve_setting
+from app.utils.query_params import OptionalUUIDQuery
 
 router: APIRouter = APIRouter()
 
@@ -299,19 +300,19 @@ async def resolve(
     key: Annotated[str, Query()],
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("stores:read"))],
-    store_id: Annotated[str | None, Query()] = None,
-    user_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
+    user_id: OptionalUUIDQuery = None,
 ) -> ResolvedSettingResponse:
     """Setting 키 값 해결 (resolver utility 호출)."""
     # store_id 가 주어지면 접근 권한 검증 (cross-org IDOR 차단)
     if store_id is not None:
-        await _guard_store(db, current_user, UUID(store_id))
+        await _guard_store(db, current_user, store_id)
     try:
         value = await resolve_setting(
             db, key,
             organization_id=current_user.organization_id,
-            store_id=UUID(store_id) if store_id else None,
-            user_id=UUID(user_id) if user_id else None,
+            store_id=store_id,
+            user_id=user_id,
         )
     except SettingNotRegisteredError as e:
         raise NotFoundError(str(e))
@@ -4,7 +4,7 @@ Setup HTML page — Serves a simple form for initial admin account creation.
 The form POSTs to /api/v1/console/auth/setup (admin auth router).
 """
 
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fastapi import APIRouter, Depends
@@ -60,7 +60,8 @@ def _render(message: str = "") -> HTMLResponse:
 @router.get("/setup", response_class=HTMLResponse)
 async def setup_page(db: AsyncSession = Depends(get_db)) -> HTMLResponse:
     """초기 설정 페이지를 반환합니다."""
-    count = (await db.execute(select(func.count()).select_from(Organization))).scalar() or 0
-    if count > 0:
+    # 존재 여부만 확인 — 전체 COUNT 대신 1행만 조회
+    has_org = (await db.execute(select(Organization.id).limit(1))).first() is not None
+    if has_org:
         return _render('<div class="msg ok">Setup already completed. Use /docs or admin app to log in.</div>')
     return _render()
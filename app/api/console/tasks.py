@@ -22,6 +22,8 @@ from app.schemas.task import (
 )
 from app.services.task_service import task_service
 from app.core.permissions import is_gm_plus
+from app.utils.pagination import clamp_page_params
+from app.utils.query_params import OptionalUUIDQuery
 
 router: APIRouter = APIRouter()
 
@@ -30,16 +32,17 @@ router: APIRouter = APIRouter()
 async def list_tasks(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("tasks:read"))],
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
     status: Annotated[str | None, Query()] = None,
     category: Annotated[str | None, Query()] = None,
     page: int = 1,
     per_page: int = 50,
 ) -> dict:
+    page, per_page = clamp_page_params(page, per_page)
     tasks, total = await task_service.list_tasks(
         db,
         organization_id=current_user.organization_id,
-        store_id=UUID(store_id) if store_id else None,
+        store_id=store_id,
         status=status,
         category=category,
         page=page,
@@ -7,7 +7,7 @@ Permission: Owner + GM.
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import require_permission
@@ -15,6 +15,7 @@ from app.database import get_db
 from app.models.user import User
 from app.schemas.common import MessageResponse, TemplateLinkCreate, TemplateLinkResponse
 from app.services.template_link_service import template_link_service
+from app.utils.query_params import OptionalUUIDQuery
 
 router: APIRouter = APIRouter()
 
@@ -45,15 +46,15 @@ async def create_template_link(
 async def list_template_links(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("checklists:read"))],
-    store_id: Annotated[str | None, Query()] = None,
-    template_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
+    template_id: OptionalUUIDQuery = None,
 ) -> list[dict]:
     """체크리스트 템플릿 연결 목록을 조회합니다. Owner + GM."""
     links = await template_link_service.list_links(
         db,
         organization_id=current_user.organization_id,
-        store_id=UUID(store_id) if store_id else None,
-        template_id=UUID(template_id) if template_id else None,
+        store_id=store_id,
+        template_id=template_id,
     )
     return [await template_link_service.build_response(db, link) for link in links]
 
@@ -16,6 +16,7 @@ from app.models.user import User
 from app.schemas.common import MessageResponse, PaginatedResponse
 from app.schemas.voice import VoiceCreate, VoiceUpdate
 from app.services.voice_service import voice_service
+from app.utils.pagination import clamp_page_params
 
 router: APIRouter = APIRouter()
 
@@ -29,6 +30,7 @@ async def list_voices(
     per_page: int = 20,
 ) -> dict:
     """Voice 목록 조회. SV+ 가능."""
+    page, per_page = clamp_page_params(page, per_page)
     voices, total = await voice_service.list_voices(
         db, current_user.organization_id, status, page, per_page
     )
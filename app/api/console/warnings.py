@@ -60,6 +60,7 @@ from app.services.warning_signature_service import (
     warning_signature_service,
 )
 from app.utils.exceptions import BadRequestError, NotFoundError
+from app.utils.query_params import OptionalUUIDQuery
 
 # wet 서명 PDF 업로드 상한 (hiring 첨부와 동일 20MB).
 MAX_WARNING_PDF_BYTES = 20 * 1024 * 1024
@@ -77,7 +78,7 @@ logger = logging.getLogger(__name__)
 async def list_warnable_users(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("warnings:create"))],
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
     q: Annotated[str | None, Query()] = None,
     page: int = 1,
     limit: int = 30,
@@ -89,11 +90,10 @@ async def list_warnable_users(
     """
     page = max(1, page)
     limit = max(1, min(limit, 100))
-    store_uuid: UUID | None = UUID(store_id) if store_id else None
-    if store_uuid is not None:
-        await check_store_access(db, current_user, store_uuid)
+    if store_id is not None:
+        await check_store_access(db, current_user, store_id)
     return await warning_service.list_warnable_users(
-        db, current_user, store_id=store_uuid, q=q, page=page, limit=limit
+        db, current_user, store_id=store_id, q=q, page=page, limit=limit
     )
 
 
@@ -146,10 +146,10 @@ async def set_my_signature(
 async def list_warnings(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_permission("warnings:read"))],
-    store_id: Annotated[str | None, Query()] = None,
+    store_id: OptionalUUIDQuery = None,
     status: Annotated[str | None, Query()] = None,
     category: Annotated[str | None, Query()] = None,
-    subject_user_id: Annotated[str | None, Query()] = None,
+    subject_user_id: OptionalUUIDQuery = None,
     page: int = 1,
     per_page: int = 20,
 ) -> dict:
@@ -162,12 +162,11 @@ async def list_warnings(
     page = max(1, page)
 
     accessible = await get_accessible_store_ids(db, current_user)
-    store_uuid: UUID | None = UUID(store_id) if store_id else None
 
-    if store_uuid is not None:
-        if accessible is not None and store_uuid not in accessible:
+    if store_id is not None:
+        if accessible is not None and store_id not in accessible:
             return {"items": [], "total": 0, "page": page, "per_page": per_page}
-        store_ids: list[UUID] | None = [store_uuid]
+        store_ids: list[UUID] | None = [store_id]
     else:
         store_ids = list(accessible) if accessible is not None else None
 
@@ -177,7 +176,7 @@ async def list_warnings(
         store_ids=store_ids,
         status=status,
         category=category,
-        subject_user_id=UUID(subject_user_id) if subject_user_id else None,
+        subject_user_id=subject_user_id,
         page=page,
         per_page=per_page,
     )
@@ -5,6 +5,7 @@ Provides reusable dependencies for extracting the current user from JWT
 and enforcing permission-based access control on API endpoints.
 """
 
+import functools
 from datetime import datetime, timezone
 from typing import Annotated, Callable, Awaitable
 from uuid import UUID
@@ -13,8 +14,8 @@ import jwt
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.database import get_db
 from app.utils.jwt import decode_token
@@ -151,8 +152,13 @@ async def get_current_account(
     except (jwt.ExpiredSignatureError, jwt.InvalidTokenError, KeyError, ValueError):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
 
+    # 매 요청 실행되는 조회 — lambda_stmt 로 statement 구성/캐시 키 계산을 한 번만 (id 는 bind param).
+    # role 은 many-to-one 이라 joinedload 로 같은 round trip 에서 함께 로드
+    account_id = UUID(user_id)
     result = await db.execute(
-        select(User).options(selectinload(User.role)).where(User.id == UUID(user_id))
+        lambda_stmt(
+            lambda: select(User).options(joinedload(User.role)).where(User.id == account_id)
+        )
     )
     user: User | None = result.scalar_one_or_none()
 
@@ -254,10 +260,13 @@ async def get_user_permissions(db: AsyncSession, role_id: UUID) -> set[str]:
     return await permission_repository.get_permissions_by_role_id(db, role_id)
 
 
+@functools.cache
 def require_permission(*permission_codes: str) -> Callable[..., Awaitable[User]]:
     """Permission 기반 권한 검사 의존성 팩토리.
 
     지정된 모든 permission code를 가지고 있어야 접근 허용.
+    같은 code 조합은 같은 callable 을 돌려줘서 FastAPI 가 한 요청 안에서 결과를 재사용
+    (route 와 router dependencies 에 중복 선언돼도 검사 1회).
     """
     async def _check(
         current_user: Annotated[User, Depends(get_current_user)],
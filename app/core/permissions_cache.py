@@ -0,0 +1,36 @@
+"""Permission 코드 in-memory 캐시.
+
+permissions 테이블(code → id)은 배포 단위로 고정이라 startup 에서 한 번 읽어 CODES 에 둔다.
+role → permission 매핑은 캐시하지 않는다 — 권한 회수/역할 삭제가 모든 worker 에서
+즉시 반영돼야 하므로 require_permission 은 매 요청 DB 에서 조회한다.
+"""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Mapping
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# permission code → id (startup 에서 load())
+CODES: Mapping[str, UUID] = MappingProxyType({})
+
+
+async def load(db: AsyncSession) -> Mapping[str, UUID]:
+    """permissions 전체를 읽어 CODES 교체."""
+    from app.models.permission import Permission
+
+    global CODES
+    result = await db.execute(select(Permission.code, Permission.id))
+    CODES = MappingProxyType({row.code: row.id for row in result})
+    return CODES
+
+
+async def get_codes(db: AsyncSession) -> Mapping[str, UUID]:
+    """CODES 반환 — startup load 전이거나 실패했으면 지금 load."""
+    if not CODES:
+        return await load(db)
+    return CODES
+
@@ -9,21 +9,34 @@ from collections.abc import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 
 from app.config import settings
 
-# 비동기 데이터베이스 엔진 — Async database engine (asyncpg driver)
+# 커넥션 풀 옵션 — DB_NULL_POOL 이면 외부 풀러에 풀링을 맡기고 NullPool (풀 크기 옵션은 전달 불가)
 # pool_pre_ping=True: 커넥션 풀에서 꺼낸 연결의 유효성을 사전 확인 (Validates connections before use)
+_pool_kwargs: dict = (
+    {"poolclass": NullPool}
+    if settings.DB_NULL_POOL
+    else {
+        "pool_pre_ping": True,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+)
+# 비동기 데이터베이스 엔진 — Async database engine (asyncpg driver)
 engine: AsyncEngine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_size=2,
-    max_overflow=3,
-    pool_recycle=300,
-    # Supavisor(트랜잭션 모드 풀러)에서 prepared statement 비활성화
-    # Disable prepared statement caches for Supavisor transaction-mode pooling
-    connect_args={"statement_cache_size": 0, "prepared_statement_cache_size": 0},
+    **_pool_kwargs,
+    # Supavisor(트랜잭션 모드 풀러)에서는 prepared statement 비활성화 (기본 0)
+    # Prepared statement caches stay off for Supavisor transaction-mode pooling unless overridden
+    connect_args={
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    },
 )
 
 # 비동기 세션 팩토리 — Async session factory
@@ -6,6 +6,7 @@ Configures CORS, health check, and includes routers for each phase.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.config import settings
@@ -17,6 +18,8 @@ app: FastAPI = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    # orjson 으로 응답 직렬화 — stdlib json 보다 빠름 (Faster JSON rendering for all responses)
+    default_response_class=ORJSONResponse,
 )
 
 # Axiom API 로깅 미들웨어 — Axiom API request/response logging
@@ -494,6 +497,27 @@ async def sync_default_role_permissions() -> None:
         logger.warning(f"Failed to sync default role_permissions: {e}")
 
 
+# ---------------------------------------------------------------------------
+# Startup: permission code → id 캐시 적재
+# registry/role_permissions sync 이후에 실행되도록 그 뒤에 등록.
+# ---------------------------------------------------------------------------
+@app.on_event("startup")
+async def load_permissions_cache() -> None:
+    """permissions 테이블을 permissions_cache.CODES 로 적재 (실패 시 첫 사용 때 재시도)."""
+    import logging
+
+    from app.core import permissions_cache
+    from app.database import async_session
+
+    logger = logging.getLogger("uvicorn.error")
+    try:
+        async with async_session() as db:
+            codes = await permissions_cache.load(db)
+        logger.info(f"[permissions_cache] Loaded {len(codes)} permissions")
+    except Exception as e:
+        logger.warning(f"Failed to load permissions cache: {e}")
+
+
 # ---------------------------------------------------------------------------
 # Startup: Evaluation Basic template bootstrap
 # ---------------------------------------------------------------------------
@@ -22,6 +22,7 @@ from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint, Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class AccessCode(Base):
@@ -46,7 +47,7 @@ class AccessCode(Base):
     )
 
     # 내부 식별자 — Internal PK
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 서비스 키 — 서비스별 식별자. 예: "attendance"
     service_key: Mapped[str] = mapped_column(String(50), nullable=False)
     # 소속 조직 FK — 조직별 코드 (org 삭제 시 CASCADE). nullable: 전역 서비스 대비.
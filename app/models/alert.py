@@ -14,6 +14,7 @@ from sqlalchemy import String, Boolean, DateTime, ForeignKey, Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class Alert(Base):
@@ -48,8 +49,8 @@ class Alert(Base):
 
     __tablename__ = "alerts"
 
-    # 알림 고유 식별자 — Alert unique identifier (UUID v4, auto-generated)
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    # 알림 고유 식별자 — Alert unique identifier (UUIDv7, auto-generated)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 소속 조직 FK — Organization scope for multi-tenant isolation
     organization_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     # 수신자 FK — Target user who receives this alert
@@ -18,6 +18,7 @@ from sqlalchemy import Boolean, DateTime, Index, String, Text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class AppVersion(Base):
@@ -38,7 +39,7 @@ class AppVersion(Base):
 
     __tablename__ = "app_versions"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     channel: Mapped[str] = mapped_column(String(64), nullable=False)
     version: Mapped[str] = mapped_column(String(32), nullable=False)
     s3_key: Mapped[str] = mapped_column(String(512), nullable=False)
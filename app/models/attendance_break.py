@@ -22,6 +22,7 @@ from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 # 신규 정식 값 — 모든 write 는 normalize_break_type 통과 후 이 값으로 저장.
@@ -68,7 +69,7 @@ class AttendanceBreak(Base):
 
     __tablename__ = "attendance_breaks"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     attendance_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("attendances.id", ondelete="CASCADE"), nullable=False
     )
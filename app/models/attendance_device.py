@@ -18,6 +18,7 @@ from sqlalchemy import DateTime, ForeignKey, Index, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class AttendanceDevice(Base):
@@ -36,8 +37,8 @@ class AttendanceDevice(Base):
 
     __tablename__ = "attendance_devices"
 
-    # 기기 고유 식별자 — Device PK (UUID v4, auto-generated)
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    # 기기 고유 식별자 — Device PK (UUIDv7, auto-generated)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 소속 조직 FK — 조직 삭제 시 기기도 삭제
     organization_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
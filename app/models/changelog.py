@@ -21,6 +21,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 # 카테고리 — 입력 검증은 Pydantic Literal(schemas)에서. DB는 String + 코드값.
 # general = 제품 전반/통합 업데이트(특정 표면에 한정되지 않음). 나머지는 제품 표면별.
@@ -38,7 +39,7 @@ class ChangelogPost(Base):
 
     __tablename__ = "changelog_posts"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 전역 고유 slug (URL 식별자). 발행/초안 무관 단일 행.
     slug: Mapped[str] = mapped_column(String(120), nullable=False, unique=True)
     # 카테고리: general | staff_app | attendance_app | console | homepage
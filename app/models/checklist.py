@@ -19,11 +19,41 @@ Tables:
 import uuid
 from datetime import date, datetime, timezone
 from typing import Optional
-from sqlalchemy import Boolean, String, DateTime, Date, Integer, Text, ForeignKey, UniqueConstraint, Uuid, Index
+from sqlalchemy import Boolean, CheckConstraint, String, DateTime, Date, Integer, SmallInteger, Text, ForeignKey, UniqueConstraint, Uuid, Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
+
+
+class WeekdayBitmap(TypeDecorator):
+    """요일 목록 ↔ smallint 비트맵 변환 타입.
+
+    Stores a weekday list ([0=Mon..6=Sun]) as a smallint bitmap (bit n = weekday n).
+    Python 쪽은 기존 JSONB 와 동일하게 정렬된 list[int] 로 다룬다. NULL 은 None 그대로.
+    0..6 밖의 값은 비트가 유실/overflow 되므로 저장 전에 ValueError.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        bits = 0
+        for day in value:
+            day = int(day)
+            if not 0 <= day <= 6:
+                raise ValueError(f"weekday must be 0..6, got {day}")
+            bits |= 1 << day
+        return bits
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return [day for day in range(7) if value & (1 << day)]
 
 
 class ChecklistTemplate(Base):
@@ -57,8 +87,8 @@ class ChecklistTemplate(Base):
 
     __tablename__ = "checklist_templates"
 
-    # 템플릿 고유 식별자 — Template unique identifier (UUID v4, auto-generated)
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    # 템플릿 고유 식별자 — Template unique identifier (UUIDv7, auto-generated)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 소속 매장 FK — Store scope (CASCADE: 매장 삭제 시 템플릿도 삭제)
     store_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("stores.id", ondelete="CASCADE"), nullable=False)
     # 시간대 FK — Shift scope (CASCADE: 시간대 삭제 시 템플릿도 삭제)
@@ -109,8 +139,8 @@ class ChecklistTemplateItem(Base):
 
     __tablename__ = "checklist_template_items"
 
-    # 항목 고유 식별자 — Item unique identifier (UUID v4, auto-generated)
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    # 항목 고유 식별자 — Item unique identifier (UUIDv7, auto-generated)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 소속 템플릿 FK — Parent template (CASCADE: 템플릿 삭제 시 항목도 삭제)
     template_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("checklist_templates.id", ondelete="CASCADE"), nullable=False)
     # 항목 제목 — Task title/description (max 500 chars)
@@ -124,7 +154,8 @@ class ChecklistTemplateItem(Base):
     # 반복 주기 유형 — "daily"=매일, "weekly"=특정 요일만
     recurrence_type: Mapped[str] = mapped_column(String(10), default="daily", nullable=False)
     # 반복 요일 목록 — weekly일 때 요일 숫자 배열 [0=Mon..6=Sun]. daily이면 null
-    recurrence_days: Mapped[list[int] | None] = mapped_column(JSONB, nullable=True, default=None)
+    # DB 에는 smallint 비트맵으로 저장 (WeekdayBitmap)
+    recurrence_days: Mapped[list[int] | None] = mapped_column(WeekdayBitmap, nullable=True, default=None)
     # 정렬 순서 — Display sort order (0-based, supports drag-and-drop reordering)
     sort_order: Mapped[int] = mapped_column(Integer, default=0)
     # 생성 일시 — Record creation timestamp (UTC)
@@ -162,8 +193,8 @@ class ChecklistInstance(Base):
 
     __tablename__ = "cl_instances"
 
-    # 인스턴스 고유 식별자 — Instance unique identifier (UUID v4, auto-generated)
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    # 인스턴스 고유 식별자 — Instance unique identifier (UUIDv7, auto-generated)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 소속 조직 FK — Organization scope for multi-tenant data isolation
     organization_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     # 원본 템플릿 FK — Source template (SET NULL: 템플릿 삭제 시 null, 아이템은 유지)
@@ -177,9 +208,9 @@ class ChecklistInstance(Base):
     # 근무 날짜 — Date of the work assignment (date only, no time)
     work_date: Mapped[date] = mapped_column(Date, nullable=False)
     # 총 항목 수 — Total number of checklist items (denormalized for quick progress display)
-    total_items: Mapped[int] = mapped_column(Integer, default=0)
+    total_items: Mapped[int] = mapped_column(SmallInteger, default=0)
     # 완료 항목 수 — Number of completed items (denormalized, updated on item completion)
-    completed_items: Mapped[int] = mapped_column(Integer, default=0)
+    completed_items: Mapped[int] = mapped_column(SmallInteger, default=0)
     # 진행 상태 — Workflow status: "pending" → "in_progress" → "completed"
     status: Mapped[str] = mapped_column(String(20), default="pending")
     # 생성 일시 — Record creation timestamp (UTC)
@@ -191,7 +222,7 @@ class ChecklistInstance(Base):
     reported_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # 점수 데이터 — Score fields (set by reviewer after all items are reviewed)
-    score: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    score: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)  # 0..100
     score_note: Mapped[str | None] = mapped_column(Text, nullable=True)
     scored_by: Mapped[Optional[uuid.UUID]] = mapped_column(Uuid, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     scored_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -204,6 +235,26 @@ class ChecklistInstance(Base):
         order_by="ChecklistInstanceItem.item_index",
     )
 
+    __table_args__ = (
+        # 목록 조회(org/store/user + work_date 정렬) 및 FK 역참조(CASCADE/SET NULL) 커버
+        Index("ix_cl_instances_org_date", "organization_id", "work_date"),
+        Index("ix_cl_instances_store_date", "store_id", "work_date"),
+        Index("ix_cl_instances_user_date", "user_id", "work_date"),
+        Index("ix_cl_instances_template_id", "template_id"),
+        # 진행 중(pending/in_progress) 인스턴스만 — completed 가 대부분이 되어도 작게 유지
+        Index(
+            "ix_cl_instances_active",
+            "store_id",
+            "work_date",
+            postgresql_where=text("status IN ('pending', 'in_progress')"),
+        ),
+        # 기존 row 는 검증하지 않음(NOT VALID) — 구 work_assignments 상태가 섞여 있을 수 있음
+        CheckConstraint(
+            "status IN ('pending', 'in_progress', 'completed')",
+            name="ck_cl_instances_status",
+        ),
+    )
+
 
 class ChecklistInstanceItem(Base):
     """체크리스트 인스턴스 항목 — 인스턴스별 항목 1행. 템플릿 스냅샷 + 완료 + 리뷰 통합.
@@ -215,7 +266,7 @@ class ChecklistInstanceItem(Base):
 
     __tablename__ = "cl_instance_items"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 소속 인스턴스 FK — Parent instance (CASCADE: 인스턴스 삭제 시 항목도 삭제)
     instance_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("cl_instances.id", ondelete="CASCADE"), nullable=False)
     # 항목 인덱스 — 0-based index within the instance (matches original snapshot order)
@@ -232,7 +283,7 @@ class ChecklistInstanceItem(Base):
     # 반복 스냅샷 — Recurrence snapshot (copied from template for client-side display/filtering)
     # NULL = template/item deleted or legacy data (no badge shown)
     recurrence_type: Mapped[str | None] = mapped_column(String(10), nullable=True)
-    recurrence_days: Mapped[list[int] | None] = mapped_column(JSONB, nullable=True)
+    recurrence_days: Mapped[list[int] | None] = mapped_column(WeekdayBitmap, nullable=True)
 
     # 완료 데이터 — Completion data (updated when staff completes the item)
     is_completed: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -283,7 +334,7 @@ class ChecklistItemSubmission(Base):
 
     __tablename__ = "cl_item_submissions"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     item_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("cl_instance_items.id", ondelete="CASCADE"), nullable=False)
     version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
     note: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -307,7 +358,7 @@ class ChecklistItemReviewLog(Base):
 
     __tablename__ = "cl_item_reviews_log"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     item_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("cl_instance_items.id", ondelete="CASCADE"), nullable=False)
     old_result: Mapped[str | None] = mapped_column(String(20), nullable=True)
     new_result: Mapped[str | None] = mapped_column(String(20), nullable=True)  # NULL = review cancelled
@@ -332,7 +383,7 @@ class ChecklistItemMessage(Base):
 
     __tablename__ = "cl_item_messages"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     item_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("cl_instance_items.id", ondelete="CASCADE"), nullable=False)
     author_id: Mapped[uuid.UUID | None] = mapped_column(Uuid, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     # 텍스트 본문 (사진만 보내는 경우 NULL)
@@ -354,7 +405,7 @@ class ClScoreHistory(Base):
 
     __tablename__ = "cl_score_history"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     instance_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("cl_instances.id", ondelete="CASCADE"), nullable=False)
     old_score: Mapped[int | None] = mapped_column(Integer, nullable=True)
     new_score: Mapped[int] = mapped_column(Integer, nullable=False)
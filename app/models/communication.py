@@ -17,10 +17,11 @@ Tables:
 import uuid
 from datetime import datetime, timezone
 from typing import Optional
-from sqlalchemy import String, DateTime, Text, ForeignKey, TIMESTAMP, UniqueConstraint, Uuid
+from sqlalchemy import String, DateTime, Index, Text, ForeignKey, TIMESTAMP, UniqueConstraint, Uuid, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class Notice(Base):
@@ -43,8 +44,8 @@ class Notice(Base):
 
     __tablename__ = "notices"
 
-    # 공지 고유 식별자 — Notice unique identifier (UUID v4, auto-generated)
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    # 공지 고유 식별자 — Notice unique identifier (UUIDv7, auto-generated)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 소속 조직 FK — Organization scope for multi-tenant isolation
     organization_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     # 대상 매장 FK — NULL이면 조직 전체 공지 (NULL = org-wide, SET NULL on store delete)
@@ -82,13 +83,15 @@ class NoticeRead(Base):
 
     __tablename__ = "notice_reads"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     notice_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("notices.id", ondelete="CASCADE"), nullable=False)
     user_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     read_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
 
     __table_args__ = (
         UniqueConstraint("notice_id", "user_id", name="uq_notice_read"),
+        # 사용자 삭제 CASCADE / 사용자별 읽음 조회 — uq 는 notice_id 선두라 못 씀
+        Index("ix_notice_reads_user_id", "user_id"),
     )
 
 
@@ -116,7 +119,7 @@ class Voice(Base):
 
     __tablename__ = "voices"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     organization_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     store_id: Mapped[uuid.UUID | None] = mapped_column(Uuid, ForeignKey("stores.id", ondelete="SET NULL"), nullable=True)
     title: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -131,3 +134,13 @@ class Voice(Base):
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        # 미처리(open/in_progress) voice 만 담는 partial index — resolved 가 쌓여도 작게 유지
+        Index(
+            "ix_voices_org_active",
+            "organization_id",
+            "created_at",
+            postgresql_where=text("status IN ('open', 'in_progress')"),
+        ),
+    )
@@ -4,12 +4,13 @@ from typing import Optional
 from sqlalchemy import String, Integer, Boolean, Date, DateTime, Text, ForeignKey, UniqueConstraint, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class DailyReportTemplate(Base):
     __tablename__ = "daily_report_templates"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     organization_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     store_id: Mapped[uuid.UUID | None] = mapped_column(Uuid, ForeignKey("stores.id", ondelete="SET NULL"), nullable=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -24,7 +25,7 @@ class DailyReportTemplate(Base):
 class DailyReportTemplateSection(Base):
     __tablename__ = "daily_report_template_sections"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     template_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("daily_report_templates.id", ondelete="CASCADE"), nullable=False)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -38,7 +39,7 @@ class DailyReportTemplateSection(Base):
 class DailyReport(Base):
     __tablename__ = "daily_reports"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     organization_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     store_id: Mapped[Optional[uuid.UUID]] = mapped_column(Uuid, ForeignKey("stores.id", ondelete="SET NULL"), nullable=True)
     template_id: Mapped[Optional[uuid.UUID]] = mapped_column(Uuid, ForeignKey("daily_report_templates.id", ondelete="SET NULL"), nullable=True)
@@ -63,7 +64,7 @@ class DailyReport(Base):
 class DailyReportSection(Base):
     __tablename__ = "daily_report_sections"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     report_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("daily_reports.id", ondelete="CASCADE"), nullable=False)
     template_section_id: Mapped[Optional[uuid.UUID]] = mapped_column(Uuid, ForeignKey("daily_report_template_sections.id", ondelete="SET NULL"), nullable=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -78,7 +79,7 @@ class DailyReportSection(Base):
 class DailyReportComment(Base):
     __tablename__ = "daily_report_comments"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     report_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("daily_reports.id", ondelete="CASCADE"), nullable=False)
     user_id: Mapped[Optional[uuid.UUID]] = mapped_column(Uuid, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     content: Mapped[str] = mapped_column(Text, nullable=False)
@@ -14,6 +14,7 @@ from sqlalchemy import Boolean, DateTime, Integer, String, Uuid, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class EmailVerificationCode(Base):
@@ -38,7 +39,7 @@ class EmailVerificationCode(Base):
     __tablename__ = "email_verification_codes"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, primary_key=True, default=uuid.uuid4
+        Uuid, primary_key=True, default=uuid7
     )
     email: Mapped[str] = mapped_column(String(255), nullable=False)
     code: Mapped[str] = mapped_column(String(6), nullable=False)
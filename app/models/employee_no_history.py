@@ -17,6 +17,7 @@ from sqlalchemy import DateTime, ForeignKey, Index, String, UniqueConstraint, Uu
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class EmployeeNoHistory(Base):
@@ -39,8 +40,8 @@ class EmployeeNoHistory(Base):
 
     __tablename__ = "employee_no_history"
 
-    # 고유 식별자 — Unique identifier (UUID v4, auto-generated)
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    # 고유 식별자 — Unique identifier (UUIDv7, auto-generated)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 소속 조직 FK — Parent organization (CASCADE: 조직 삭제 시 이력도 삭제)
     organization_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
@@ -20,6 +20,7 @@ from typing import Optional
 
 from sqlalchemy import (
     Boolean,
+    CheckConstraint,
     Date,
     DateTime,
     ForeignKey,
@@ -29,11 +30,13 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     Uuid,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class EvalTemplate(Base):
@@ -62,8 +65,8 @@ class EvalTemplate(Base):
 
     __tablename__ = "eval_templates"
 
-    # 템플릿 고유 식별자 — Template unique identifier (UUID v4, auto-generated)
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    # 템플릿 고유 식별자 — Template unique identifier (UUIDv7, auto-generated)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 소속 조직 FK — Parent organization (CASCADE: 조직 삭제 시 템플릿도 삭제)
     organization_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True
@@ -106,6 +109,7 @@ class EvalTemplate(Base):
     __table_args__ = (
         UniqueConstraint("organization_id", "version", name="uq_eval_template_org_version"),
         Index("ix_eval_templates_organization_id", "organization_id"),
+        CheckConstraint("status IN ('published', 'draft')", name="ck_eval_templates_status"),
     )
 
 
@@ -148,8 +152,8 @@ class Evaluation(Base):
 
     __tablename__ = "evaluations"
 
-    # 평가 고유 식별자 — Evaluation unique identifier (UUID v4, auto-generated)
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    # 평가 고유 식별자 — Evaluation unique identifier (UUIDv7, auto-generated)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 소속 조직 FK — Organization scope for multi-tenant isolation (CASCADE)
     organization_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True
@@ -219,4 +223,17 @@ class Evaluation(Base):
         Index("ix_evaluations_evaluatee_id", "evaluatee_id"),
         # 상시 켜지는 soft-delete + org 필터 커버
         Index("ix_evaluations_org_deleted", "organization_id", "deleted_at"),
+        # 피평가자별 최신순 목록 — ORDER BY created_at DESC 를 인덱스 순서로 처리 (sort 없음)
+        Index(
+            "ix_evaluations_org_evaluatee_created",
+            "organization_id",
+            "evaluatee_id",
+            text("created_at DESC"),
+            postgresql_include=["status", "submitted_at"],
+        ),
+        # FK 역참조 (user/store/template 삭제 시 SET NULL)
+        Index("ix_evaluations_evaluator_id", "evaluator_id"),
+        Index("ix_evaluations_store_id", "store_id"),
+        Index("ix_evaluations_template_id", "template_id"),
+        CheckConstraint("status IN ('draft', 'submitted')", name="ck_evaluations_status"),
     )
@@ -27,6 +27,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class File(Base):
@@ -52,7 +53,7 @@ class File(Base):
 
     __tablename__ = "files"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
 
     organization_id: Mapped[uuid.UUID | None] = mapped_column(
         Uuid, ForeignKey("organizations.id", ondelete="SET NULL"), nullable=True
@@ -112,7 +113,7 @@ class FileUsage(Base):
 
     __tablename__ = "file_usages"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     file_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("files.id", ondelete="CASCADE"), nullable=False
     )
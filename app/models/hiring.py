@@ -32,6 +32,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.types import Uuid
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class StoreHiringForm(Base):
@@ -43,7 +44,7 @@ class StoreHiringForm(Base):
 
     __tablename__ = "store_hiring_forms"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     store_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("stores.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -87,7 +88,7 @@ class Candidate(Base):
 
     __tablename__ = "candidates"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     username: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
     # 사용자 입력 그대로(표시용)
     email: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -131,7 +132,7 @@ class Application(Base):
 
     __tablename__ = "applications"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     candidate_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -193,7 +194,7 @@ class CandidateBlock(Base):
 
     __tablename__ = "candidate_blocks"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     candidate_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -226,7 +227,7 @@ class ApplicationReview(Base):
 
     __tablename__ = "application_reviews"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     application_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("applications.id", ondelete="CASCADE"), nullable=False, index=True
     )
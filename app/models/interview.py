@@ -17,6 +17,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.types import Uuid
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class InterviewSlot(Base):
@@ -27,7 +28,7 @@ class InterviewSlot(Base):
 
     __tablename__ = "interview_slots"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     organization_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -58,7 +59,7 @@ class InterviewSlotPreference(Base):
 
     __tablename__ = "interview_slot_preferences"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     application_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("applications.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -23,6 +23,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class InventoryCategory(Base):
@@ -42,7 +43,7 @@ class InventoryCategory(Base):
 
     __tablename__ = "inventory_categories"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     organization_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
     )
@@ -83,7 +84,7 @@ class InventorySubUnit(Base):
         UniqueConstraint("organization_id", "code", name="uq_inventory_sub_units_org_code"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     organization_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
     )
@@ -123,7 +124,7 @@ class InventoryProduct(Base):
         UniqueConstraint("organization_id", "code", name="uq_inventory_products_org_code"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     organization_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
     )
@@ -178,7 +179,7 @@ class StoreInventory(Base):
         UniqueConstraint("store_id", "product_id", name="uq_store_inventory_store_product"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     store_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("stores.id", ondelete="CASCADE"), nullable=False
     )
@@ -227,7 +228,7 @@ class InventoryTransaction(Base):
 
     __tablename__ = "inventory_transactions"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     store_inventory_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("store_inventory.id", ondelete="CASCADE"), nullable=False
     )
@@ -271,7 +272,7 @@ class InventoryAudit(Base):
 
     __tablename__ = "inventory_audits"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     store_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("stores.id", ondelete="CASCADE"), nullable=False
     )
@@ -312,7 +313,7 @@ class InventoryAuditItem(Base):
 
     __tablename__ = "inventory_audit_items"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     audit_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("inventory_audits.id", ondelete="CASCADE"), nullable=False
     )
@@ -346,7 +347,7 @@ class InventoryAuditSetting(Base):
         UniqueConstraint("store_id", name="uq_inventory_audit_settings_store"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     store_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("stores.id", ondelete="CASCADE"), nullable=False
     )
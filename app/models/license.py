@@ -12,6 +12,7 @@ from sqlalchemy import DateTime, ForeignKey, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 # 라이센스 상태 — active: 정상 / suspended: 운영자 정지(접근차단) / expired: 만료(접근차단)
 LICENSE_STATUSES = ("active", "suspended", "expired")
@@ -34,7 +35,7 @@ class License(Base):
 
     __tablename__ = "licenses"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     organization_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, unique=True
     )
@@ -27,6 +27,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 # 소속 상태 — org 별 재직 상태. 계정 전체 상태(users.status)와 별개 층.
 ORG_MEMBER_STATUSES = ("active", "on_leave", "terminated")
@@ -58,7 +59,7 @@ class OrgMember(Base):
 
     __tablename__ = "org_members"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 전역 계정 FK — 계정 하드 purge(관리자 명시) 시에만 삭제. 소프트 삭제(status)는 행 유지.
     user_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
@@ -144,7 +145,7 @@ class OrgMemberStore(Base):
 
     __tablename__ = "org_member_stores"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     org_member_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("org_members.id", ondelete="CASCADE"), nullable=False, index=True
     )
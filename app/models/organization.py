@@ -33,15 +33,20 @@ STORE_STATUSES = (
 )
 
 
+# 회사 코드 문자셋 / 난수원 — 호출마다 재계산하지 않도록 모듈 로드 시 한 번만 생성
+_COMPANY_CODE_CHARS = string.ascii_uppercase + string.digits
+_COMPANY_CODE_RNG = random.SystemRandom()
+
+
 def generate_company_code() -> str:
     """6자리 랜덤 회사 코드 생성 (대문자 + 숫자).
 
     Generate a random 6-character company code (uppercase letters + digits).
     """
-    chars = string.ascii_uppercase + string.digits
-    return "".join(random.choices(chars, k=6))
+    return "".join(_COMPANY_CODE_RNG.choices(_COMPANY_CODE_CHARS, k=6))
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class Organization(Base):
@@ -65,8 +70,8 @@ class Organization(Base):
 
     __tablename__ = "organizations"
 
-    # 조직 고유 식별자 — Organization unique identifier (UUID v4, auto-generated)
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    # 조직 고유 식별자 — Organization unique identifier (UUIDv7, auto-generated)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 조직 이름 — Organization display name (max 255 chars, required)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     # 회사 코드 — Short unique company code for staff app login (6 chars, uppercase + digits)
@@ -120,8 +125,8 @@ class Store(Base):
 
     __tablename__ = "stores"
 
-    # 매장 고유 식별자 — Store unique identifier (UUID v4, auto-generated)
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    # 매장 고유 식별자 — Store unique identifier (UUIDv7, auto-generated)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 소속 조직 FK — Parent organization (CASCADE: 조직 삭제 시 매장도 삭제)
     organization_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     # 매장 이름 — Store display name
@@ -222,7 +227,7 @@ class ShiftPreset(Base):
 
     __tablename__ = "shift_presets"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     organization_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     store_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("stores.id", ondelete="CASCADE"), nullable=False)
     shift_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("shifts.id", ondelete="CASCADE"), nullable=False)
@@ -237,6 +242,13 @@ class ShiftPreset(Base):
     store = relationship("Store", foreign_keys=[store_id])
     shift = relationship("Shift", foreign_keys=[shift_id])
 
+    __table_args__ = (
+        # FK 역참조 (조직/매장/시프트 삭제 CASCADE) + 매장별 프리셋 조회
+        Index("ix_shift_presets_organization_id", "organization_id"),
+        Index("ix_shift_presets_store_id", "store_id"),
+        Index("ix_shift_presets_shift_id", "shift_id"),
+    )
+
 
 class LaborLawSetting(Base):
     """노동법 설정 모델 — 매장별 초과근무/노동법 기준값.
@@ -256,7 +268,7 @@ class LaborLawSetting(Base):
 
     __tablename__ = "labor_law_settings"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     organization_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     store_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("stores.id", ondelete="CASCADE"), nullable=False)
     federal_max_weekly: Mapped[int] = mapped_column(Integer, default=40)
@@ -267,3 +279,9 @@ class LaborLawSetting(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
     store = relationship("Store", foreign_keys=[store_id])
+
+    __table_args__ = (
+        # FK 역참조 (조직/매장 삭제 CASCADE) + org/store 조회
+        Index("ix_labor_law_settings_org_store", "organization_id", "store_id"),
+        Index("ix_labor_law_settings_store_id", "store_id"),
+    )
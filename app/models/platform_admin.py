@@ -15,6 +15,7 @@ from sqlalchemy import Boolean, DateTime, ForeignKey, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 # operator 등급 — v1 은 'super' 단일. 확장(범위 제한 등)은 나중.
 PLATFORM_ADMIN_LEVELS = ("super",)
@@ -34,7 +35,7 @@ class PlatformAdmin(Base):
 
     __tablename__ = "platform_admins"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     user_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True
     )
@@ -19,6 +19,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class ReportTemplate(Base):
@@ -30,7 +31,7 @@ class ReportTemplate(Base):
 
     __tablename__ = "report_templates"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     type: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
     organization_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=True
@@ -67,7 +68,7 @@ class Report(Base):
 
     __tablename__ = "reports"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     type: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
     organization_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
@@ -132,7 +133,7 @@ class ReportComment(Base):
 
     __tablename__ = "report_comments"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     report_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("reports.id", ondelete="CASCADE"), nullable=False
     )
@@ -169,7 +170,7 @@ class ReportType(Base):
 
     __tablename__ = "report_types"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     organization_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
     )
@@ -233,7 +234,7 @@ class ReportAcknowledgement(Base):
 
     __tablename__ = "report_acknowledgements"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     report_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("reports.id", ondelete="CASCADE"), nullable=False
     )
@@ -18,6 +18,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class SettingsRegistry(Base):
@@ -46,7 +47,7 @@ class OrgSetting(Base):
 
     __tablename__ = "org_settings"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     organization_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     key: Mapped[str] = mapped_column(String(100), ForeignKey("settings_registry.key", ondelete="CASCADE"), nullable=False)
     value: Mapped[dict] = mapped_column(JSONB, nullable=False)
@@ -65,7 +66,7 @@ class StoreSetting(Base):
 
     __tablename__ = "store_settings"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     store_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("stores.id", ondelete="CASCADE"), nullable=False)
     key: Mapped[str] = mapped_column(String(100), ForeignKey("settings_registry.key", ondelete="CASCADE"), nullable=False)
     value: Mapped[dict] = mapped_column(JSONB, nullable=False)
@@ -82,7 +83,7 @@ class StaffSetting(Base):
 
     __tablename__ = "staff_settings"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     user_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     key: Mapped[str] = mapped_column(String(100), ForeignKey("settings_registry.key", ondelete="CASCADE"), nullable=False)
     value: Mapped[dict] = mapped_column(JSONB, nullable=False)
@@ -36,6 +36,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class TipEntry(Base):
@@ -59,7 +60,7 @@ class TipEntry(Base):
 
     __tablename__ = "tip_entries"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     schedule_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         Uuid, ForeignKey("schedules.id", ondelete="SET NULL"), nullable=True
     )
@@ -120,7 +121,7 @@ class TipDistribution(Base):
 
     __tablename__ = "tip_distributions"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     entry_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("tip_entries.id", ondelete="CASCADE"), nullable=False
     )
@@ -158,7 +159,7 @@ class Form4070Document(Base):
 
     __tablename__ = "form_4070_documents"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     employee_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
@@ -202,7 +203,7 @@ class TipPeriod(Base):
 
     __tablename__ = "tip_periods"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     store_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("stores.id", ondelete="CASCADE"), nullable=False
     )
@@ -249,7 +250,7 @@ class TipAuditLog(Base):
 
     __tablename__ = "tip_audit_logs"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     entity_type: Mapped[str] = mapped_column(String(30), nullable=False)
     entity_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
     action: Mapped[str] = mapped_column(String(20), nullable=False)
@@ -17,6 +17,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class Role(Base):
@@ -45,8 +46,8 @@ class Role(Base):
 
     __tablename__ = "roles"
 
-    # 역할 고유 식별자 — Role unique identifier (UUID v4, auto-generated)
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    # 역할 고유 식별자 — Role unique identifier (UUIDv7, auto-generated)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 소속 조직 FK — Parent organization (CASCADE: 조직 삭제 시 역할도 삭제)
     organization_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     # 역할 이름 — Role display name (e.g. "owner", "general_manager", "supervisor", "staff")
@@ -101,8 +102,8 @@ class User(Base):
 
     __tablename__ = "users"
 
-    # 사용자 고유 식별자 — User unique identifier (UUID v4, auto-generated)
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    # 사용자 고유 식별자 — User unique identifier (UUIDv7, auto-generated)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 소속 조직 FK — Parent organization (CASCADE: 조직 삭제 시 사용자도 삭제)
     # [Model B 이행] 전환 후 제거 예정. org 소속은 org_members 로 이동.
     organization_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
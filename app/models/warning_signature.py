@@ -23,6 +23,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class WarningSignature(Base):
@@ -44,8 +45,8 @@ class WarningSignature(Base):
 
     __tablename__ = "warning_signatures"
 
-    # 고유 식별자 — Unique identifier (UUID v4)
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    # 고유 식별자 — Unique identifier (UUIDv7)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 대상 경고 FK — Warning (CASCADE: 경고 삭제 시 서명도 삭제)
     warning_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("warnings.id", ondelete="CASCADE"), nullable=False, index=True
@@ -15,6 +15,7 @@ from sqlalchemy import String, DateTime, Integer, ForeignKey, UniqueConstraint,
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.uuid7 import uuid7
 
 
 class Shift(Base):
@@ -40,8 +41,8 @@ class Shift(Base):
 
     __tablename__ = "shifts"
 
-    # 시간대 고유 식별자 — Shift unique identifier (UUID v4, auto-generated)
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    # 시간대 고유 식별자 — Shift unique identifier (UUIDv7, auto-generated)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 소속 매장 FK — Parent store (CASCADE: 매장 삭제 시 시간대도 삭제)
     store_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("stores.id", ondelete="CASCADE"), nullable=False)
     # 시간대 이름 — Shift display name
@@ -84,8 +85,8 @@ class Position(Base):
 
     __tablename__ = "positions"
 
-    # 포지션 고유 식별자 — Position unique identifier (UUID v4, auto-generated)
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    # 포지션 고유 식별자 — Position unique identifier (UUIDv7, auto-generated)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     # 소속 매장 FK — Parent store (CASCADE: 매장 삭제 시 포지션도 삭제)
     store_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("stores.id", ondelete="CASCADE"), nullable=False)
     # 포지션 이름 — Position display name
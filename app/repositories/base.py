@@ -16,6 +16,7 @@ from sqlalchemy import Select, func, select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import Base
+from app.utils.pagination import clamp_page_params
 
 # 제네릭 타입 변수 — SQLAlchemy 모델을 나타냄
 # Generic type variable representing a SQLAlchemy model
@@ -131,6 +132,8 @@ class BaseRepository(Generic[ModelType]):
             tuple[Sequence[ModelType], int]: (레코드 목록, 전체 개수)
                                              (List of records, total count)
         """
+        page, per_page = clamp_page_params(page, per_page)
+
         # 전체 카운트 쿼리 — Total count query
         count_query: Select = select(func.count()).select_from(query.subquery())
         total: int = (await db.execute(count_query)).scalar() or 0
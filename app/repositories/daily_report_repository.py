@@ -13,6 +13,7 @@ from app.models.daily_report import (
     DailyReportTemplate,
 )
 from app.repositories.base import BaseRepository
+from app.utils.pagination import clamp_page_params
 
 
 class DailyReportRepository(BaseRepository[DailyReport]):
@@ -51,6 +52,7 @@ class DailyReportRepository(BaseRepository[DailyReport]):
         per_page: int = 20,
         accessible_store_ids: list[UUID] | None = None,
     ) -> tuple[Sequence[DailyReport], int]:
+        page, per_page = clamp_page_params(page, per_page)
         base = select(DailyReport).where(DailyReport.organization_id == organization_id)
         if accessible_store_ids is not None:
             if not accessible_store_ids:
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.communication import Notice
 from app.repositories.base import BaseRepository
+from app.utils.pagination import paginate_keyset
 
 
 class NoticeRepository(BaseRepository[Notice]):
@@ -51,13 +52,34 @@ class NoticeRepository(BaseRepository[Notice]):
             tuple[Sequence[Notice], int]: (공지 목록, 전체 개수)
                                                  (List of notices, total count)
         """
-        query: Select = (
-            select(Notice)
-            .where(Notice.organization_id == organization_id)
-            .order_by(Notice.created_at.desc())
-        )
+        query: Select = self._org_query(organization_id).order_by(Notice.created_at.desc())
         return await self.get_paginated(db, query, page, per_page)
 
+    async def get_by_org_keyset(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        cursor: str | None,
+        per_page: int = 20,
+    ) -> tuple[Sequence[Notice], str | None]:
+        """조직 전체 공지사항을 cursor(keyset) 방식으로 조회합니다 (COUNT 없음).
+
+        Retrieve organization notices with keyset pagination (no COUNT).
+
+        Args:
+            db: 비동기 데이터베이스 세션 (Async database session)
+            organization_id: 조직 UUID (Organization UUID)
+            cursor: 이전 페이지의 next_cursor, 첫 페이지는 None/"" (Previous next_cursor)
+            per_page: 페이지당 항목 수 (Items per page)
+
+        Returns:
+            tuple[Sequence[Notice], str | None]: (공지 목록, 다음 cursor)
+                                                 (List of notices, next cursor)
+        """
+        return await paginate_keyset(
+            db, self._org_query(organization_id), Notice.created_at, Notice.id, cursor, per_page
+        )
+
     async def get_for_user_stores(
         self,
         db: AsyncSession,
@@ -81,20 +103,58 @@ class NoticeRepository(BaseRepository[Notice]):
             tuple[Sequence[Notice], int]: (공지 목록, 전체 개수)
                                                  (List of notices, total count)
         """
+        query: Select = self._user_stores_query(organization_id, store_ids).order_by(
+            Notice.created_at.desc()
+        )
+        return await self.get_paginated(db, query, page, per_page)
+
+    async def get_for_user_stores_keyset(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        store_ids: list[UUID],
+        cursor: str | None,
+        per_page: int = 20,
+    ) -> tuple[Sequence[Notice], str | None]:
+        """사용자 매장 + 조직 전체 공지를 cursor(keyset) 방식으로 조회합니다 (COUNT 없음).
+
+        Retrieve the user's visible notices with keyset pagination (no COUNT).
+
+        Args:
+            db: 비동기 데이터베이스 세션 (Async database session)
+            organization_id: 조직 UUID (Organization UUID)
+            store_ids: 사용자가 속한 매장 UUID 목록 (User's store UUID list)
+            cursor: 이전 페이지의 next_cursor, 첫 페이지는 None/"" (Previous next_cursor)
+            per_page: 페이지당 항목 수 (Items per page)
+
+        Returns:
+            tuple[Sequence[Notice], str | None]: (공지 목록, 다음 cursor)
+                                                 (List of notices, next cursor)
+        """
+        return await paginate_keyset(
+            db,
+            self._user_stores_query(organization_id, store_ids),
+            Notice.created_at,
+            Notice.id,
+            cursor,
+            per_page,
+        )
+
+    def _org_query(self, organization_id: UUID) -> Select:
+        """조직 전체 공지 기본 쿼리 (정렬 없음) — Base org notice query without ORDER BY."""
+        return select(Notice).where(Notice.organization_id == organization_id)
+
+    def _user_stores_query(self, organization_id: UUID, store_ids: list[UUID]) -> Select:
+        """사용자 가시 공지 기본 쿼리 (정렬 없음) — Base user-visible notice query without ORDER BY."""
         # 조직 전체(store_id=NULL) 또는 사용자 매장 소속 공지
         # Org-wide (store_id is NULL) or user's store notices
-        query: Select = (
-            select(Notice)
-            .where(
-                Notice.organization_id == organization_id,
-                or_(
-                    Notice.store_id.is_(None),
-                    Notice.store_id.in_(store_ids),
-                ),
-            )
-            .order_by(Notice.created_at.desc())
+        return select(Notice).where(
+            Notice.organization_id == organization_id,
+            or_(
+                Notice.store_id.is_(None),
+                Notice.store_id.in_(store_ids),
+            ),
         )
-        return await self.get_paginated(db, query, page, per_page)
 
 
 # 싱글턴 인스턴스 — Singleton instance
@@ -9,6 +9,7 @@ from sqlalchemy.orm import selectinload
 
 from app.models.report import Report, ReportTemplate, ReportType
 from app.repositories.base import BaseRepository
+from app.utils.pagination import clamp_page_params
 
 
 class ReportRepository(BaseRepository[Report]):
@@ -58,6 +59,7 @@ class ReportRepository(BaseRepository[Report]):
         per_page: int = 20,
         accessible_store_ids: list[UUID] | None = None,
     ) -> tuple[Sequence[Report], int]:
+        page, per_page = clamp_page_params(page, per_page)
         base = (
             select(Report)
             .where(Report.organization_id == organization_id)
@@ -8,6 +8,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.schedule import Schedule, ScheduleAuditLog
+from app.utils.pagination import clamp_page_params
 
 
 class ScheduleAuditLogRepository:
@@ -77,6 +78,7 @@ class ScheduleAuditLogRepository:
         store_id/user_id는 schedule 기준.
         actor_id/event_type은 audit log 기준.
         """
+        page, per_page = clamp_page_params(page, per_page)
         base = select(ScheduleAuditLog, Schedule).join(
             Schedule, ScheduleAuditLog.schedule_id == Schedule.id
         ).where(Schedule.organization_id == organization_id)
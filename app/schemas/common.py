@@ -7,9 +7,12 @@ This module consolidates schemas used across multiple API domains.
 """
 
 from datetime import date, datetime
-from typing import Any
+from typing import Annotated, Any
 from pydantic import BaseModel, Field
 
+# 반복 요일 0=Mon..6=Sun — 범위 밖 값은 WeekdayBitmap 비트맵에 저장 불가
+Weekday = Annotated[int, Field(ge=0, le=6)]
+
 
 # === 체크리스트 (Checklist) 스키마 ===
 
@@ -92,7 +95,7 @@ class ChecklistItemCreate(BaseModel):
     verification_type: str = "none"  # 확인 유형 — "none"|"photo"|"text"|"photo,text"
     min_photos: int = 1  # photo required일 때 최소 장수
     recurrence_type: str = "daily"  # 반복 주기 — "daily"|"weekly"
-    recurrence_days: list[int] | None = None  # weekly일 때 요일 목록 [0=Mon..6=Sun]
+    recurrence_days: list[Weekday] | None = None  # weekly일 때 요일 목록 [0=Mon..6=Sun]
     sort_order: int = 0  # 정렬 순서 (Display order)
 
 
@@ -113,7 +116,7 @@ class ChecklistItemUpdate(BaseModel):
     verification_type: str | None = None  # 변경할 확인 유형 (New verification type, optional)
     min_photos: int | None = None  # 변경할 최소 사진 수 (New min photos, optional)
     recurrence_type: str | None = None  # 변경할 반복 주기 (New recurrence type, optional)
-    recurrence_days: list[int] | None = None  # 변경할 반복 요일 (New recurrence days, optional)
+    recurrence_days: list[Weekday] | None = None  # 변경할 반복 요일 (New recurrence days, optional)
     sort_order: int | None = None  # 변경할 정렬 순서 (New sort order, optional)
 
 
@@ -136,7 +139,7 @@ class ChecklistItemResponse(BaseModel):
     verification_type: str  # 확인 유형 — "none"|"photo"|"text"|"photo,text"
     min_photos: int = 1  # 최소 사진 수
     recurrence_type: str = "daily"  # 반복 주기 — "daily"|"weekly"
-    recurrence_days: list[int] | None = None  # weekly일 때 요일 목록 [0=Mon..6=Sun]
+    recurrence_days: list[Weekday] | None = None  # weekly일 때 요일 목록 [0=Mon..6=Sun]
     sort_order: int  # 정렬 순서 (Display order)
 
 
@@ -493,6 +496,27 @@ class PaginatedResponse(BaseModel):
     per_page: int  # 페이지당 항목 수 (Items per page)
 
 
+class CursorPaginatedResponse(BaseModel):
+    """page/per_page 또는 keyset(cursor) 방식 페이지네이션 응답 스키마.
+
+    Paginated response for lists that also support keyset (cursor) mode.
+    Cursor mode skips the COUNT query, so total is None there.
+
+    Attributes:
+        items: 항목 목록 (List of result items)
+        total: 전체 항목 수 (Total count across all pages; None in cursor mode)
+        page: 현재 페이지 번호 (Current page number, 1-based)
+        per_page: 페이지당 항목 수 (Items per page)
+        next_cursor: 다음 페이지 cursor (Cursor of the next page, cursor mode only)
+    """
+
+    items: list[Any]  # 결과 항목 목록 (List of items for the current page)
+    total: int | None  # 전체 항목 수 — cursor 방식은 COUNT 생략으로 None (Total item count)
+    page: int  # 현재 페이지 — 1부터 시작 (Current page, 1-indexed)
+    per_page: int  # 페이지당 항목 수 (Items per page)
+    next_cursor: str | None = None  # 다음 페이지 cursor — 마지막 페이지면 None (Next page cursor)
+
+
 class MessageResponse(BaseModel):
     """범용 메시지 응답 스키마.
 
@@ -15,7 +15,7 @@ Creates:
 import asyncio
 from app.database import async_session, engine, Base
 from app.models import Organization, Role, User
-from app.utils.password import hash_password
+from app.utils.password import hash_password_async
 
 
 async def seed() -> None:
@@ -66,7 +66,7 @@ async def seed() -> None:
             username="admin",
             full_name="System Admin",
             email="admin@withers.com",
-            password_hash=hash_password("admin123"),
+            password_hash=await hash_password_async("admin123"),
             is_active=True,
         )
         db.add(admin)
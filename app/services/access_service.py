@@ -13,7 +13,7 @@
 from datetime import datetime, timezone
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.license import License
@@ -44,21 +44,29 @@ class AccessService:
 
         reason=None 이면 접근 가능. member 가 없고 home org(legacy)도 아니면 NOT_A_MEMBER.
         """
+        # get_current_user 게이트로 매 요청 실행 — lambda_stmt 로 statement 구성/캐시 키 계산을 한 번만
+        user_id = user.id
         member = (
             await db.execute(
-                select(OrgMember.status).where(
-                    OrgMember.user_id == user.id,
-                    OrgMember.organization_id == org_id,
+                lambda_stmt(
+                    lambda: select(OrgMember.status).where(
+                        OrgMember.user_id == user_id,
+                        OrgMember.organization_id == org_id,
+                    )
                 )
             )
         ).scalar_one_or_none()
 
         row = (
             await db.execute(
-                select(Organization.name, Organization.code, License.status, License.expires_at)
-                .select_from(Organization)
-                .outerjoin(License, License.organization_id == Organization.id)
-                .where(Organization.id == org_id)
+                lambda_stmt(
+                    lambda: select(
+                        Organization.name, Organization.code, License.status, License.expires_at
+                    )
+                    .select_from(Organization)
+                    .outerjoin(License, License.organization_id == Organization.id)
+                    .where(Organization.id == org_id)
+                )
             )
         ).first()
         info = {
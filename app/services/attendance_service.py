@@ -864,84 +864,119 @@ class AttendanceService:
             dict: 매장/사용자 이름이 포함된 응답 딕셔너리
                   (Response dict with store/user names)
         """
-        # 매장 이름 + 타임존 조회 — Fetch store name & timezone
+        breaks_map = {attendance.id: breaks} if breaks is not None else None
+        responses: list[dict] = await self.build_responses_batch(
+            db, [attendance], breaks_map=breaks_map
+        )
+        return responses[0]
+
+    async def build_responses_batch(
+        self,
+        db: AsyncSession,
+        attendances: Sequence[Attendance],
+        breaks_map: dict[UUID, list[AttendanceBreak]] | None = None,
+    ) -> list[dict]:
+        """여러 근태의 응답을 일괄 구성 — 매장/사용자/스케줄/break 를 테이블당 IN 쿼리 1번으로.
+
+        Build response dicts for many attendances without per-row lookups.
+
+        Args:
+            db: 비동기 데이터베이스 세션 (Async database session)
+            attendances: 근태 ORM 객체 목록 (Attendance ORM objects)
+            breaks_map: 미리 로드된 attendance_id → break 목록, 선택 (Preloaded breaks)
+
+        Returns:
+            list[dict]: 입력 순서대로의 응답 딕셔너리 목록 (Response dicts in input order)
+        """
+        if not attendances:
+            return []
+        from app.models.organization import Organization
+
+        # 매장 이름 + 타임존 (store.timezone 없으면 organization timezone)
+        store_ids = {a.store_id for a in attendances}
         store_result = await db.execute(
-            select(Store.name, Store.timezone).where(Store.id == attendance.store_id)
+            select(Store.id, Store.name, Store.timezone, Organization.timezone)
+            .outerjoin(Organization, Organization.id == Store.organization_id)
+            .where(Store.id.in_(store_ids))
         )
-        store_row = store_result.one_or_none()
-        store_name: str = (store_row[0] if store_row else None) or "Unknown"
-        store_tz_name: str | None = store_row[1] if store_row else None
+        stores: dict[UUID, tuple[str | None, str | None]] = {
+            row[0]: (row[1], row[2] or row[3]) for row in store_result.all()
+        }
 
-        # 사용자 이름 조회 — Fetch user name
-        user_result = await db.execute(select(User.full_name).where(User.id == attendance.user_id))
-        user_name: str = user_result.scalar() or "Unknown"
+        # 사용자 이름
+        user_ids = {a.user_id for a in attendances}
+        user_result = await db.execute(
+            select(User.id, User.full_name).where(User.id.in_(user_ids))
+        )
+        user_names: dict[UUID, str | None] = {row[0]: row[1] for row in user_result.all()}
 
-        # 연결된 스케줄 조회 (있으면) — scheduled_start/end + effective_status 계산용 raw 값
-        scheduled_start: datetime | None = None
-        scheduled_end: datetime | None = None
-        s_operating_day = None
-        s_start_at = None
-        s_end_at = None
-        if attendance.schedule_id is not None:
+        # 연결된 스케줄 — scheduled_start/end + effective_status 계산용 raw 값
+        schedule_ids = {a.schedule_id for a in attendances if a.schedule_id is not None}
+        schedules: dict[UUID, tuple] = {}
+        if schedule_ids:
             sch_result = await db.execute(
-                select(Schedule.operating_day, Schedule.start_at, Schedule.end_at)
-                .where(Schedule.id == attendance.schedule_id)
+                select(Schedule.id, Schedule.operating_day, Schedule.start_at, Schedule.end_at)
+                .where(Schedule.id.in_(schedule_ids))
             )
-            sch_row = sch_result.one_or_none()
-            if sch_row is not None:
-                s_operating_day, s_start_at, s_end_at = sch_row
-                # store.timezone이 None이면 organization timezone 조회 (fallback)
-                if store_tz_name is None:
-                    from app.models.organization import Organization
-                    org_result = await db.execute(
-                        select(Organization.timezone)
-                        .join(Store, Store.organization_id == Organization.id)
-                        .where(Store.id == attendance.store_id)
-                    )
-                    store_tz_name = org_result.scalar() or "UTC"
-                try:
-                    from zoneinfo import ZoneInfo
-                    tz = ZoneInfo(store_tz_name)
-                except Exception:
-                    from zoneinfo import ZoneInfo
-                    tz = ZoneInfo("UTC")
-                scheduled_start, scheduled_end = resolve_schedule_instants(
-                    start_at=s_start_at, end_at=s_end_at, work_date=s_operating_day,
-                    start_time=None, end_time=None, tz_name=tz.key,
-                )
+            schedules = {row[0]: tuple(row[1:]) for row in sch_result.all()}
 
         # break 로드 (미리 주입되지 않았다면 fetch) — Load breaks if not provided
-        if breaks is None:
-            br_result = await db.execute(
-                select(AttendanceBreak)
-                .where(AttendanceBreak.attendance_id == attendance.id)
-                .order_by(AttendanceBreak.started_at.asc())
+        if breaks_map is None:
+            breaks_map = await self._load_breaks_map(db, [a.id for a in attendances])
+
+        responses: list[dict] = []
+        for attendance in attendances:
+            store_name, tz_name = stores.get(attendance.store_id, (None, None))
+            responses.append(
+                self._to_response_dict(
+                    attendance,
+                    store_name=store_name or "Unknown",
+                    user_name=user_names.get(attendance.user_id) or "Unknown",
+                    tz_name=tz_name or "UTC",
+                    schedule_row=(
+                        schedules.get(attendance.schedule_id)
+                        if attendance.schedule_id is not None
+                        else None
+                    ),
+                    breaks=breaks_map.get(attendance.id, []),
+                )
             )
-            breaks = list(br_result.scalars().all())
-
-        paid_break_minutes, unpaid_break_minutes, paid_overage_minutes, break_items = (
-            self._summarize_breaks(breaks)
-        )
+        return responses
 
+    def _to_response_dict(
+        self,
+        attendance: Attendance,
+        store_name: str,
+        user_name: str,
+        tz_name: str,
+        schedule_row: tuple | None,
+        breaks: list[AttendanceBreak],
+    ) -> dict:
+        """미리 조회한 값으로 근태 응답 딕셔너리 구성 (DB 접근 없음)."""
         # store tz 기준 "HH:MM" display formatter — admin UI 가 브라우저 로컬 tz 변환
         # 없이 그대로 렌더할 수 있도록 pre-formatted 값 제공.
         # store.timezone 이 아직 없으면 organization tz, 그마저도 없으면 UTC fallback.
-        display_tz_name: str | None = store_tz_name
-        if display_tz_name is None:
-            from app.models.organization import Organization
-            org_result = await db.execute(
-                select(Organization.timezone)
-                .join(Store, Store.organization_id == Organization.id)
-                .where(Store.id == attendance.store_id)
-            )
-            display_tz_name = org_result.scalar() or "UTC"
         try:
-            from zoneinfo import ZoneInfo
-            display_tz = ZoneInfo(display_tz_name)
+            display_tz = ZoneInfo(tz_name)
         except Exception:
-            from zoneinfo import ZoneInfo
             display_tz = ZoneInfo("UTC")
 
+        scheduled_start: datetime | None = None
+        scheduled_end: datetime | None = None
+        s_operating_day = None
+        s_start_at = None
+        s_end_at = None
+        if schedule_row is not None:
+            s_operating_day, s_start_at, s_end_at = schedule_row
+            scheduled_start, scheduled_end = resolve_schedule_instants(
+                start_at=s_start_at, end_at=s_end_at, work_date=s_operating_day,
+                start_time=None, end_time=None, tz_name=display_tz.key,
+            )
+
+        paid_break_minutes, unpaid_break_minutes, paid_overage_minutes, break_items = (
+            self._summarize_breaks(breaks)
+        )
+
         def _display_store_tz(value: datetime | None) -> str | None:
             """UTC/offset-aware datetime → store tz 기준 HH:MM. None → None."""
             if value is None:
@@ -1038,26 +1073,49 @@ class AttendanceService:
             dict: 수정자 이름이 포함된 응답 딕셔너리
                   (Response dict with corrector name)
         """
-        # 수정자 이름 조회 — Fetch corrector name. NULL = system actor (cron).
-        corrected_by_name: str
-        if correction.corrected_by is None:
-            corrected_by_name = "System"
-        else:
-            user_result = await db.execute(
-                select(User.full_name).where(User.id == correction.corrected_by)
+        responses: list[dict] = await self.build_correction_responses_batch(db, [correction])
+        return responses[0]
+
+    async def build_correction_responses_batch(
+        self,
+        db: AsyncSession,
+        corrections: Sequence[AttendanceCorrection],
+    ) -> list[dict]:
+        """수정 이력 목록의 응답을 수정자 이름 일괄 조회로 구성합니다.
+
+        Build correction response dicts with one batch query for corrector names.
+
+        Args:
+            db: 비동기 데이터베이스 세션 (Async database session)
+            corrections: 수정 이력 ORM 객체 목록 (Correction ORM objects)
+
+        Returns:
+            list[dict]: 입력 순서대로의 응답 딕셔너리 목록 (Response dicts in input order)
+        """
+        # 수정자 이름 일괄 조회 — Batch fetch corrector names. NULL = system actor (cron).
+        user_ids: set[UUID] = {c.corrected_by for c in corrections if c.corrected_by is not None}
+        names_map: dict[UUID, str] = {}
+        if user_ids:
+            result = await db.execute(
+                select(User.id, User.full_name).where(User.id.in_(user_ids))
             )
-            corrected_by_name = user_result.scalar() or "Unknown"
+            names_map = {row.id: row.full_name for row in result}
 
-        return {
-            "id": str(correction.id),
-            "field_name": correction.field_name,
-            "original_value": correction.original_value,
-            "corrected_value": correction.corrected_value,
-            "reason": correction.reason,
-            "corrected_by": str(correction.corrected_by) if correction.corrected_by else None,
-            "corrected_by_name": corrected_by_name,
-            "created_at": correction.created_at,
-        }
+        return [
+            {
+                "id": str(c.id),
+                "field_name": c.field_name,
+                "original_value": c.original_value,
+                "corrected_value": c.corrected_value,
+                "reason": c.reason,
+                "corrected_by": str(c.corrected_by) if c.corrected_by else None,
+                "corrected_by_name": (
+                    "System" if c.corrected_by is None else names_map.get(c.corrected_by) or "Unknown"
+                ),
+                "created_at": c.created_at,
+            }
+            for c in corrections
+        ]
 
 
     async def get_weekly_summary(
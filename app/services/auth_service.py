@@ -5,6 +5,7 @@ Handles admin/app login separation, JWT token lifecycle,
 and user profile retrieval.
 """
 
+import time
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
@@ -37,11 +38,17 @@ from app.utils.exceptions import (
     UnauthorizedError,
 )
 from app.utils.jwt import create_access_token, create_refresh_token, decode_token
-from app.utils.password import hash_password, verify_password
+from app.utils.password import hash_password_async, verify_password_async
 
 
 MAX_SESSIONS_PER_CLIENT = 5
 
+# 회사 코드 → 조직 UUID 캐시 (로그인마다 organizations 조회 생략).
+# 유효한 코드만 담기므로 크기는 조직 수로 제한. 비활성화 반영은 TTL 만큼 늦을 수 있으나
+# 로그인 이후 요청은 get_current_user 의 라이센스/멤버십 게이트가 다시 막는다.
+COMPANY_CODE_CACHE_TTL_SECONDS = 30.0
+_company_code_cache: dict[str, tuple[float, UUID]] = {}
+
 
 class AuthService:
     """인증 관련 비즈니스 로직을 처리하는 서비스.
@@ -85,16 +92,23 @@ class AuthService:
                 # 단일 org 환경에서는 아래 단일 매칭이 그대로 동작(하위호환).
                 return None
             return org_ids[0]
+        code = company_code.upper()
+        now = time.monotonic()
+        cached = _company_code_cache.get(code)
+        if cached is not None and now - cached[0] < COMPANY_CODE_CACHE_TTL_SECONDS:
+            return cached[1]
         result = await db.execute(
-            select(Organization).where(
-                Organization.code == company_code.upper(),
+            select(Organization.id).where(
+                Organization.code == code,
                 Organization.is_active == True,
             )
         )
-        org: Organization | None = result.scalar_one_or_none()
-        if org is None:
+        org_id: UUID | None = result.scalar_one_or_none()
+        if org_id is None:
+            _company_code_cache.pop(code, None)
             raise NotFoundError("Invalid company code")
-        return org.id
+        _company_code_cache[code] = (now, org_id)
+        return org_id
 
     def _build_jwt_payload(self, user: User, role: Role) -> dict[str, str | int]:
         """JWT 토큰 페이로드를 생성합니다.
@@ -222,7 +236,7 @@ class AuthService:
         user: User | None = await auth_repository.get_user_by_username(
             db, data.username, organization_id
         )
-        if user is None or not verify_password(data.password, user.password_hash):
+        if user is None or not await verify_password_async(data.password, user.password_hash):
             raise UnauthorizedError("Invalid username or password")
 
         if not user.is_active:
@@ -281,7 +295,7 @@ class AuthService:
         user: User | None = await auth_repository.get_user_by_username(
             db, data.username, organization_id
         )
-        if user is None or not verify_password(data.password, user.password_hash):
+        if user is None or not await verify_password_async(data.password, user.password_hash):
             raise UnauthorizedError("Invalid username or password")
 
         if not user.is_active:
@@ -387,7 +401,7 @@ class AuthService:
         # Attendance device 용 clockin_pin 자동 발급
         from app.services.attendance_device_service import generate_clockin_pin
 
-        password_hash: str = hash_password(data.password)
+        password_hash: str = await hash_password_async(data.password)
         clockin_pin = generate_clockin_pin()
         user: User = User(
             organization_id=organization_id,
@@ -23,14 +23,15 @@ from app.models.checklist import (
     ClScoreHistory,
 )
 from app.models.file import File, FileUsage
-from app.models.organization import Store
+from app.models.organization import Organization, Store
 from app.models.user import User
 from app.repositories.checklist_instance_repository import checklist_instance_repository
 from app.services.storage_service import storage_service
 from app.config import settings
 from app.utils.capture import enforce_capture_time, normalize_photos
 from app.utils.exceptions import BadRequestError, ForbiddenError, NotFoundError
-from app.utils.timezone import get_store_timezone
+from app.utils.timezone import DEFAULT_TIMEZONE
+from app.utils.pagination import clamp_page_params
 
 # URL 해석 단축 — resolve_url alias for response building
 _resolve = storage_service.resolve_url
@@ -1053,6 +1054,7 @@ class ChecklistInstanceService:
 
         store_ids: 접근 가능 매장 필터. None=전체, []=빈 결과.
         """
+        page, per_page = clamp_page_params(page, per_page)
         from sqlalchemy import func as sa_func
 
         if store_ids is not None and not store_ids:
@@ -1227,15 +1229,60 @@ class ChecklistInstanceService:
         instance: ChecklistInstance,
     ) -> dict:
         """인스턴스 응답 딕셔너리를 구성합니다 (관련 엔티티 이름 포함)."""
-        store_result = await db.execute(select(Store.name).where(Store.id == instance.store_id))
-        store_name: str = store_result.scalar() or "Unknown"
+        responses: list[dict] = await self.build_responses_batch(db, [instance])
+        return responses[0]
 
-        user_result = await db.execute(select(User.full_name).where(User.id == instance.user_id))
-        user_name: str = user_result.scalar() or "Unknown"
+    async def build_responses_batch(
+        self,
+        db: AsyncSession,
+        instances: Sequence[ChecklistInstance],
+    ) -> list[dict]:
+        """인스턴스 목록 응답을 일괄 구성 — store/user 를 테이블당 IN 쿼리 1회로 조회.
 
-        # store→org→default 로 해석한 타임존 — 콘솔이 사진 워터마크 등 시각을 store-tz 로 표시.
-        store_tz: str = await get_store_timezone(db, instance.store_id)
+        Build list responses with one IN query per related table instead of
+        three queries per instance.
+        """
+        if not instances:
+            return []
 
+        store_ids: set[UUID] = {inst.store_id for inst in instances}
+        user_ids: set[UUID] = {inst.user_id for inst in instances}
+
+        # store 이름 + store→org→default 로 해석한 타임존 (get_store_timezone 과 동일 규칙)
+        store_result = await db.execute(
+            select(Store.id, Store.name, Store.timezone, Organization.timezone.label("org_timezone"))
+            .outerjoin(Organization, Store.organization_id == Organization.id)
+            .where(Store.id.in_(store_ids))
+        )
+        store_names: dict[UUID, str] = {}
+        store_tzs: dict[UUID, str] = {}
+        for row in store_result:
+            store_names[row.id] = row.name
+            store_tzs[row.id] = row.timezone or row.org_timezone or DEFAULT_TIMEZONE
+
+        user_result = await db.execute(
+            select(User.id, User.full_name).where(User.id.in_(user_ids))
+        )
+        user_names: dict[UUID, str] = {row.id: row.full_name for row in user_result}
+
+        return [
+            self._to_response_dict(
+                inst,
+                store_name=store_names.get(inst.store_id) or "Unknown",
+                user_name=user_names.get(inst.user_id) or "Unknown",
+                store_tz=store_tzs.get(inst.store_id, DEFAULT_TIMEZONE),
+            )
+            for inst in instances
+        ]
+
+    @staticmethod
+    def _to_response_dict(
+        instance: ChecklistInstance,
+        store_name: str,
+        user_name: str,
+        store_tz: str,
+    ) -> dict:
+        """미리 조회한 이름/타임존으로 응답 dict 구성 (DB 조회 없음)."""
         return {
             "id": str(instance.id),
             "template_id": str(instance.template_id) if instance.template_id else None,
@@ -1245,6 +1292,7 @@ class ChecklistInstanceService:
             "user_id": str(instance.user_id),
             "user_name": user_name,
             "work_date": instance.work_date,
+            # 콘솔이 사진 워터마크 등 시각을 store-tz 로 표시
             "timezone": store_tz,
             "total_items": instance.total_items,
             "completed_items": instance.completed_items,
@@ -1388,9 +1436,13 @@ class ChecklistInstanceService:
                 if sub.submitted_by:
                     user_ids.add(sub.submitted_by)
 
-        for uid in user_ids:
-            r = await db.execute(select(User.full_name).where(User.id == uid))
-            user_name_cache[uid] = r.scalar() or "Unknown"
+        # 작성자/리뷰어/제출자 이름을 IN 쿼리 1번으로 (사용자마다 SELECT 하지 않음)
+        if user_ids:
+            r = await db.execute(
+                select(User.id, User.full_name).where(User.id.in_(user_ids))
+            )
+            found: dict[UUID, str | None] = {row.id: row.full_name for row in r}
+            user_name_cache = {uid: found.get(uid) or "Unknown" for uid in user_ids}
 
         items_list: list[dict] = []
         for item in sorted(instance.items, key=lambda i: i.sort_order):
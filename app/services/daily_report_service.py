@@ -382,8 +382,7 @@ class DailyReportService:
         try:
             comment = DailyReportComment(report_id=report.id, user_id=user_id, content=data.content)
             db.add(comment)
-            await db.flush()
-            await db.refresh(comment)
+            # id/created_at 은 Python 측 default — refresh 없이 INSERT 후 바로 commit
             await db.commit()
             await self._notify_report_reply(
                 db, report=report, author_id=user_id, excerpt=data.content,
@@ -29,6 +29,7 @@ from app.schemas.inventory import (
     AuditSettingUpdate, AuditSettingResponse,
 )
 from app.utils.exceptions import NotFoundError, DuplicateError, ForbiddenError
+from app.utils.pagination import clamp_page_params
 
 
 # ─── Category Service ───────────────────────────────────────
@@ -696,6 +697,7 @@ class StoreInventoryService:
         telling the UI whether it's already linked to this store. Sorted by
         `is_in_store ASC, name ASC` so unattached products surface first.
         """
+        page, per_page = clamp_page_params(page, per_page)
         store = await store_repository.get_by_id(db, store_id, organization_id)
         if not store:
             raise NotFoundError("Store not found")
@@ -56,6 +56,26 @@ class NoticeService:
             raise ForbiddenError("No permission for this store")
         return store
 
+    def _to_response_dict(
+        self,
+        notice: Notice,
+        store_names: dict[UUID, str],
+        user_names: dict[UUID, str],
+    ) -> dict:
+        """미리 조회한 이름 맵으로 공지사항 응답 딕셔너리를 구성합니다.
+
+        Build a notice response dict using pre-fetched name maps.
+        """
+        return {
+            "id": str(notice.id),
+            "title": notice.title,
+            "content": notice.content,
+            "store_id": str(notice.store_id) if notice.store_id else None,
+            "store_name": store_names.get(notice.store_id) if notice.store_id else None,
+            "created_by_name": user_names.get(notice.created_by) or "Unknown",
+            "created_at": notice.created_at,
+        }
+
     async def build_response(
         self,
         db: AsyncSession,
@@ -73,29 +93,46 @@ class NoticeService:
             dict: 매장명/작성자명이 포함된 응답 딕셔너리
                   (Response dict with store name and creator name)
         """
-        # 매장 이름 조회 — Fetch store name
-        store_name: str | None = None
-        if notice.store_id is not None:
+        responses: list[dict] = await self.build_responses_batch(db, [notice])
+        return responses[0]
+
+    async def build_responses_batch(
+        self,
+        db: AsyncSession,
+        notices: Sequence[Notice],
+    ) -> list[dict]:
+        """공지사항 목록의 응답을 매장/작성자 일괄 조회로 구성합니다.
+
+        Build response dicts for a list of notices with one batch query
+        per related entity (stores, creators) instead of per-row lookups.
+
+        Args:
+            db: 비동기 데이터베이스 세션 (Async database session)
+            notices: 공지사항 ORM 객체 목록 (Notice ORM objects)
+
+        Returns:
+            list[dict]: 입력 순서대로의 응답 딕셔너리 목록 (Response dicts in input order)
+        """
+        store_ids: set[UUID] = {n.store_id for n in notices if n.store_id is not None}
+        user_ids: set[UUID] = {n.created_by for n in notices if n.created_by is not None}
+
+        # 매장 이름 일괄 조회 — Batch fetch store names
+        store_names: dict[UUID, str] = {}
+        if store_ids:
             result = await db.execute(
-                select(Store.name).where(Store.id == notice.store_id)
+                select(Store.id, Store.name).where(Store.id.in_(store_ids))
             )
-            store_name = result.scalar()
+            store_names = {row.id: row.name for row in result}
 
-        # 작성자 이름 조회 — Fetch creator name
-        creator_result = await db.execute(
-            select(User.full_name).where(User.id == notice.created_by)
-        )
-        created_by_name: str = creator_result.scalar() or "Unknown"
+        # 작성자 이름 일괄 조회 — Batch fetch creator names
+        user_names: dict[UUID, str] = {}
+        if user_ids:
+            result = await db.execute(
+                select(User.id, User.full_name).where(User.id.in_(user_ids))
+            )
+            user_names = {row.id: row.full_name for row in result}
 
-        return {
-            "id": str(notice.id),
-            "title": notice.title,
-            "content": notice.content,
-            "store_id": str(notice.store_id) if notice.store_id else None,
-            "store_name": store_name,
-            "created_by_name": created_by_name,
-            "created_at": notice.created_at,
-        }
+        return [self._to_response_dict(n, store_names, user_names) for n in notices]
 
     # --- Admin CRUD ---
 
@@ -105,22 +142,32 @@ class NoticeService:
         organization_id: UUID,
         page: int = 1,
         per_page: int = 20,
-    ) -> tuple[Sequence[Notice], int]:
+        cursor: str | None = None,
+    ) -> tuple[Sequence[Notice], int | None, str | None]:
         """조직의 공지사항 목록을 페이지네이션하여 조회합니다.
 
         List paginated notices for an organization (admin).
+        cursor 가 주어지면 (빈 문자열 = 첫 페이지) keyset 방식으로 조회하고 COUNT 를 생략합니다.
 
         Args:
             db: 비동기 데이터베이스 세션 (Async database session)
             organization_id: 조직 UUID (Organization UUID)
-            page: 페이지 번호 (Page number)
+            page: 페이지 번호 (Page number, offset mode)
             per_page: 페이지당 항목 수 (Items per page)
+            cursor: keyset cursor — None 이면 offset 방식 (None selects offset mode)
 
         Returns:
-            tuple[Sequence[Notice], int]: (공지 목록, 전체 개수)
-                                                 (List of notices, total count)
+            tuple[Sequence[Notice], int | None, str | None]:
+                (공지 목록, 전체 개수 — cursor 방식이면 None, 다음 cursor — offset 방식이면 None)
+                (Notices, total count or None in cursor mode, next cursor or None)
         """
-        return await notice_repository.get_by_org(db, organization_id, page, per_page)
+        if cursor is not None:
+            notices, next_cursor = await notice_repository.get_by_org_keyset(
+                db, organization_id, cursor, per_page
+            )
+            return notices, None, next_cursor
+        notices, total = await notice_repository.get_by_org(db, organization_id, page, per_page)
+        return notices, total, None
 
     async def get_detail(
         self,
@@ -284,27 +331,37 @@ class NoticeService:
         user_id: UUID,
         page: int = 1,
         per_page: int = 20,
-    ) -> tuple[Sequence[Notice], int]:
+        cursor: str | None = None,
+    ) -> tuple[Sequence[Notice], int | None, str | None]:
         """사용자가 볼 수 있는 공지사항 목록을 조회합니다.
 
         List notices visible to the user (org-wide + user's stores).
+        cursor 가 주어지면 (빈 문자열 = 첫 페이지) keyset 방식으로 조회하고 COUNT 를 생략합니다.
 
         Args:
             db: 비동기 데이터베이스 세션 (Async database session)
             organization_id: 조직 UUID (Organization UUID)
             user_id: 사용자 UUID (User UUID)
-            page: 페이지 번호 (Page number)
+            page: 페이지 번호 (Page number, offset mode)
             per_page: 페이지당 항목 수 (Items per page)
+            cursor: keyset cursor — None 이면 offset 방식 (None selects offset mode)
 
         Returns:
-            tuple[Sequence[Notice], int]: (공지 목록, 전체 개수)
-                                                 (List of notices, total count)
+            tuple[Sequence[Notice], int | None, str | None]:
+                (공지 목록, 전체 개수 — cursor 방식이면 None, 다음 cursor — offset 방식이면 None)
+                (Notices, total count or None in cursor mode, next cursor or None)
         """
         # 사용자의 매장 ID 목록 조회 — Get user's store IDs
         store_ids: list[UUID] = await self._get_user_store_ids(db, user_id)
-        return await notice_repository.get_for_user_stores(
+        if cursor is not None:
+            notices, next_cursor = await notice_repository.get_for_user_stores_keyset(
+                db, organization_id, store_ids, cursor, per_page
+            )
+            return notices, None, next_cursor
+        notices, total = await notice_repository.get_for_user_stores(
             db, organization_id, store_ids, page, per_page
         )
+        return notices, total, None
 
     async def _get_user_store_ids(
         self,
@@ -6,9 +6,10 @@ Provides current-organization scoped operations.
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import permissions_cache
 from app.models.organization import Organization
 from app.repositories.organization_repository import organization_repository
 from app.schemas.organization import OrganizationResponse, OrganizationUpdate
@@ -134,8 +135,8 @@ class OrganizationService:
         from app.models.organization import Store
         from app.models.org_member import OrgMember
         from app.models.license import License
-        from app.models.permission import Permission, RolePermission
-        from app.utils.password import hash_password
+        from app.models.permission import RolePermission
+        from app.utils.password import hash_password_async
         from app.services.attendance_device_service import generate_clockin_pin
         from app.services.daily_report_service import daily_report_service
         from app.services.evaluation_service import evaluation_service
@@ -174,7 +175,7 @@ class OrganizationService:
             assert super_owner_role is not None
 
             # 3) role_permissions (setup 과 동일 규칙)
-            all_perms = {p.code: p.id for p in (await db.execute(select(Permission))).scalars().all()}
+            all_perms = await permissions_cache.get_codes(db)
             gm_excluded = {"stores:create", "stores:delete", "roles:create", "roles:delete"}
             sv_allowed = {
                 "stores:read", "users:read", "roles:read",
@@ -183,20 +184,29 @@ class OrganizationService:
                 "evaluations:read", "dashboard:read",
             }
             super_owner_only = {"org:delete", "owner:assign", "super_owner:transfer"}
+            # 역할 구간별 코드 집합을 한 번만 계산 (역할마다 all_perms 재스캔하지 않음)
+            all_codes = frozenset(all_perms)
+            owner_codes = all_codes - super_owner_only
+            gm_codes = owner_codes - gm_excluded
+            sv_codes = all_codes & sv_allowed
+            role_permission_rows: list[dict] = []
             for r in roles_created:
                 if r.priority <= SUPER_OWNER_PRIORITY:
-                    codes = list(all_perms.keys())
+                    codes = all_codes
                 elif r.priority <= OWNER_PRIORITY:
-                    codes = [c for c in all_perms if c not in super_owner_only]
+                    codes = owner_codes
                 elif r.priority <= GM_PRIORITY:
-                    codes = [c for c in all_perms if c not in gm_excluded and c not in super_owner_only]
+                    codes = gm_codes
                 elif r.priority <= SV_PRIORITY:
-                    codes = [c for c in all_perms if c in sv_allowed]
+                    codes = sv_codes
                 else:
-                    codes = []
-                for code in codes:
-                    db.add(RolePermission(role_id=r.id, permission_id=all_perms[code]))
-            await db.flush()
+                    codes = frozenset()
+                role_permission_rows.extend(
+                    {"role_id": r.id, "permission_id": all_perms[code]} for code in codes
+                )
+            # 역할 × permission 을 한 번의 INSERT 로 (ORM 객체/identity map 생성 없이)
+            if role_permission_rows:
+                await db.execute(insert(RolePermission), role_permission_rows)
 
             # 4) 기본 템플릿 (신규 org 즉시 보유)
             await daily_report_service.create_default_template_for_org(db, org.id)
@@ -211,7 +221,7 @@ class OrganizationService:
                 username=admin_username,
                 full_name=admin_username,
                 email=admin_email,
-                password_hash=hash_password(admin_password),
+                password_hash=await hash_password_async(admin_password),
                 clockin_pin=clockin_pin,
             )
             db.add(user)
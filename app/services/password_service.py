@@ -20,7 +20,7 @@ from app.utils.email_templates import (
     build_temporary_password_email,
 )
 from app.utils.exceptions import BadRequestError, ForbiddenError, NotFoundError
-from app.utils.password import hash_password, verify_password
+from app.utils.password import hash_password_async, verify_password_async
 
 
 # 혼동 문자 제외 — Exclude confusing characters (0/O, 1/l/I)
@@ -154,7 +154,7 @@ class PasswordService:
             raise NotFoundError("User not found")
 
         # 비밀번호 변경
-        user.password_hash = hash_password(new_password)
+        user.password_hash = await hash_password_async(new_password)
         user.password_changed_at = datetime.now(timezone.utc)
         user.must_change_password = False
 
@@ -175,10 +175,10 @@ class PasswordService:
         ip_address: str | None = None,
     ) -> dict:
         """현재 비밀번호 확인 → 변경 → 다른 세션 삭제 → 새 토큰 발급."""
-        if not verify_password(current_password, user.password_hash):
+        if not await verify_password_async(current_password, user.password_hash):
             raise BadRequestError("Current password is incorrect")
 
-        user.password_hash = hash_password(new_password)
+        user.password_hash = await hash_password_async(new_password)
         user.password_changed_at = datetime.now(timezone.utc)
         user.must_change_password = False
 
@@ -265,7 +265,7 @@ class PasswordService:
 
         # 임시 비밀번호 생성 + 적용
         temp_password = self._generate_temp_password()
-        target.password_hash = hash_password(temp_password)
+        target.password_hash = await hash_password_async(temp_password)
         target.password_changed_at = datetime.now(timezone.utc)
         target.must_change_password = True
 
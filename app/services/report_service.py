@@ -1016,11 +1016,13 @@ class ReportService:
         organization_id: UUID,
         reviewer_id: UUID,
         feedback: str | None = None,
+        reviewer_name: str | None = None,
     ) -> Report:
         """리포트 검토 완료 처리 (P3, reports:review).
 
         submitted → reviewed. reviewed_by/at 기록. feedback 있으면 코멘트로 남기고
         작성자에게 알림. reviewed 상태에서 재호출은 멱등(메타만 갱신).
+        reviewer_name 을 넘기면(호출자의 current_user) 알림용 이름 조회를 생략한다.
         """
         r = await self.get_report(db, report_id, organization_id)
         if r.status == "draft":
@@ -1042,7 +1044,8 @@ class ReportService:
             await db.commit()
             # 작성자에게 리뷰 알림 (+ feedback excerpt).
             await self._notify_review(
-                db, report=r, reviewer_id=reviewer_id, excerpt=feedback
+                db, report=r, reviewer_id=reviewer_id, excerpt=feedback,
+                reviewer_name=reviewer_name,
             )
             return r
         except Exception:
@@ -1144,6 +1147,7 @@ class ReportService:
         report: Report,
         reviewer_id: UUID,
         excerpt: str | None,
+        reviewer_name: str | None = None,
     ) -> None:
         """리뷰 완료 시 작성자에게 알림 + (feedback 있으면) 이메일."""
         recipient_id = report.author_id
@@ -1152,10 +1156,11 @@ class ReportService:
         try:
             from app.services.alert_service import alert_service
 
-            reviewer_r = await db.execute(
-                select(User.full_name).where(User.id == reviewer_id)
-            )
-            reviewer_name = reviewer_r.scalar() or "A manager"
+            if not reviewer_name:
+                reviewer_r = await db.execute(
+                    select(User.full_name).where(User.id == reviewer_id)
+                )
+                reviewer_name = reviewer_r.scalar() or "A manager"
             period = (report.payload or {}).get("period", "")
             context_label = f"daily report ({period})" if period else "report"
             await alert_service.create_for_report_reviewed(
@@ -1209,8 +1214,7 @@ class ReportService:
         try:
             c = ReportComment(report_id=r.id, user_id=user_id, content=data.content)
             db.add(c)
-            await db.flush()
-            await db.refresh(c)
+            # id/created_at 은 Python 측 default — refresh 없이 INSERT 후 바로 commit
             await db.commit()
             if r.type == "issue":
                 await self._notify_issue_event(
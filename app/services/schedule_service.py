@@ -862,6 +862,17 @@ class ScheduleService:
         data: ScheduleCreate,
         created_by: UUID,
     ) -> ScheduleResponse:
+        entry = await self._create_entry(db, organization_id, data, created_by)
+        return await self._to_response(db, entry)
+
+    async def _create_entry(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        data: ScheduleCreate,
+        created_by: UUID,
+    ) -> Schedule:
+        """검증 + 생성 + 부수효과(audit/체크리스트/attendance/알림) 후 commit. 응답 변환은 호출자 몫."""
         store_id = UUID(data.store_id)
         # 폐점(closed) 매장엔 새 스케줄 생성 차단 (조회/수정/삭제는 허용)
         from app.services.store_service import store_service
@@ -1000,9 +1011,8 @@ class ScheduleService:
                 from app.services.alert_service import alert_service
                 await alert_service.create_for_schedule_assigned(db, entry)
 
-            result = await self._to_response(db, entry)
             await db.commit()
-            return result
+            return entry
         except Exception:
             await db.rollback()
             raise
@@ -1124,12 +1134,12 @@ class ScheduleService:
         skipped = 0
         failed = 0
         errors: list[str] = []
-        items: list = []
+        entries: list[Schedule] = []
 
+        # 행마다 commit (실패 행만 rollback) — 응답 변환은 끝에 IN 쿼리로 일괄
         for i, data in enumerate(entries_data):
             try:
-                result = await self.create_entry(db, organization_id, data, created_by)
-                items.append(result)
+                entries.append(await self._create_entry(db, organization_id, data, created_by))
                 created += 1
             except BadRequestError as e:
                 if skip_on_conflict:
@@ -1139,6 +1149,7 @@ class ScheduleService:
                     failed += 1
                     errors.append(f"[{i}] failed: {e.detail}")
 
+        items = await self._list_to_responses(db, entries)
         return ScheduleBulkResult(
             created=created, skipped=skipped, failed=failed,
             errors=errors, items=items,
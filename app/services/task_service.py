@@ -17,6 +17,7 @@ from app.models.user import User
 from app.schemas.task import TaskCreate, TaskPromoteRequest, TaskUpdate
 from app.services.storage_service import storage_service
 from app.utils.exceptions import BadRequestError, NotFoundError, ForbiddenError
+from app.utils.pagination import clamp_page_params
 
 # report.payload 의 linked task id 키 — 신/구 모두 인식 (구버전 데이터 호환).
 LINKED_TASK_KEYS = ("linked_task_id", "linked_issue_id")
@@ -79,6 +80,7 @@ class TaskService:
         page: int = 1,
         per_page: int = 50,
     ) -> tuple[list[Task], int]:
+        page, per_page = clamp_page_params(page, per_page)
         from sqlalchemy import func
         q = (
             select(Task)
@@ -36,7 +36,7 @@ from app.schemas.user import (
     _normalize_employee_no,
 )
 from app.utils.exceptions import BadRequestError, DuplicateError, ForbiddenError, NotFoundError
-from app.utils.password import hash_password, verify_password
+from app.utils.password import hash_password_async, verify_password_async
 
 
 class UserService:
@@ -264,7 +264,7 @@ class UserService:
             if role.priority == caller.role.priority and caller.role.priority != SUPER_OWNER_PRIORITY:
                 raise ForbiddenError("Cannot create a user with a role at your priority")
 
-        password_hash: str = hash_password(data.password)
+        password_hash: str = await hash_password_async(data.password)
 
         # Auto-fill hourly_rate from org default if not provided
         hourly_rate = getattr(data, "hourly_rate", None)
@@ -621,7 +621,7 @@ class UserService:
             raise BadRequestError("Cannot transfer to yourself")
 
         # current_password 검증
-        if not verify_password(current_password, caller.password_hash):
+        if not await verify_password_async(current_password, caller.password_hash):
             raise ForbiddenError("Current password is incorrect")
 
         # target 조회 (같은 조직, 활성, 미삭제)
@@ -0,0 +1,107 @@
+"""Deferred migrations — 무거운 DDL/데이터 작업을 배포 후로 미루는 헬퍼.
+
+대량 데이터가 있는 DB 에서 인덱스 빌드 같은 무거운 단계가 배포 시간을 잡아먹지 않도록,
+SKIP_HEAVY_MIGRATIONS=1 이면 해당 statement 를 실행하지 않고 deferred_migrations 테이블에
+기록만 한다. 배포 후 `python scripts/apply_deferred_migrations.py --apply` 로 순서대로 적용.
+
+migration 에서 사용:
+    from app.utils.deferred_migrations import run_or_defer
+
+    run_or_defer(revision, "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_foo ON foo (bar)")
+
+기록된 statement 는 나중에 autocommit 으로 하나씩 실행되므로 CONCURRENTLY 를 쓰고,
+재실행에 안전하도록(IF NOT EXISTS 등) 작성한다.
+뒤 revision 이 대상 테이블을 drop/변경해 기록이 무의미해지면 discard_deferred() 로 정리한다.
+
+deferred_migrations 는 alembic_version 과 같은 migration 관리용 테이블이라 ORM 모델이 없다
+(alembic/env.py 의 autogenerate 대상에서 제외).
+"""
+
+import logging
+import os
+
+import sqlalchemy as sa
+from alembic import op
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+SKIP_HEAVY_ENV = "SKIP_HEAVY_MIGRATIONS"
+TABLE_NAME = "deferred_migrations"
+
+# 초기 revision 에서도 기록할 수 있도록 필요 시점에 IF NOT EXISTS 로 생성
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS deferred_migrations (
+    revision VARCHAR(32) NOT NULL,
+    seq INTEGER NOT NULL,
+    statement TEXT NOT NULL,
+    status VARCHAR(10) DEFAULT 'pending' NOT NULL,
+    error TEXT,
+    created_at TIMESTAMPTZ DEFAULT now() NOT NULL,
+    applied_at TIMESTAMPTZ,
+    CONSTRAINT deferred_migrations_pkey PRIMARY KEY (revision, seq)
+)
+"""
+
+
+def skip_heavy_migrations() -> bool:
+    """SKIP_HEAVY_MIGRATIONS=1 이면 True — 무거운 단계는 기록만 하고 건너뜀."""
+    return os.environ.get(SKIP_HEAVY_ENV) == "1"
+
+
+def defer(revision: str, statement: str) -> None:
+    """statement 를 실행하지 않고 pending 으로 기록 (같은 revision+statement 는 한 번만)."""
+    conn = op.get_bind()
+    conn.execute(sa.text(CREATE_TABLE_SQL))
+    params = {"revision": revision, "statement": statement}
+    already = conn.execute(
+        sa.text(
+            "SELECT 1 FROM deferred_migrations "
+            "WHERE revision = :revision AND statement = :statement"
+        ),
+        params,
+    ).first()
+    if already is None:
+        conn.execute(
+            sa.text(
+                "INSERT INTO deferred_migrations (revision, seq, statement) "
+                "SELECT CAST(:revision AS VARCHAR), COALESCE(MAX(seq), 0) + 1, :statement "
+                "FROM deferred_migrations WHERE revision = :revision"
+            ),
+            params,
+        )
+    logger.warning("%s=1 — deferred (%s): %s", SKIP_HEAVY_ENV, revision, statement)
+
+
+def run_or_defer(revision: str, statement: str) -> None:
+    """SKIP_HEAVY_MIGRATIONS 면 기록만, 아니면 바로 실행.
+
+    CONCURRENTLY statement 는 트랜잭션 안에서 실행할 수 없으므로 autocommit 블록에서 실행.
+    CONCURRENTLY 는 진행 중인 트랜잭션이 끝나길 기다리는 게 정상 동작이고 쓰기를 막지 않으므로,
+    migration 세션의 lock_timeout (alembic/env.py) 을 잠시 해제했다가 되돌린다.
+    """
+    if skip_heavy_migrations():
+        defer(revision, statement)
+    elif "CONCURRENTLY" in statement.upper():
+        with op.get_context().autocommit_block():
+            lock_timeout = op.get_bind().execute(sa.text("SHOW lock_timeout")).scalar()
+            op.execute("SET lock_timeout = 0")
+            try:
+                op.execute(statement)
+            finally:
+                op.execute(f"SET lock_timeout = '{lock_timeout}'")
+    else:
+        op.execute(statement)
+
+
+def discard_deferred(revision: str) -> None:
+    """revision 의 미적용 기록 삭제 — 뒤 revision 이 대상 객체를 없애 무의미해졌을 때 사용."""
+    conn = op.get_bind()
+    if conn.execute(sa.text("SELECT to_regclass('deferred_migrations')")).scalar() is None:
+        return
+    conn.execute(
+        sa.text(
+            "DELETE FROM deferred_migrations "
+            "WHERE revision = :revision AND status <> 'applied'"
+        ),
+        {"revision": revision},
+    )
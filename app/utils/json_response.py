@@ -0,0 +1,34 @@
+"""직렬화가 끝난 dict 를 바로 JSON 응답으로 보내는 유틸리티.
+
+Build a JSON response straight from plain dict/list data with orjson.
+FastAPI 는 handler 반환값을 response_model 검증 + jsonable_encoder 로 한 번 더 순회한 뒤
+직렬화한다. 목록처럼 이미 응답 모양의 dict 를 만든 경우 Response 를 직접 반환해 그 단계를 건너뛴다
+(response_model 은 OpenAPI 문서용으로 라우트에 그대로 둔다).
+"""
+
+from typing import Any
+
+import orjson
+from fastapi import Response
+
+# UTC datetime 은 pydantic 직렬화와 같이 "Z" 접미사 (기존 응답 포맷 유지)
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def dump_json(content: Any) -> bytes:
+    """dict/list → JSON bytes (UUID/datetime/date 는 orjson 이 직접 처리)."""
+    return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+def json_response(
+    content: Any,
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """content 를 orjson 으로 직렬화한 application/json 응답."""
+    return Response(
+        content=dump_json(content),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
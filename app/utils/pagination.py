@@ -2,16 +2,33 @@
 
 Pagination utility module for SQLAlchemy async queries.
 Provides a generic paginate function and a Page response model
-for consistent pagination across all list endpoints.
+for consistent pagination across all list endpoints,
+plus keyset (cursor) pagination over (created_at, id) for deep/infinite lists.
 """
 
+import base64
+import binascii
+from datetime import datetime
 from typing import Any, Sequence, TypeVar
+from uuid import UUID
+
 from pydantic import BaseModel
-from sqlalchemy import Select, func, select
+from sqlalchemy import Select, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.utils.exceptions import BadRequestError
+
 T = TypeVar("T")
 
+# per_page 상한 — 잘못된/악의적 요청(per_page=100000)이 테이블 전체를 메모리로 읽는 것 방지.
+# 콘솔 캘린더가 스케줄을 per_page=2000 으로 한 번에 받으므로 그 이상으로 둔다.
+MAX_PER_PAGE = 2000
+
+
+def clamp_page_params(page: int, per_page: int) -> tuple[int, int]:
+    """page 는 1 이상, per_page 는 1..MAX_PER_PAGE 로 보정 (음수 OFFSET 500 에러 방지)."""
+    return max(page, 1), min(max(per_page, 1), MAX_PER_PAGE)
+
 
 class Page(BaseModel):
     """페이지네이션 결과 모델.
@@ -56,6 +73,8 @@ async def paginate(
         tuple[Sequence[Any], int]: (항목 목록, 전체 개수) 튜플
             (Tuple of paginated items and total count)
     """
+    page, per_page = clamp_page_params(page, per_page)
+
     # 전체 개수 조회 — 서브쿼리로 감싸서 COUNT 실행 (Count total via subquery)
     count_query = select(func.count()).select_from(query.subquery())
     total: int = (await db.execute(count_query)).scalar() or 0
@@ -66,3 +85,78 @@ async def paginate(
     items: Sequence[Any] = result.scalars().all()
 
     return items, total
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """(created_at, id) 를 불투명한 cursor 문자열로 인코딩합니다.
+
+    Encode a (created_at, id) position as an opaque URL-safe cursor.
+    """
+    raw: str = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """cursor 문자열을 (created_at, id) 로 디코딩합니다.
+
+    Decode a cursor produced by encode_cursor().
+
+    Raises:
+        BadRequestError: 형식이 잘못된 cursor (Malformed cursor)
+    """
+    try:
+        raw: str = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise BadRequestError("Invalid cursor")
+
+
+async def paginate_keyset(
+    db: AsyncSession,
+    query: Select[Any],
+    created_at_column: Any,
+    id_column: Any,
+    cursor: str | None,
+    per_page: int = 20,
+) -> tuple[Sequence[Any], str | None]:
+    """(created_at, id) 내림차순 keyset 페이지네이션을 수행합니다.
+
+    Execute keyset pagination ordered by (created_at DESC, id DESC).
+    Unlike paginate(), no COUNT query runs and the page is found by an index
+    range instead of OFFSET, so cost does not grow with page depth.
+    per_page + 1 rows are fetched to know whether a next page exists.
+
+    Args:
+        db: 비동기 DB 세션 (Async database session)
+        query: ORDER BY 없는 SQLAlchemy Select 쿼리 (Base query without ORDER BY)
+        created_at_column: 정렬 timestamp 컬럼 (e.g. Notice.created_at)
+        id_column: 동률 정렬용 PK 컬럼 (Tie-breaker PK column, e.g. Notice.id)
+        cursor: 이전 응답의 next_cursor, 첫 페이지는 None 또는 ""
+                (next_cursor from the previous page; None or "" for the first page)
+        per_page: 페이지당 항목 수 (Items per page, default: 20)
+
+    Returns:
+        tuple[Sequence[Any], str | None]: (항목 목록, 다음 페이지 cursor — 마지막이면 None)
+            (Page items and the cursor of the next page, None on the last page)
+    """
+    _, per_page = clamp_page_params(1, per_page)
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        # 단일 컬럼 조건을 함께 걸어 (org, created_at) 인덱스 range scan 이 가능하게 함
+        query = query.where(
+            created_at_column <= created_at,
+            tuple_(created_at_column, id_column) < (created_at, row_id),
+        )
+
+    result = await db.execute(
+        query.order_by(created_at_column.desc(), id_column.desc()).limit(per_page + 1)
+    )
+    rows: Sequence[Any] = result.scalars().all()
+    items: Sequence[Any] = rows[:per_page]
+
+    next_cursor: str | None = None
+    if len(rows) > per_page:
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, created_at_column.key), getattr(last, id_column.key))
+    return items, next_cursor
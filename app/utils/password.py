@@ -3,8 +3,13 @@
 Password hashing and verification utility module.
 Uses bcrypt directly for secure password storage.
 Passwords are never stored in plain text — always hashed with bcrypt.
+
+bcrypt 는 의도적으로 느린(수십~수백 ms) CPU 작업이라 async 경로에서는
+*_async 버전으로 스레드에 넘겨 이벤트 루프를 막지 않는다.
 """
 
+import asyncio
+
 import bcrypt
 
 
@@ -44,3 +49,19 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(
         plain_password.encode("utf-8"), hashed_password.encode("utf-8")
     )
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password 를 워커 스레드에서 실행 (이벤트 루프 블로킹 방지).
+
+    Run hash_password in a worker thread so concurrent requests keep being served.
+    """
+    return await asyncio.to_thread(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password 를 워커 스레드에서 실행 (이벤트 루프 블로킹 방지).
+
+    Run verify_password in a worker thread so concurrent logins don't stall the event loop.
+    """
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
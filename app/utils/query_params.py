@@ -0,0 +1,23 @@
+"""공용 쿼리 파라미터 타입.
+
+Shared query parameter types for list endpoints.
+콘솔은 "전체 매장" 같은 필터 해제를 빈 값(?store_id=)으로 보내므로, UUID 필터는
+빈 문자열을 None(필터 없음)으로 받는다 — 기존 `UUID(x) if x else None` 과 같은 동작.
+"""
+
+from typing import Annotated, Any
+from uuid import UUID
+
+from fastapi import Query
+from pydantic import BeforeValidator
+
+
+def _blank_to_none(value: Any) -> Any:
+    """빈/공백 문자열 → None. 그 외 값은 그대로 UUID 검증으로."""
+    if isinstance(value, str) and not value.strip():
+        return None
+    return value
+
+
+# 선택 UUID 쿼리 필터 — 빈 값은 필터 없음, 잘못된 값은 422
+OptionalUUIDQuery = Annotated[UUID | None, BeforeValidator(_blank_to_none), Query()]
@@ -0,0 +1,37 @@
+"""UUIDv7 (RFC 9562) — 시간 순 정렬되는 PK 용 UUID.
+
+UUIDv4 는 완전 랜덤이라 PK btree 의 임의 위치에 삽입되어 page split/캐시 미스가 잦다.
+UUIDv7 은 앞 48bit 가 unix ms 라 새 row 가 항상 인덱스 오른쪽 끝에 붙는다.
+
+- Python: 모델 PK default 로 uuid7() 사용.
+- DB: raw SQL INSERT 용 uuidv7() 함수 (UUIDV7_FUNCTION_SQL, migration 에서 생성).
+  PostgreSQL 18+ 는 같은 이름의 내장 함수가 pg_catalog 에 있어 그쪽이 우선 호출된다.
+"""
+
+import os
+import time
+import uuid
+
+# gen_random_uuid()(v4) 의 앞 6바이트를 unix ms 로 덮고 version nibble 을 4 → 7 로 바꾼다
+# (bytea set_bit 은 바이트 내 LSB 부터 번호: bit 52/53 = 6번째 바이트의 0x10/0x20).
+UUIDV7_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION {schema}.uuidv7() RETURNS uuid AS $$
+    SELECT encode(
+        set_bit(set_bit(
+            overlay(uuid_send(gen_random_uuid())
+                    PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                    FROM 1 FOR 6),
+            52, 1), 53, 1),
+        'hex')::uuid
+$$ LANGUAGE sql VOLATILE
+"""
+
+
+def uuid7() -> uuid.UUID:
+    """UUIDv7 생성 — 48bit unix ms + 12bit ms 이하 분수(같은 ms 내 정렬) + 62bit 랜덤."""
+    ns = time.time_ns()
+    ms, sub_ms_ns = divmod(ns, 1_000_000)
+    sub_ms = sub_ms_ns * 4096 // 1_000_000
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (ms & ((1 << 48) - 1)) << 80 | 0x7 << 76 | sub_ms << 64 | 0b10 << 62 | rand_b
+    return uuid.UUID(int=value)
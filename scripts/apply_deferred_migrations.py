@@ -0,0 +1,82 @@
+"""deferred_migrations 적용 — SKIP_HEAVY_MIGRATIONS=1 로 미뤄 둔 statement 실행.
+
+`alembic upgrade head` 를 SKIP_HEAVY_MIGRATIONS=1 로 돌리면 무거운 인덱스 빌드 등은
+deferred_migrations 테이블에 pending 으로만 기록된다. 배포 후 이 스크립트로 순서대로 적용.
+- 기본 dry-run. 실제 반영은 --apply.
+- statement 하나씩 autocommit 으로 실행(CONCURRENTLY 가능) → applied 로 표시.
+- 실패하면 failed + error 기록 후 중단. 원인 해결 후 재실행하면 failed 부터 다시 시도.
+
+사용:
+    python scripts/apply_deferred_migrations.py            # dry-run (대기 목록)
+    python scripts/apply_deferred_migrations.py --apply    # 반영
+"""
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import settings
+
+
+async def main(apply: bool) -> int:
+    engine = create_async_engine(
+        settings.DATABASE_URL.replace(":6543/", ":5432/"),
+        isolation_level="AUTOCOMMIT",
+        connect_args={"statement_cache_size": 0},
+    )
+    applied = 0
+    failed = 0
+    async with engine.connect() as conn:
+        if (await conn.execute(text("SELECT to_regclass('deferred_migrations')"))).scalar() is None:
+            print("deferred_migrations table not found — nothing to apply.")
+            await engine.dispose()
+            return 0
+        rows = (
+            await conn.execute(
+                text(
+                    "SELECT revision, seq, statement FROM deferred_migrations "
+                    "WHERE status <> 'applied' ORDER BY created_at, revision, seq"
+                )
+            )
+        ).all()
+        for revision, seq, statement in rows:
+            print(f"  [{revision}#{seq}] {statement}")
+            if not apply:
+                continue
+            key = {"revision": revision, "seq": seq}
+            try:
+                await conn.execute(text(statement))
+            except Exception as e:  # noqa: BLE001 — 에러를 기록하고 중단
+                await conn.execute(
+                    text(
+                        "UPDATE deferred_migrations SET status = 'failed', error = :error "
+                        "WHERE revision = :revision AND seq = :seq"
+                    ),
+                    {**key, "error": str(e)},
+                )
+                print(f"    FAILED: {e}")
+                failed += 1
+                break
+            await conn.execute(
+                text(
+                    "UPDATE deferred_migrations SET status = 'applied', error = NULL, "
+                    "applied_at = now() WHERE revision = :revision AND seq = :seq"
+                ),
+                key,
+            )
+            applied += 1
+    await engine.dispose()
+    if apply:
+        print(f"\nAPPLIED: {applied} of {len(rows)} statement(s), {failed} failed.")
+    else:
+        print(f"\nDRY-RUN (nothing executed; pass --apply): {len(rows)} pending statement(s).")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser(description="Apply statements deferred by SKIP_HEAVY_MIGRATIONS=1")
+    p.add_argument("--apply", action="store_true", help="execute pending statements (default: dry-run)")
+    args = p.parse_args()
+    sys.exit(asyncio.run(main(args.apply)))
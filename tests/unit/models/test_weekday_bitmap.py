@@ -0,0 +1,58 @@
+"""Unit tests for app.models.checklist.WeekdayBitmap.
+
+recurrence_days 는 DB 에 smallint 비트맵으로 저장되지만 Python 에서는 list[int] 로 보인다.
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.checklist import WeekdayBitmap
+
+_dialect = postgresql.dialect()
+_type = WeekdayBitmap()
+
+
+def _bind(value):
+    return _type.process_bind_param(value, _dialect)
+
+
+def _result(value):
+    return _type.process_result_value(value, _dialect)
+
+
+class TestBind:
+    def test_none_stays_null(self):
+        assert _bind(None) is None
+
+    def test_empty_list_is_zero(self):
+        assert _bind([]) == 0
+
+    def test_weekdays_set_bits(self):
+        # Mon, Wed, Fri → bit 0, 2, 4
+        assert _bind([0, 2, 4]) == 0b0010101
+
+    def test_all_week_fits_in_seven_bits(self):
+        assert _bind(list(range(7))) == 0b1111111
+
+    def test_order_and_duplicates_ignored(self):
+        assert _bind([6, 1, 1]) == _bind([1, 6])
+
+    @pytest.mark.parametrize("day", [7, 8, 15, -1])
+    def test_out_of_range_day_rejected(self, day):
+        with pytest.raises(ValueError):
+            _bind([1, day])
+
+
+class TestResult:
+    def test_null_is_none(self):
+        assert _result(None) is None
+
+    def test_zero_is_empty_list(self):
+        assert _result(0) == []
+
+    def test_bits_to_sorted_days(self):
+        assert _result(0b1100010) == [1, 5, 6]
+
+    def test_round_trip(self):
+        for days in ([], [0], [3, 4], [0, 1, 2, 3, 4, 5, 6]):
+            assert _result(_bind(days)) == days
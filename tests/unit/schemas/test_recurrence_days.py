@@ -0,0 +1,35 @@
+"""Unit tests — 체크리스트 항목 recurrence_days 요일 범위 검증.
+
+대상: app/schemas/common.py 의 ChecklistItemCreate / ChecklistItemUpdate.
+recurrence_days 는 smallint 비트맵(WeekdayBitmap)으로 저장되므로 0=Mon..6=Sun 만 허용.
+"""
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.common import ChecklistItemCreate, ChecklistItemUpdate
+
+
+class TestChecklistItemCreate:
+    def test_valid_days(self):
+        item = ChecklistItemCreate(title="t", recurrence_type="weekly", recurrence_days=[0, 3, 6])
+        assert item.recurrence_days == [0, 3, 6]
+
+    def test_none_allowed(self):
+        assert ChecklistItemCreate(title="t").recurrence_days is None
+
+    @pytest.mark.parametrize("day", [7, 8, 15, -1])
+    def test_out_of_range_rejected(self, day):
+        with pytest.raises(ValidationError):
+            ChecklistItemCreate(title="t", recurrence_type="weekly", recurrence_days=[1, day])
+
+
+class TestChecklistItemUpdate:
+    def test_valid_days(self):
+        assert ChecklistItemUpdate(recurrence_days=[5]).recurrence_days == [5]
+
+    @pytest.mark.parametrize("day", [7, -1])
+    def test_out_of_range_rejected(self, day):
+        with pytest.raises(ValidationError):
+            ChecklistItemUpdate(recurrence_days=[day])
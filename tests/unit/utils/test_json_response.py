@@ -0,0 +1,47 @@
+"""Unit tests for app.utils.json_response — pydantic 응답과 같은 JSON 포맷."""
+
+import json
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+from pydantic import TypeAdapter
+
+from app.schemas.common import PaginatedResponse
+from app.utils.json_response import dump_json, json_response
+
+
+def _payload() -> dict:
+    return {
+        "items": [
+            {
+                "id": uuid.uuid4(),
+                "work_date": date(2026, 3, 1),
+                "clock_in": datetime(2026, 3, 1, 9, 0, tzinfo=timezone.utc),
+                "clock_out": datetime(2026, 3, 1, 18, 0, 5, 120000, tzinfo=timezone(timedelta(hours=9))),
+                "note": None,
+                "breaks": [],
+            }
+        ],
+        "total": 1,
+        "page": 1,
+        "per_page": 20,
+    }
+
+
+def test_dump_json_matches_pydantic_serialization():
+    payload = _payload()
+    expected = TypeAdapter(PaginatedResponse).dump_json(PaginatedResponse(**payload))
+    assert json.loads(dump_json(payload)) == json.loads(expected)
+
+
+def test_utc_datetime_uses_z_suffix():
+    body = json.loads(dump_json({"at": datetime(2026, 3, 1, 9, 0, tzinfo=timezone.utc)}))
+    assert body["at"] == "2026-03-01T09:00:00Z"
+
+
+def test_json_response_sets_media_type_and_headers():
+    response = json_response({"ok": True}, status_code=201, headers={"ETag": 'W/"x"'})
+    assert response.status_code == 201
+    assert response.media_type == "application/json"
+    assert response.headers["etag"] == 'W/"x"'
+    assert json.loads(response.body) == {"ok": True}
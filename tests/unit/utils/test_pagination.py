@@ -0,0 +1,48 @@
+"""Unit tests for app.utils.pagination — keyset cursor 인코딩."""
+
+import base64
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from app.utils.exceptions import BadRequestError
+from app.utils.pagination import MAX_PER_PAGE, clamp_page_params, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    row_id = uuid.uuid4()
+    assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor(datetime.now(timezone.utc), uuid.uuid4())
+    assert all(c.isalnum() or c in "-_" for c in cursor)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor",
+        "!!!",
+        base64.urlsafe_b64encode(b"2026-03-01|not-a-uuid").decode(),
+    ],
+)
+def test_malformed_cursor_is_bad_request(cursor):
+    with pytest.raises(BadRequestError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize(
+    ("page", "per_page", "expected"),
+    [
+        (1, 20, (1, 20)),
+        (0, 20, (1, 20)),
+        (-3, 0, (1, 1)),
+        (5, MAX_PER_PAGE + 1, (5, MAX_PER_PAGE)),
+        (2, 100_000, (2, MAX_PER_PAGE)),
+    ],
+)
+def test_clamp_page_params(page, per_page, expected):
+    assert clamp_page_params(page, per_page) == expected
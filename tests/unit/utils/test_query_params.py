@@ -0,0 +1,44 @@
+"""Unit tests for app.utils.query_params.OptionalUUIDQuery.
+
+빈 값(?store_id=)은 필터 없음(None), 올바른 UUID 는 파싱, 잘못된 값은 422.
+"""
+
+from uuid import UUID, uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.utils.query_params import OptionalUUIDQuery
+
+_app = FastAPI()
+
+
+@_app.get("/items")
+async def _list_items(store_id: OptionalUUIDQuery = None) -> dict:
+    return {"store_id": str(store_id) if store_id is not None else None}
+
+
+_client = TestClient(_app)
+
+
+def test_missing_is_none():
+    assert _client.get("/items").json() == {"store_id": None}
+
+
+def test_empty_is_none():
+    assert _client.get("/items?store_id=").json() == {"store_id": None}
+
+
+def test_whitespace_is_none():
+    assert _client.get("/items", params={"store_id": "  "}).json() == {"store_id": None}
+
+
+def test_valid_uuid_parsed():
+    value = uuid4()
+    res = _client.get("/items", params={"store_id": str(value)})
+    assert res.status_code == 200
+    assert UUID(res.json()["store_id"]) == value
+
+
+def test_invalid_uuid_rejected():
+    assert _client.get("/items?store_id=not-a-uuid").status_code == 422
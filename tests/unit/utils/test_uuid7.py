@@ -0,0 +1,31 @@
+"""Unit tests for app.utils.uuid7 — 시간 순 UUIDv7."""
+
+import time
+import uuid
+
+from app.utils.uuid7 import uuid7
+
+
+def test_version_and_variant():
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_timestamp_prefix_is_unix_ms():
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+    assert before <= value.int >> 80 <= after
+
+
+def test_sequential_values_sort_in_creation_order():
+    values = []
+    for _ in range(50):
+        values.append(uuid7())
+        time.sleep(0.001)
+    assert values == sorted(values)
+
+
+def test_unique():
+    assert len({uuid7() for _ in range(10_000)}) == 10_000